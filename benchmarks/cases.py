@@ -5,12 +5,15 @@ from referencing import Registry
 from referencing import Resource
 from referencing.jsonschema import DRAFT202012
 
+from openapi_schema_validator import OAS30NormalizedValidator
 from openapi_schema_validator import OAS30Validator
 from openapi_schema_validator import OAS31Validator
 from openapi_schema_validator import OAS32Validator
 from openapi_schema_validator import oas30_format_checker
 from openapi_schema_validator import oas31_format_checker
 from openapi_schema_validator import oas32_format_checker
+from openapi_schema_validator.graph import build_schema_graph
+from openapi_schema_validator.normalize import normalize_oas30_schema
 
 
 @dataclass(frozen=True)
@@ -22,6 +25,56 @@ class BenchmarkCase:
     validator_kwargs: dict[str, Any]
 
 
+def _inheritance_schema(depth: int) -> dict[str, Any]:
+    # each model extends the previous one with allOf
+    defs: dict[str, Any] = {
+        "Model0": {
+            "type": "object",
+            "required": ["field0"],
+            "properties": {"field0": {"type": "string"}},
+        },
+    }
+    for level in range(1, depth + 1):
+        defs[f"Model{level}"] = {
+            "allOf": [
+                {"$ref": f"#/$defs/Model{level - 1}"},
+                {
+                    "type": "object",
+                    "properties": {f"field{level}": {"type": "integer"}},
+                },
+            ],
+        }
+    return {
+        "$defs": defs,
+        "type": "array",
+        "items": {
+            "$ref": f"#/$defs/Model{depth}",
+            "unevaluatedProperties": False,
+        },
+    }
+
+
+def _tree(depth: int, width: int) -> dict[str, Any]:
+    if depth == 0:
+        return {"name": "leaf", "children": []}
+    return {
+        "name": f"node-{depth}",
+        "children": [_tree(depth - 1, width) for _ in range(width)],
+    }
+
+
+def _documented(schema: dict[str, Any], name: str) -> dict[str, Any]:
+    return {
+        **schema,
+        "description": f"The {name} of the pet.",
+        "example": name,
+        "deprecated": False,
+        "readOnly": False,
+        "xml": {"name": name},
+        "externalDocs": {"url": f"https://example.com/docs/{name}"},
+    }
+
+
 def build_cases() -> list[BenchmarkCase]:
     name_schema = Resource.from_contents(
         {
@@ -44,7 +97,7 @@ def build_cases() -> list[BenchmarkCase]:
         ]
     )
 
-    return [
+    cases = [
         BenchmarkCase(
             name="oas32_simple_object",
             validator_class=OAS32Validator,
@@ -150,6 +203,76 @@ def build_cases() -> list[BenchmarkCase]:
             instance={"discipline": "mountain_hiking", "length": 10},
             validator_kwargs={"format_checker": oas30_format_checker},
         ),
+        BenchmarkCase(
+            name="oas30_numeric_array",
+            validator_class=OAS30Validator,
+            schema={
+                "type": "array",
+                "items": {
+                    "type": "number",
+                    "format": "double",
+                    "minimum": 0,
+                    "maximum": 1000,
+                    "multipleOf": 0.5,
+                },
+            },
+            instance=[(index % 2000) / 2 for index in range(10_000)],
+            validator_kwargs={"format_checker": oas30_format_checker},
+        ),
+        BenchmarkCase(
+            name="oas31_simple_patterns",
+            validator_class=OAS31Validator,
+            schema={
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "code": {"type": "string", "pattern": "^[A-Z]{3}$"},
+                        "slug": {"type": "string", "pattern": "^[a-z0-9-]+$"},
+                        "key": {"type": "string", "pattern": "^x-"},
+                    },
+                },
+            },
+            instance=[
+                {"code": "EUR", "slug": f"item-{index}", "key": "x-id"}
+                for index in range(1_000)
+            ],
+            validator_kwargs={},
+        ),
+        BenchmarkCase(
+            name="oas31_deep_allof_unevaluated",
+            validator_class=OAS31Validator,
+            schema=_inheritance_schema(8),
+            instance=[
+                {"field0": f"item-{index}"}
+                | {f"field{level}": level for level in range(1, 9)}
+                for index in range(20)
+            ],
+            validator_kwargs={},
+        ),
+        BenchmarkCase(
+            name="oas31_recursive_refs",
+            validator_class=OAS31Validator,
+            schema={
+                "$defs": {
+                    "Node": {
+                        "type": "object",
+                        "required": ["name"],
+                        "properties": {
+                            "name": {"$ref": "#/$defs/Name"},
+                            "children": {
+                                "type": "array",
+                                "items": {"$ref": "#/$defs/Node"},
+                            },
+                        },
+                    },
+                    "Name": {"type": "string", "minLength": 1},
+                },
+                "$ref": "#/$defs/Node",
+            },
+            instance=_tree(depth=5, width=3),
+            validator_kwargs={},
+        ),
         BenchmarkCase(
             name="oas32_registry_refs",
             validator_class=OAS32Validator,
@@ -168,4 +291,69 @@ def build_cases() -> list[BenchmarkCase]:
                 "registry": registry,
             },
         ),
+        BenchmarkCase(
+            name="oas30_documented",
+            validator_class=OAS30Validator,
+            schema=_documented(
+                {
+                    "type": "array",
+                    "items": _documented(
+                        {
+                            "type": "object",
+                            "properties": {
+                                name: _documented({"type": "string"}, name)
+                                for name in ("name", "species", "color")
+                            },
+                        },
+                        "pet",
+                    ),
+                },
+                "pets",
+            ),
+            instance=[
+                {"name": f"pet-{index}", "species": "cat", "color": "black"}
+                for index in range(100)
+            ],
+            validator_kwargs={},
+        ),
     ]
+    # the same cases validated against schema graphs
+    cases.extend(
+        BenchmarkCase(
+            name=f"{case.name}_graph",
+            validator_class=case.validator_class,
+            schema=build_schema_graph(
+                case.schema,
+                case.validator_class,
+                registry=case.validator_kwargs.get("registry"),
+            ),
+            instance=case.instance,
+            validator_kwargs=case.validator_kwargs,
+        )
+        for case in list(cases)
+        if case.name
+        in (
+            "oas30_discriminator",
+            "oas31_recursive_refs",
+            "oas32_registry_refs",
+        )
+    )
+    # the OpenAPI 3.0 cases validated against normalized schemas
+    cases.extend(
+        BenchmarkCase(
+            name=f"{case.name}_normalized",
+            validator_class=OAS30NormalizedValidator,
+            schema=normalize_oas30_schema(case.schema),
+            instance=case.instance,
+            validator_kwargs=case.validator_kwargs,
+        )
+        for case in list(cases)
+        if case.name
+        in (
+            "oas30_nullable",
+            "oas30_discriminator",
+            "oas30_numeric_array",
+            "oas30_documented",
+        )
+    )
+    return cases
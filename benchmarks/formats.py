@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import platform
+import time
+from datetime import datetime
+from datetime import timezone
+from pathlib import Path
+from typing import Any
+
+from jsonschema import FormatChecker
+
+from openapi_schema_validator._format import oas31_format_checker
+
+# valid and invalid values checked in turn for each format
+FORMAT_VALUES: dict[str, list[str]] = {
+    "date-time": [
+        "2024-02-29T12:30:45.123Z",
+        "2024-12-31T23:59:59+05:30",
+        "2023-02-29T12:30:45Z",
+        "2024-12-31 23:59:59Z",
+    ],
+    "date": ["2024-02-29", "1999-12-31", "2023-02-29", "2024-1-10"],
+    "uuid": [
+        "123e4567-e89b-12d3-a456-426614174000",
+        "550E8400-E29B-41D4-A716-446655440000",
+        "123e4567-e89b-12d3-a456-42661417400g",
+        "123e4567",
+    ],
+    "email": ["user@example.com", "first.last@example.org", "user", ""],
+    "ipv4": ["192.168.0.1", "10.0.0.255", "256.0.0.1", "01.2.3.4"],
+}
+
+
+def _measure_checks_per_second(
+    format_checker: FormatChecker,
+    format: str,
+    iterations: int,
+    warmup: int,
+) -> float:
+    values = FORMAT_VALUES[format]
+    for _ in range(warmup):
+        for value in values:
+            format_checker.conforms(value, format)
+
+    start_ns = time.perf_counter_ns()
+    for _ in range(iterations):
+        for value in values:
+            format_checker.conforms(value, format)
+    elapsed = (time.perf_counter_ns() - start_ns) / 1_000_000_000
+    return iterations * len(values) / elapsed
+
+
+def _measure_format(
+    format: str,
+    iterations: int,
+    warmup: int,
+) -> dict[str, Any]:
+    gc_enabled = gc.isenabled()
+    gc.disable()
+
+    try:
+        generic = _measure_checks_per_second(
+            FormatChecker(),
+            format,
+            iterations,
+            warmup,
+        )
+        oas = _measure_checks_per_second(
+            oas31_format_checker,
+            format,
+            iterations,
+            warmup,
+        )
+        return {
+            "name": format,
+            "generic_checks_per_second": generic,
+            "oas_checks_per_second": oas,
+            "speedup": oas / generic,
+        }
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+
+def _build_report(iterations: int, warmup: int) -> dict[str, Any]:
+    generic_formats = FormatChecker().checkers
+    results = [
+        _measure_format(format, iterations=iterations, warmup=warmup)
+        for format in FORMAT_VALUES
+        if format in generic_formats
+    ]
+    return {
+        "timestamp_utc": datetime.now(timezone.utc).isoformat(),
+        "python_version": platform.python_version(),
+        "platform": platform.platform(),
+        "benchmark_parameters": {
+            "iterations": iterations,
+            "warmup": warmup,
+        },
+        "formats": results,
+    }
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Compare the OAS 3.1 string format checkers with the generic "
+            "jsonschema ones."
+        ),
+    )
+    parser.add_argument(
+        "--iterations",
+        type=int,
+        default=20000,
+        help="Measured iterations over the values of each format.",
+    )
+    parser.add_argument(
+        "--warmup",
+        type=int,
+        default=1000,
+        help="Warmup iterations per format.",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=Path("reports/benchmarks/formats.json"),
+        help="Path to write JSON benchmark report.",
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = _parse_args()
+    report = _build_report(iterations=args.iterations, warmup=args.warmup)
+
+    for result in report["formats"]:
+        print(
+            f"{result['name']}: {result['oas_checks_per_second']:,.0f}/s "
+            f"({result['speedup']:.2f}x generic)"
+        )
+
+    output_path = args.output
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+    print(f"Saved benchmark report to {output_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
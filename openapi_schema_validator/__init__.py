@@ -5,6 +5,7 @@ from openapi_schema_validator._format import oas30_strict_format_checker
 from openapi_schema_validator._format import oas31_format_checker
 from openapi_schema_validator._format import oas32_format_checker
 from openapi_schema_validator.shortcuts import validate
+from openapi_schema_validator.validators import OAS30NormalizedValidator
 from openapi_schema_validator.validators import OAS30ReadValidator
 from openapi_schema_validator.validators import OAS30StrictValidator
 from openapi_schema_validator.validators import OAS30Validator
@@ -24,6 +25,7 @@ __all__ = [
     "OAS30StrictValidator",
     "OAS30WriteValidator",
     "OAS30Validator",
+    "OAS30NormalizedValidator",
     "oas30_format_checker",
     "oas30_strict_format_checker",
     "OAS31Validator",
@@ -0,0 +1,427 @@
+"""Evaluated properties and items for ``unevaluated*`` keywords.
+
+``jsonschema`` finds the properties and items a schema evaluated by walking
+its in-place applicators (``$ref``, ``allOf``, ``anyOf``, ``oneOf``, ``if``
+and ``dependentSchemas``) and validating each branch again from scratch at
+every level, which is quadratic in the depth of ``allOf`` inheritance
+chains. Here, branch validity is composed from the results of the nested
+applicators and remembered for each (subschema, instance) pair, so each
+subschema is evaluated once per instance location.
+"""
+
+from __future__ import annotations
+
+from contextvars import ContextVar
+from typing import Any
+from typing import Iterable
+from typing import Iterator
+from typing import Mapping
+
+from jsonschema import _keywords
+from jsonschema._utils import find_evaluated_item_indexes_by_schema
+from jsonschema._utils import find_evaluated_property_keys_by_schema
+from jsonschema.exceptions import ValidationError
+from referencing.exceptions import Unresolvable
+
+from openapi_schema_validator._references import resolve
+from openapi_schema_validator._regex import search_property
+
+# in-place applicators, whose annotations apply to the same instance
+_IN_PLACE = {
+    "$ref": _keywords.ref,
+    "allOf": _keywords.allOf,
+    "anyOf": _keywords.anyOf,
+    "oneOf": _keywords.oneOf,
+    "if": _keywords.if_,
+    "dependentSchemas": _keywords.dependentSchemas,
+}
+
+_ANNOTATOR: ContextVar[_Annotator | None] = ContextVar(
+    "openapi_schema_validator_annotator", default=None
+)
+
+
+class _Unsupported(Exception):
+    """The schema needs the generic ``jsonschema`` implementation."""
+
+
+class _Annotations:
+    __slots__ = ("keys", "indexes")
+
+    def __init__(self) -> None:
+        self.keys: set[Any] = set()
+        self.indexes: set[int] = set()
+
+    def update(self, other: _Annotations) -> None:
+        self.keys |= other.keys
+        self.indexes |= other.indexes
+
+
+class _Annotator:
+    def __init__(self) -> None:
+        # results are stored with their schema and instance, which keeps
+        # the objects alive so that their ids are not reused
+        self._valid: dict[tuple[int, int], tuple[Any, Any, bool]] = {}
+        self._annotations: dict[
+            tuple[int, int], tuple[Any, Any, _Annotations]
+        ] = {}
+        # per schema object
+        self._targets: dict[int, tuple[Any, Any, Any]] = {}
+        self._supported: dict[int, Any] = {}
+
+    def record(
+        self,
+        instance: Any,
+        schema: Any,
+        errors: Iterable[ValidationError],
+    ) -> Iterator[ValidationError]:
+        """Remember whether ``errors`` of a main pass evaluation is empty.
+
+        Nothing is remembered if the errors are not consumed to the end.
+        """
+        valid = True
+        for error in errors:
+            valid = False
+            yield error
+        self._valid[id(schema), id(instance)] = (schema, instance, valid)
+
+    def is_valid(self, validator: Any, instance: Any, schema: Any) -> bool:
+        key = (id(schema), id(instance))
+        result = self._valid.get(key)
+        if result is None:
+            valid = self._is_valid(validator, instance, schema)
+            result = self._valid[key] = (schema, instance, valid)
+        return result[2]
+
+    def annotations(
+        self,
+        validator: Any,
+        instance: Any,
+        schema: Any,
+    ) -> _Annotations:
+        key = (id(schema), id(instance))
+        result = self._annotations.get(key)
+        if result is None:
+            annotations = self._annotate(validator, instance, schema)
+            result = self._annotations[key] = (schema, instance, annotations)
+        return result[2]
+
+    def _is_valid(self, validator: Any, instance: Any, schema: Any) -> bool:
+        if schema is True:
+            return True
+        if schema is False:
+            return False
+        self._check_supported(validator, schema)
+
+        for keyword, value in schema.items():
+            implementation = validator.VALIDATORS.get(keyword)
+            if implementation is None:
+                continue
+            if implementation is _keywords.ref:
+                target_validator, target = self._lookup(validator, schema)
+                if not self.is_valid(target_validator, instance, target):
+                    return False
+            elif implementation is _keywords.allOf:
+                if not all(
+                    self._is_valid_branch(validator, instance, subschema)
+                    for subschema in value
+                ):
+                    return False
+            elif implementation is _keywords.anyOf:
+                if not any(
+                    self._is_valid_branch(validator, instance, subschema)
+                    for subschema in value
+                ):
+                    return False
+            elif implementation is _keywords.oneOf:
+                valid = (
+                    subschema
+                    for subschema in value
+                    if self._is_valid_branch(validator, instance, subschema)
+                )
+                if next(valid, None) is None or next(valid, None) is not None:
+                    return False
+            elif implementation is _keywords.if_:
+                if self._is_valid_branch(validator, instance, value):
+                    branch = schema.get("then", True)
+                else:
+                    branch = schema.get("else", True)
+                if not self._is_valid_branch(validator, instance, branch):
+                    return False
+            elif implementation is _keywords.dependentSchemas:
+                if validator.is_type(instance, "object") and not all(
+                    self._is_valid_branch(validator, instance, subschema)
+                    for property, subschema in value.items()
+                    if property in instance
+                ):
+                    return False
+            else:
+                errors = implementation(validator, value, instance, schema)
+                if next(iter(errors or ()), None) is not None:
+                    return False
+        return True
+
+    def _annotate(
+        self,
+        validator: Any,
+        instance: Any,
+        schema: Any,
+    ) -> _Annotations:
+        annotations = _Annotations()
+        if not isinstance(schema, Mapping):
+            return annotations
+        self._check_supported(validator, schema)
+        is_object = isinstance(instance, dict)
+        is_array = isinstance(instance, list)
+
+        if "$ref" in schema:
+            target_validator, target = self._lookup(validator, schema)
+            annotations.update(
+                self.annotations(target_validator, instance, target)
+            )
+
+        if is_object:
+            keys = annotations.keys
+            properties = schema.get("properties")
+            if isinstance(properties, Mapping):
+                keys.update(properties.keys() & instance.keys())
+            for pattern in schema.get("patternProperties", ()):
+                keys.update(
+                    key for key in instance if search_property(pattern, key)
+                )
+            for keyword in ("additionalProperties", "unevaluatedProperties"):
+                subschema = schema.get(keyword)
+                if subschema is None:
+                    continue
+                keys.update(
+                    key
+                    for key, value in instance.items()
+                    if key not in keys
+                    and self._is_valid_branch(validator, value, subschema)
+                )
+            for property, subschema in schema.get(
+                "dependentSchemas", {}
+            ).items():
+                if property in instance:
+                    annotations.update(
+                        self._annotate_branch(validator, instance, subschema)
+                    )
+
+        if is_array:
+            indexes = annotations.indexes
+            if "items" in schema:
+                indexes.update(range(len(instance)))
+            indexes.update(range(len(schema.get("prefixItems", ()))))
+            for keyword in ("contains", "unevaluatedItems"):
+                subschema = schema.get(keyword)
+                if subschema is None:
+                    continue
+                indexes.update(
+                    index
+                    for index, item in enumerate(instance)
+                    if self._is_valid_branch(validator, item, subschema)
+                )
+
+        if is_object or is_array:
+            for keyword in ("allOf", "oneOf", "anyOf"):
+                for subschema in schema.get(keyword, ()):
+                    if self._is_valid_branch(validator, instance, subschema):
+                        annotations.update(
+                            self._annotate_branch(
+                                validator, instance, subschema
+                            )
+                        )
+            if "if" in schema:
+                if self._is_valid_branch(validator, instance, schema["if"]):
+                    branches = [schema["if"], schema.get("then")]
+                else:
+                    branches = [schema.get("else")]
+                for branch in branches:
+                    if branch is not None:
+                        annotations.update(
+                            self._annotate_branch(validator, instance, branch)
+                        )
+        return annotations
+
+    def _is_valid_branch(
+        self,
+        validator: Any,
+        instance: Any,
+        schema: Any,
+    ) -> bool:
+        return self.is_valid(self._evolve(validator, schema), instance, schema)
+
+    def _annotate_branch(
+        self,
+        validator: Any,
+        instance: Any,
+        schema: Any,
+    ) -> _Annotations:
+        return self.annotations(
+            self._evolve(validator, schema), instance, schema
+        )
+
+    def _evolve(self, validator: Any, schema: Any) -> Any:
+        # keyword implementations only depend on the validator class, its
+        # configuration and resolver, so the class switch by $schema is the
+        # only change the subschema needs
+        if isinstance(schema, Mapping) and "$schema" in schema:
+            return validator.evolve(schema=schema)
+        return validator
+
+    def _lookup(self, validator: Any, schema: Any) -> tuple[Any, Any]:
+        result = self._targets.get(id(schema))
+        if result is None:
+            try:
+                target, resolver = resolve(validator._resolver, schema["$ref"])
+            except Unresolvable:
+                raise _Unsupported
+            target_validator = validator.evolve(
+                schema=target,
+                _resolver=resolver,
+            )
+            result = self._targets[id(schema)] = (
+                schema,
+                target_validator,
+                target,
+            )
+        return result[1], result[2]
+
+    def _check_supported(
+        self, validator: Any, schema: Mapping[str, Any]
+    ) -> None:
+        if id(schema) in self._supported:
+            return
+        if validator._ref_resolver is not None:
+            raise _Unsupported
+        if "$dynamicRef" in schema or validator.ID_OF(schema):
+            # dynamic scopes and embedded resources change how references
+            # resolve for the same schema object
+            raise _Unsupported
+        for keyword, implementation in _IN_PLACE.items():
+            if (
+                keyword in schema
+                and validator.VALIDATORS.get(keyword, implementation)
+                is not implementation
+            ):
+                raise _Unsupported
+        self._supported[id(schema)] = schema
+
+
+def _has_unevaluated(schema: Any) -> bool:
+    return type(schema) is dict and (
+        "unevaluatedProperties" in schema or "unevaluatedItems" in schema
+    )
+
+
+def _within(
+    annotator: _Annotator,
+    errors: Iterable[ValidationError],
+) -> Iterator[ValidationError]:
+    # the annotator is only current while the errors are computed, so that
+    # it does not leak to code running between two errors
+    iterator = iter(errors)
+    while True:
+        token = _ANNOTATOR.set(annotator)
+        try:
+            error = next(iterator, None)
+        finally:
+            _ANNOTATOR.reset(token)
+        if error is None:
+            return
+        yield error
+
+
+def track_annotations(validator_class: Any) -> None:
+    """Collect subschema results for ``unevaluated*`` during validation.
+
+    While a schema with ``unevaluatedProperties`` or ``unevaluatedItems``
+    is evaluated, ``validator_class`` remembers which in-place subschemas
+    the instance is valid under, so that the keywords do not validate them
+    again.
+    """
+    iter_errors = validator_class.iter_errors
+    descend = validator_class.descend
+
+    def tracking_iter_errors(
+        self: Any,
+        instance: Any,
+        _schema: Any = None,
+    ) -> Iterator[ValidationError]:
+        errors: Iterator[ValidationError]
+        if _schema is not None:
+            errors = iter_errors(self, instance, _schema)
+            return errors
+        annotator = _ANNOTATOR.get()
+        errors = iter_errors(self, instance)
+        if annotator is not None:
+            return annotator.record(instance, self.schema, errors)
+        if _has_unevaluated(self.schema):
+            return _within(_Annotator(), errors)
+        return errors
+
+    def tracking_descend(
+        self: Any,
+        instance: Any,
+        schema: Any,
+        path: Any = None,
+        schema_path: Any = None,
+        resolver: Any = None,
+    ) -> Iterator[ValidationError]:
+        annotator = _ANNOTATOR.get()
+        errors: Iterator[ValidationError] = descend(
+            self, instance, schema, path, schema_path, resolver
+        )
+        if annotator is not None:
+            if path is None and resolver is None:
+                # in-place applicator
+                return annotator.record(instance, schema, errors)
+            return errors
+        if _has_unevaluated(schema):
+            return _within(_Annotator(), errors)
+        return errors
+
+    validator_class.iter_errors = tracking_iter_errors
+    validator_class.descend = tracking_descend
+
+
+def _run(validator: Any, instance: Any, schema: Any) -> _Annotations | None:
+    annotator = _ANNOTATOR.get()
+    token = None
+    if annotator is None:
+        annotator = _Annotator()
+        # nested unevaluated* keywords reuse the results
+        token = _ANNOTATOR.set(annotator)
+    try:
+        return annotator.annotations(validator, instance, schema)
+    except _Unsupported:
+        return None
+    finally:
+        if token is not None:
+            _ANNOTATOR.reset(token)
+
+
+def evaluated_property_keys(
+    validator: Any,
+    instance: Any,
+    schema: Any,
+) -> set[Any]:
+    annotations = _run(validator, instance, schema)
+    if annotations is None:
+        return set(
+            find_evaluated_property_keys_by_schema(validator, instance, schema)
+        )
+    return annotations.keys
+
+
+def evaluated_item_indexes(
+    validator: Any,
+    instance: Any,
+    schema: Any,
+) -> set[int]:
+    annotations = _run(validator, instance, schema)
+    if annotations is None:
+        return set(
+            find_evaluated_item_indexes_by_schema(validator, instance, schema)
+        )
+    return annotations.indexes
@@ -0,0 +1,110 @@
+import json
+from dataclasses import dataclass
+from os import PathLike
+from typing import Any
+
+from jsonschema.protocols import Validator
+
+from openapi_schema_validator import validators as oas_validators
+
+ARTEFACT_FORMAT_VERSION = 2
+
+# Artefacts are JSON documents and refer to the validator classes, which
+# are generated by jsonschema, by their public names.
+_VALIDATOR_NAMES = (
+    "OAS30Validator",
+    "OAS30StrictValidator",
+    "OAS30ReadValidator",
+    "OAS30WriteValidator",
+    "OAS31Validator",
+    "OAS32Validator",
+    "OAS30NormalizedValidator",
+)
+
+
+class ArtefactError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class ArtefactEntry:
+    validator_name: str
+    schema: dict[str, Any]
+
+    @property
+    def validator_class(self) -> type[Validator]:
+        cls: type[Validator] = getattr(oas_validators, self.validator_name)
+        return cls
+
+
+def validator_name(cls: type[Validator]) -> str:
+    for name in _VALIDATOR_NAMES:
+        if getattr(oas_validators, name) is cls:
+            return name
+    raise ArtefactError(f"{cls!r} is not an OpenAPI validator class")
+
+
+def _package_version() -> str:
+    # imported lazily, the package root imports this module indirectly
+    from openapi_schema_validator import __version__
+
+    return __version__
+
+
+def dump_artefact(
+    path: str | PathLike[str],
+    entries: list[ArtefactEntry],
+) -> None:
+    payload = {
+        "format": ARTEFACT_FORMAT_VERSION,
+        "package_version": _package_version(),
+        "entries": [[entry.validator_name, entry.schema] for entry in entries],
+    }
+    try:
+        # encoded before opening, so no partial artefact is left behind
+        data = json.dumps(payload, allow_nan=False)
+    except (TypeError, ValueError) as exc:
+        raise ArtefactError(f"Schemas are not JSON documents: {exc}") from exc
+    with open(path, "w", encoding="utf-8") as stream:
+        stream.write(data)
+
+
+def load_artefact(path: str | PathLike[str]) -> list[ArtefactEntry]:
+    package_version = _package_version()
+    with open(path, "rb") as stream:
+        try:
+            payload = json.load(stream)
+        except ValueError as exc:
+            raise ArtefactError(
+                f"{path!s} is not a validator artefact"
+            ) from exc
+
+    if not isinstance(payload, dict) or "format" not in payload:
+        raise ArtefactError(f"{path!s} is not a validator artefact")
+    if payload["format"] != ARTEFACT_FORMAT_VERSION:
+        raise ArtefactError(
+            f"Unsupported artefact format {payload['format']!r}, "
+            f"expected {ARTEFACT_FORMAT_VERSION!r}"
+        )
+    if payload.get("package_version") != package_version:
+        raise ArtefactError(
+            f"Artefact was built with openapi-schema-validator "
+            f"{payload.get('package_version')!r}, "
+            f"running {package_version!r}"
+        )
+
+    entries = payload.get("entries")
+    if not isinstance(entries, list):
+        raise ArtefactError(f"{path!s} has no list of entries")
+    return [_load_entry(path, entry) for entry in entries]
+
+
+def _load_entry(path: str | PathLike[str], entry: Any) -> ArtefactEntry:
+    if not isinstance(entry, list) or len(entry) != 2:
+        raise ArtefactError(f"{path!s} has a malformed entry {entry!r}")
+    name, schema = entry
+    if not isinstance(name, str) or name not in _VALIDATOR_NAMES:
+        raise ArtefactError(f"Unknown validator class {name!r}")
+    if not isinstance(schema, dict):
+        raise ArtefactError(f"{path!s} has a malformed schema {schema!r}")
+    return ArtefactEntry(validator_name=name, schema=schema)
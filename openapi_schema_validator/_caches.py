@@ -1,10 +1,15 @@
+import marshal
 from collections import OrderedDict
+from collections import deque
 from dataclasses import dataclass
+from hashlib import blake2b
 from threading import RLock
+from time import monotonic
 from typing import Any
 from typing import Hashable
 from typing import Mapping
 
+from jsonschema.exceptions import ValidationError
 from jsonschema.protocols import Validator
 
 from openapi_schema_validator.settings import get_settings
@@ -16,10 +21,30 @@ class CachedValidator:
     schema_checked: bool
 
 
+@dataclass(frozen=True)
+class CacheStats:
+    hits: int
+    misses: int
+    size: int
+    max_size: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
 class ValidatorCache:
     def __init__(self) -> None:
         self._cache: OrderedDict[Hashable, CachedValidator] = OrderedDict()
         self._lock = RLock()
+        self._frozen = False
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def frozen(self) -> bool:
+        return self._frozen
 
     def _freeze_value(self, value: Any) -> Hashable:
         if isinstance(value, dict):
@@ -65,7 +90,12 @@ class ValidatorCache:
 
     def get(self, key: Hashable) -> CachedValidator | None:
         with self._lock:
-            return self._cache.get(key)
+            cached = self._cache.get(key)
+            if cached is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+            return cached
 
     def set(
         self,
@@ -90,18 +120,239 @@ class ValidatorCache:
             if cached is None:
                 return
             cached.schema_checked = True
-            self._cache.move_to_end(key)
+            if not self._frozen:
+                self._cache.move_to_end(key)
 
     def touch(self, key: Hashable) -> None:
+        # In read-mostly mode hits must not reorder the LRU links, so that
+        # entries inherited from a pre-fork parent are left untouched.
+        if self._frozen:
+            return
         with self._lock:
             if key in self._cache:
                 self._cache.move_to_end(key)
 
+    def freeze(self) -> None:
+        """Switch the cache to read-mostly mode.
+
+        Cache hits no longer reorder entries; new entries are still added
+        and the oldest ones are evicted first.
+        """
+        with self._lock:
+            self._frozen = True
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                size=len(self._cache),
+                max_size=get_settings().compiled_validator_cache_max_size,
+            )
+
     def clear(self) -> None:
         with self._lock:
             self._cache.clear()
+            self._frozen = False
+            self._hits = 0
+            self._misses = 0
 
     def _prune_if_needed(self) -> None:
         max_size = get_settings().compiled_validator_cache_max_size
         while len(self._cache) > max_size:
             self._cache.popitem(last=False)
+
+
+_UNKEYED: Any = object()
+
+
+def instance_digest(value: Any) -> bytes | None:
+    """Return a fixed-size content digest of a JSON-like instance.
+
+    Scalars are tagged with their type, so that e.g. ``1``, ``1.0`` and
+    ``True`` get distinct digests. Returns ``None`` for instances containing
+    values that cannot be keyed by content.
+    """
+    frozen = _freeze_instance(value)
+    if frozen is _UNKEYED:
+        return None
+    # version 2 writes no back-references, so equal contents encode alike
+    return blake2b(marshal.dumps(frozen, 2), digest_size=32).digest()
+
+
+def _freeze_instance(value: Any) -> Any:
+    # marshal keeps the types of scalars and tuples apart; containers are
+    # tagged, since lists, tuples and dicts are all encoded as tuples
+    value_type = type(value)
+    if value_type is dict:
+        items = []
+        for key, item in value.items():
+            frozen_item = _freeze_instance(item)
+            if frozen_item is _UNKEYED or type(key) is not str:
+                return _UNKEYED
+            items.append((key, frozen_item))
+        items.sort()
+        return ("d", tuple(items))
+    if value_type is list or value_type is tuple:
+        frozen_items = []
+        for item in value:
+            frozen_item = _freeze_instance(item)
+            if frozen_item is _UNKEYED:
+                return _UNKEYED
+            frozen_items.append(frozen_item)
+        return ("l" if value_type is list else "t", tuple(frozen_items))
+    if value_type in (str, bytes, int, float, bool, type(None)):
+        return value
+    return _UNKEYED
+
+
+class ResultCache:
+    """Bounded LRU memo of validation verdicts.
+
+    Maps keys to ``None`` for valid instances or to the error raised for
+    invalid ones, stored without the instance and raised through
+    ``copy_error`` bound to the instance of the caller. Sized by
+    ``validation_result_cache_max_size``; a size of ``0`` disables the cache.
+    """
+
+    MISSING: Any = object()
+
+    def __init__(self) -> None:
+        self._cache: OrderedDict[Hashable, tuple[Any, float | None]] = (
+            OrderedDict()
+        )
+        self._lock = RLock()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return get_settings().validation_result_cache_max_size > 0
+
+    def get(self, key: Hashable) -> Any:
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None:
+                verdict, expires_at = entry
+                if expires_at is None or monotonic() < expires_at:
+                    self._hits += 1
+                    self._cache.move_to_end(key)
+                    return verdict
+                del self._cache[key]
+            self._misses += 1
+            return self.MISSING
+
+    def set(self, key: Hashable, verdict: Any) -> None:
+        settings = get_settings()
+        ttl = settings.validation_result_cache_ttl
+        expires_at = None if ttl is None else monotonic() + ttl
+        with self._lock:
+            self._cache[key] = (verdict, expires_at)
+            self._cache.move_to_end(key)
+            while len(self._cache) > settings.validation_result_cache_max_size:
+                self._cache.popitem(last=False)
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                size=len(self._cache),
+                max_size=get_settings().validation_result_cache_max_size,
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+            self._hits = 0
+            self._misses = 0
+
+
+_KEEP: Any = object()
+
+
+def copy_error(
+    error: ValidationError, instance: Any = _KEEP
+) -> ValidationError:
+    """Return a copy of ``error`` with its own paths, context and traceback.
+
+    Cached errors are raised as copies, so that neither raising them nor
+    callers changing them alters the cached verdict. Given the ``instance``
+    at the location of ``error``, the copy and its context refer to the
+    values of ``instance`` at their paths, or to ``None`` where there is
+    none.
+    """
+    cls = type(error)
+    copied = cls.__new__(cls, *error.args)
+    copied.__dict__.update(error.__dict__)
+    copied.__cause__ = error.__cause__
+    copied.path = copied.relative_path = deque(error.relative_path)
+    copied.schema_path = copied.relative_schema_path = deque(
+        error.relative_schema_path
+    )
+    if instance is not _KEEP:
+        copied.instance = _value_at(instance, error.relative_path)
+        instance = copied.instance
+    copied.context = [copy_error(child, instance) for child in error.context]
+    for child in copied.context:
+        child.parent = copied
+    return copied
+
+
+def _value_at(instance: Any, path: deque[Any]) -> Any:
+    for token in path:
+        try:
+            instance = instance[token]
+        except (LookupError, TypeError):
+            return None
+    return instance
+
+
+class FormatCheckCache:
+    """Bounded LRU memo of format check outcomes.
+
+    Maps ``(format, value)`` keys to ``PASSED``, or to the cause of a failed
+    check (``None`` if it had none).
+    """
+
+    MISSING: Any = object()
+    PASSED: Any = object()
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self._cache: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = RLock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: Hashable) -> Any:
+        with self._lock:
+            outcome = self._cache.get(key, self.MISSING)
+            if outcome is self.MISSING:
+                self._misses += 1
+            else:
+                self._hits += 1
+                self._cache.move_to_end(key)
+            return outcome
+
+    def set(self, key: Hashable, outcome: Any) -> None:
+        with self._lock:
+            self._cache[key] = outcome
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_size:
+                self._cache.popitem(last=False)
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                size=len(self._cache),
+                max_size=self.max_size,
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+            self._hits = 0
+            self._misses = 0
@@ -0,0 +1,291 @@
+"""Keyword dispatch plans.
+
+Each time jsonschema descends into a subschema, it looks every keyword up
+in ``VALIDATORS`` twice and calls the no-op implementation of the fixed
+OpenAPI fields that only annotate, such as ``example`` or ``xml``, which
+creates a generator per keyword. A plan lists the keywords of a subschema
+that assert something, with their implementations, and is computed once
+per subschema for each registry. The ``type`` keyword is specialized to
+its value on the way, and the OpenAPI 3.0 one to the ``nullable`` and
+``format`` next to it, so that most instances pass it with a single set
+lookup.
+
+``is_valid`` only needs to know whether there is an error, so while it
+runs the keywords of each subschema are evaluated cheapest first, and a
+failing ``type`` check spares evaluating a ``pattern`` or a ``$ref`` next to
+it. Keywords are evaluated by their boolean variants where available, and
+subschemas stop at their first error, without setting its details or
+paths. Error reporting keeps the schema order.
+"""
+
+from __future__ import annotations
+
+import weakref
+from contextvars import ContextVar
+from typing import Any
+from typing import Iterator
+
+import referencing
+import referencing.jsonschema
+from jsonschema import _keywords
+from jsonschema.exceptions import ValidationError
+
+from openapi_schema_validator import _keywords as oas_keywords
+from openapi_schema_validator import _predicates
+from openapi_schema_validator.budgets import _DEADLINE
+from openapi_schema_validator.budgets import check_deadline
+
+# relative cost of evaluating a keyword, the default being a descent into
+# subschemas of the instance's members
+_DEFAULT_COST = 2
+_COSTS = {
+    "type": 0,
+    "const": 1,
+    "dependentRequired": 1,
+    "enum": 1,
+    "exclusiveMaximum": 1,
+    "exclusiveMinimum": 1,
+    "maxItems": 1,
+    "maxLength": 1,
+    "maxProperties": 1,
+    "maximum": 1,
+    "minItems": 1,
+    "minLength": 1,
+    "minProperties": 1,
+    "minimum": 1,
+    "multipleOf": 1,
+    "required": 1,
+    "format": 3,
+    "pattern": 3,
+    "patternProperties": 3,
+    "$dynamicRef": 4,
+    "$ref": 4,
+    "anyOf": 4,
+    "oneOf": 4,
+    "uniqueItems": 4,
+    # need the annotations of all other keywords
+    "unevaluatedItems": 5,
+    "unevaluatedProperties": 5,
+}
+
+# keyword implementations specialized to a subschema when it is planned
+_COMPILERS = {
+    _keywords.type: oas_keywords.compile_json_type,
+    oas_keywords.type: oas_keywords.compile_type,
+    oas_keywords.strict_type: oas_keywords.compile_strict_type,
+}
+
+_FAIL_FAST: ContextVar[bool] = ContextVar(
+    "openapi_schema_validator_fail_fast", default=False
+)
+
+
+class Plan(list[tuple[Any, str, Any]]):
+    """Keyword entries of a subschema, in schema order.
+
+    ``ordered`` has the entries evaluated by ``is_valid``: the same
+    keywords, cheapest first, with their boolean implementations.
+    """
+
+    __slots__ = ("ordered",)
+
+    ordered: list[tuple[Any, str, Any]]
+
+
+# registry id -> schema id -> (schema, VALIDATORS, plan); keeping the
+# schema keeps its id from being reused by another one
+_PLANS: dict[int, dict[int, tuple[Any, Any, Plan]]] = {}
+
+
+def _plans_for(registry: Any) -> dict[int, tuple[Any, Any, Plan]]:
+    plans = _PLANS.get(id(registry))
+    if plans is None:
+        plans = _PLANS[id(registry)] = {}
+        weakref.finalize(registry, _PLANS.pop, id(registry), None)
+    return plans
+
+
+def keyword_plan(validator: Any) -> Plan:
+    """Return the asserting keywords of ``validator.schema``.
+
+    The plan has the ``(implementation, keyword, value)`` entries of
+    ``validator._validators``, without keywords that are not implemented
+    and with compiled implementations where available.
+    """
+    schema = validator.schema
+    validators = validator.VALIDATORS
+    plans = _plans_for(validator._resolver._registry)
+    entry = plans.get(id(schema))
+    if entry is not None and entry[1] is validators:
+        return entry[2]
+    plan = Plan()
+    predicates = []
+    for keyword, value in validator._APPLICABLE_VALIDATORS(schema):
+        implementation = validators.get(keyword, oas_keywords.not_implemented)
+        if implementation is oas_keywords.not_implemented:
+            continue
+        predicates.append(
+            (
+                _predicates.predicate(
+                    validator, implementation, value, schema
+                ),
+                keyword,
+                value,
+            )
+        )
+        compile_keyword = _COMPILERS.get(implementation)
+        if compile_keyword is not None:
+            implementation = compile_keyword(validator, value, schema)
+        plan.append((implementation, keyword, value))
+    plan.ordered = sorted(
+        predicates, key=lambda entry: _COSTS.get(entry[1], _DEFAULT_COST)
+    )
+    plans[id(schema)] = (schema, validators, plan)
+    return plan
+
+
+def _errors(
+    validator: Any,
+    plan: list[tuple[Any, str, Any]],
+    instance: Any,
+    schema: Any,
+    path: Any = None,
+    schema_path: Any = None,
+) -> Iterator[ValidationError]:
+    for implementation, keyword, value in plan:
+        errors = implementation(validator, value, instance, schema) or ()
+        for error in errors:
+            # set details if not already set by the called fn
+            error._set(
+                validator=keyword,
+                validator_value=value,
+                instance=instance,
+                schema=schema,
+                type_checker=validator.TYPE_CHECKER,
+            )
+            if keyword not in {"if", "$ref"}:
+                error.schema_path.appendleft(keyword)
+            if path is not None:
+                error.path.appendleft(path)
+            if schema_path is not None:
+                error.schema_path.appendleft(schema_path)
+            yield error
+
+
+def _first_error(
+    validator: Any,
+    plan: list[tuple[Any, str, Any]],
+    instance: Any,
+    schema: Any,
+) -> Iterator[ValidationError]:
+    # what ``is_valid`` needs of a subschema: whether it has an error
+    for implementation, _, value in plan:
+        errors = implementation(validator, value, instance, schema)
+        if errors is _predicates.FAILED:
+            return iter(errors)
+        for error in errors or ():
+            return iter((error,))
+    return iter(())
+
+
+def plan_keywords(validator_class: Any) -> None:
+    """Dispatch only asserting keywords in ``validator_class``.
+
+    ``is_valid`` evaluates cheap keywords first and stops at the first
+    failure, without building errors where possible. Validators using a legacy
+    ``RefResolver`` keep the original behavior. Every descent checks the
+    deadline of a ``ValidationBudget`` timeout.
+    """
+    post_init = validator_class.__attrs_post_init__
+    iter_errors = validator_class.iter_errors
+    is_valid = validator_class.is_valid
+
+    # subschemas follow the dialect the metaschema is written in, e.g. the
+    # OpenAPI 3.1 dialect is a 2020-12 vocabulary
+    meta_schema = validator_class.META_SCHEMA
+    specification = referencing.jsonschema.specification_with(
+        dialect_id=(
+            meta_schema.get("$schema")
+            or validator_class.ID_OF(meta_schema)
+            or "urn:unknown-dialect"
+        ),
+        default=referencing.Specification.OPAQUE,
+    )
+
+    def planned_post_init(self: Any) -> None:
+        planned = type(self.schema) is dict and self._ref_resolver is None
+        if not planned or self._resolver is None:
+            post_init(self)
+        if planned:
+            self._validators = keyword_plan(self)
+
+    def planned_descend(
+        self: Any,
+        instance: Any,
+        schema: Any,
+        path: Any = None,
+        schema_path: Any = None,
+        resolver: Any = None,
+    ) -> Iterator[ValidationError]:
+        if _DEADLINE.get() is not None:
+            check_deadline()
+        if schema is True:
+            return iter(())
+        elif schema is False:
+            if _FAIL_FAST.get():
+                return iter(_predicates.FAILED)
+            error = ValidationError(
+                f"False schema does not allow {instance!r}",
+                validator=None,
+                validator_value=None,
+                instance=instance,
+                schema=schema,
+            )
+            return iter([error])
+
+        if self._ref_resolver is not None:
+            evolved = self.evolve(schema=schema)
+        else:
+            if resolver is None:
+                resolver = self._resolver.in_subresource(
+                    specification.create_resource(schema)
+                )
+            evolved = self.evolve(schema=schema, _resolver=resolver)
+
+        plan = evolved._validators
+        if _FAIL_FAST.get():
+            plan = getattr(plan, "ordered", plan)
+            return _first_error(evolved, plan, instance, schema)
+        return _errors(evolved, plan, instance, schema, path, schema_path)
+
+    def planned_iter_errors(
+        self: Any,
+        instance: Any,
+        _schema: Any = None,
+    ) -> Iterator[ValidationError]:
+        errors: Iterator[ValidationError]
+        if _DEADLINE.get() is not None:
+            check_deadline()
+        plan = self._validators
+        if _schema is not None or not isinstance(plan, Plan):
+            errors = iter_errors(self, instance, _schema)
+        elif _FAIL_FAST.get():
+            errors = _first_error(self, plan.ordered, instance, self.schema)
+        else:
+            errors = _errors(self, plan, instance, self.schema)
+        return errors
+
+    def fail_fast_is_valid(
+        self: Any, instance: Any, _schema: Any = None
+    ) -> bool:
+        token = _FAIL_FAST.set(True)
+        try:
+            valid: bool = is_valid(self, instance, _schema)
+        finally:
+            _FAIL_FAST.reset(token)
+        return valid
+
+    validator_class.__attrs_post_init__ = planned_post_init
+    validator_class.descend = planned_descend
+    validator_class.iter_errors = planned_iter_errors
+    validator_class.is_valid = fail_fast_is_valid
@@ -1,11 +1,120 @@
 import binascii
+import re
+import string
+import sys
 from base64 import b64decode
 from base64 import b64encode
+from datetime import date
 from numbers import Number
+from typing import Any
+from typing import Callable
+from typing import Iterable
 
+from jsonschema import _format as _generic_format
 from jsonschema._format import FormatChecker
+from jsonschema.exceptions import FormatError
 
+from openapi_schema_validator._caches import CacheStats
+from openapi_schema_validator._caches import FormatCheckCache
 from openapi_schema_validator._regex import is_valid_regex
+from openapi_schema_validator.settings import get_settings
+
+
+class OpenAPIFormatChecker(FormatChecker):  # type: ignore[misc]
+    """Format checker with an optional cache of check outcomes.
+
+    The cache is disabled until ``enable_cache`` is called.
+    """
+
+    def __init__(self, formats: Iterable[str] | None = None) -> None:
+        super().__init__(formats)
+        self._cache: FormatCheckCache | None = None
+        self._cached_formats: frozenset[str] | None = None
+        self._max_value_length = 0
+
+    def enable_cache(
+        self,
+        max_size: int = 1024,
+        formats: Iterable[str] | None = None,
+        max_value_length: int | None = None,
+    ) -> None:
+        """Remember the outcome of checking string and bytes values.
+
+        Args:
+            max_size: Number of ``(format, value)`` outcomes kept; the least
+                recently used ones are evicted first.
+            formats: Formats whose outcomes are cached. Defaults to all.
+            max_value_length: Longest value whose outcome is cached, so that
+                large payloads such as ``byte`` strings are not kept alive by
+                the cache. Defaults to the
+                ``format_check_cache_max_value_length`` setting.
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be positive")
+        if max_value_length is None:
+            max_value_length = (
+                get_settings().format_check_cache_max_value_length
+            )
+        elif max_value_length < 0:
+            raise ValueError("max_value_length must not be negative")
+        self._cache = FormatCheckCache(max_size)
+        self._cached_formats = None if formats is None else frozenset(formats)
+        self._max_value_length = max_value_length
+
+    def disable_cache(self) -> None:
+        self._cache = None
+        self._cached_formats = None
+
+    def cache_stats(self) -> CacheStats | None:
+        """Return hit/miss statistics, ``None`` if the cache is disabled."""
+        if self._cache is None:
+            return None
+        return self._cache.stats()
+
+    def checks(
+        self,
+        format: str,
+        raises: Any = (),
+    ) -> Callable[[Any], Any]:
+        register = super().checks(format, raises)
+
+        def _checks(func: Any) -> Any:
+            register(func)
+            # outcomes of the replaced check are stale
+            if self._cache is not None:
+                self._cache.clear()
+            return func
+
+        return _checks
+
+    def check(self, instance: object, format: str) -> None:
+        cache = self._cache
+        if (
+            cache is None
+            or type(instance) not in (str, bytes)
+            or len(instance) > self._max_value_length  # type: ignore[arg-type]
+            or format not in self.checkers
+            or (
+                self._cached_formats is not None
+                and format not in self._cached_formats
+            )
+        ):
+            super().check(instance, format)
+            return
+
+        key = (format, instance)
+        outcome = cache.get(key)
+        if outcome is FormatCheckCache.MISSING:
+            try:
+                super().check(instance, format)
+            except FormatError as error:
+                cache.set(key, error.cause)
+                raise
+            cache.set(key, FormatCheckCache.PASSED)
+        elif outcome is not FormatCheckCache.PASSED:
+            raise FormatError(
+                f"{instance!r} is not a {format!r}", cause=outcome
+            )
 
 
 def is_int32(instance: object) -> bool:
@@ -46,11 +155,56 @@ def is_double(instance: object) -> bool:
     return isinstance(instance, float)
 
 
+_BASE64_ALPHABET = (string.ascii_letters + string.digits + "+/").encode()
+_BASE64_CHUNK_SIZE = 1 << 16
+# b64decode(validate=True) uses the strict mode of a2b_base64 since 3.11
+_STRICT_BASE64 = sys.version_info >= (3, 11)
+
+
+def _base64_layout(instance: Any) -> tuple[int, int] | None:
+    """Return the data and padding lengths of plain base64.
+
+    Plain base64 is made of alphabet characters followed by ``=`` padding
+    only. Returns ``None`` for other values. The value is scanned in
+    chunks, so at most one chunk is copied at a time.
+    """
+    data: Any
+    pad: Any
+    if isinstance(instance, str):
+        if not instance.isascii():
+            return None
+        data, pad = instance, "="
+    else:
+        data, pad = memoryview(instance), ord("=")
+        if not data.c_contiguous:
+            data = memoryview(data.tobytes())
+        data = data.cast("B")
+    padding = 0
+    while padding < len(data) and data[-padding - 1] == pad:
+        padding += 1
+
+    length = len(data) - padding
+    for start in range(0, length, _BASE64_CHUNK_SIZE):
+        chunk = data[start : min(start + _BASE64_CHUNK_SIZE, length)]
+        if isinstance(chunk, str):
+            chunk = chunk.encode("ascii")
+        if bytes(chunk).translate(None, _BASE64_ALPHABET):
+            return None
+    return length, padding
+
+
 def is_binary_strict(instance: object) -> bool:
     # Strict: only accepts base64-encoded strings, not raw bytes
     if isinstance(instance, bytes):
         return False
     if isinstance(instance, str):
+        layout = _base64_layout(instance)
+        if layout is not None:
+            # b64decode stops at the padding completing the last quantum
+            length, padding = layout
+            remainder = length % 4
+            return remainder != 1 and padding >= (0, 0, 2, 1)[remainder]
+        # b64decode discards characters outside the alphabet
         try:
             b64decode(instance)
             return True
@@ -67,16 +221,24 @@ def is_binary_pragmatic(instance: object) -> bool:
 
 
 def is_byte(instance: object) -> bool:
-    if not isinstance(instance, (str, bytes)):
+    if not isinstance(instance, (str, bytes, bytearray, memoryview)):
         return True
-    if isinstance(instance, str):
-        instance = instance.encode("ascii", errors="strict")
-
-    try:
-        b64decode(instance, validate=True)
-    except (binascii.Error, ValueError):
+    layout = _base64_layout(instance)
+    if layout is None:
         return False
-    return True
+    length, padding = layout
+    remainder = length % 4
+    if remainder == 1:
+        return False
+    if remainder:
+        # the padding completes the last quantum
+        expected = 4 - remainder
+        if _STRICT_BASE64:
+            return padding == expected
+        return expected <= padding <= 2
+    if _STRICT_BASE64:
+        return bool(length) or not padding
+    return padding <= 2
 
 
 def is_password(instance: object) -> bool:
@@ -90,7 +252,56 @@ def is_regex(instance: object) -> bool:
     return is_valid_regex(instance)
 
 
-oas30_format_checker = FormatChecker()
+# Fast equivalents of the jsonschema string format checkers, registered on
+# the OAS 3.1 and 3.2 checkers in place of the generic ones.
+
+_RE_DATE_TIME = re.compile(
+    r"\d{4}-\d{2}-\d{2}[Tt](?:[01]\d|2[0-3]):[0-5]\d:[0-5]\d(?:\.\d+)?"
+    r"(?:[Zz]|[+-](?:[01]\d|2[0-3]):[0-5]\d)\n?",
+    re.ASCII,
+)
+_RE_UUID = re.compile(
+    r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-"
+    r"[0-9a-fA-F]{12}"
+)
+_RE_IPV4 = re.compile(
+    r"(?:(?:25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)\.){3}"
+    r"(?:25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)",
+    re.ASCII,
+)
+
+
+def is_date_time(instance: object) -> bool:
+    if not isinstance(instance, str):
+        return True
+    if _RE_DATE_TIME.fullmatch(instance) is None:
+        return False
+    try:
+        date.fromisoformat(instance[:10])
+    except ValueError:
+        return False
+    return True
+
+
+def is_uuid(instance: object) -> bool:
+    if not isinstance(instance, str):
+        return True
+    if _RE_UUID.fullmatch(instance):
+        return True
+    # 32 hex digits and 4 hyphens at least
+    if len(instance) < 36:
+        return False
+    # UUID() also accepts some unusual spellings of the canonical form
+    return bool(_generic_format.is_uuid(instance))
+
+
+def is_ipv4(instance: object) -> bool:
+    if not isinstance(instance, str):
+        return True
+    return _RE_IPV4.fullmatch(instance) is not None
+
+
+oas30_format_checker = OpenAPIFormatChecker()
 oas30_format_checker.checks("int32")(is_int32)
 oas30_format_checker.checks("int64")(is_int64)
 oas30_format_checker.checks("float")(is_float)
@@ -100,7 +311,7 @@ oas30_format_checker.checks("byte", (binascii.Error, TypeError))(is_byte)
 oas30_format_checker.checks("password")(is_password)
 oas30_format_checker.checks("regex")(is_regex)
 
-oas30_strict_format_checker = FormatChecker()
+oas30_strict_format_checker = OpenAPIFormatChecker()
 oas30_strict_format_checker.checks("int32")(is_int32)
 oas30_strict_format_checker.checks("int64")(is_int64)
 oas30_strict_format_checker.checks("float")(is_float)
@@ -112,19 +323,28 @@ oas30_strict_format_checker.checks("byte", (binascii.Error, TypeError))(
 oas30_strict_format_checker.checks("password")(is_password)
 oas30_strict_format_checker.checks("regex")(is_regex)
 
-oas31_format_checker = FormatChecker()
+oas31_format_checker = OpenAPIFormatChecker()
 oas31_format_checker.checks("int32")(is_int32)
 oas31_format_checker.checks("int64")(is_int64)
 oas31_format_checker.checks("float")(is_float)
 oas31_format_checker.checks("double")(is_double)
 oas31_format_checker.checks("password")(is_password)
 oas31_format_checker.checks("regex")(is_regex)
+oas31_format_checker.checks("uuid", ValueError)(is_uuid)
+oas31_format_checker.checks("ipv4")(is_ipv4)
+# date-time is only checked when rfc3339-validator is installed
+if "date-time" in oas31_format_checker.checkers:
+    oas31_format_checker.checks("date-time")(is_date_time)
 
 # OAS 3.2 uses the same format checks as OAS 3.1
-oas32_format_checker = FormatChecker()
+oas32_format_checker = OpenAPIFormatChecker()
 oas32_format_checker.checks("int32")(is_int32)
 oas32_format_checker.checks("int64")(is_int64)
 oas32_format_checker.checks("float")(is_float)
 oas32_format_checker.checks("double")(is_double)
 oas32_format_checker.checks("password")(is_password)
 oas32_format_checker.checks("regex")(is_regex)
+oas32_format_checker.checks("uuid", ValueError)(is_uuid)
+oas32_format_checker.checks("ipv4")(is_ipv4)
+if "date-time" in oas32_format_checker.checkers:
+    oas32_format_checker.checks("date-time")(is_date_time)
@@ -0,0 +1,21 @@
+from typing import Any
+
+
+def exceeds_node_count(instance: Any, limit: int) -> bool:
+    """Check whether an instance has more than ``limit`` JSON nodes.
+
+    Every object, array and scalar value counts as one node. The walk stops
+    as soon as the limit is exceeded, so its cost is bounded by ``limit``.
+    """
+    count = 0
+    stack = [instance]
+    while stack:
+        value = stack.pop()
+        count += 1
+        if count > limit:
+            return True
+        if isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+    return False
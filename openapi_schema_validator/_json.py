@@ -0,0 +1,18 @@
+from typing import Any
+from typing import Mapping
+
+
+def root_type_mismatch(validator: Any, instance: Any) -> bool:
+    """Whether the root schema's ``type`` rejects a decoded root value.
+
+    Only the ``type`` keyword of the root schema is evaluated, so the check
+    costs the same for documents of any size.
+    """
+    schema = validator.schema
+    if not isinstance(schema, Mapping) or "type" not in schema:
+        return False
+    implementation = validator.VALIDATORS.get("type")
+    if implementation is None:
+        return False
+    errors = implementation(validator, schema["type"], instance, schema)
+    return any(True for _ in errors or ())
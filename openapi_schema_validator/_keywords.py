@@ -5,17 +5,29 @@ from typing import cast
 
 from jsonschema._keywords import allOf as _allOf
 from jsonschema._keywords import anyOf as _anyOf
+from jsonschema._keywords import items as _items
 from jsonschema._keywords import oneOf as _oneOf
 from jsonschema._keywords import pattern as _pattern
+from jsonschema._keywords import type as _json_type
 from jsonschema._utils import extras_msg
-from jsonschema._utils import find_additional_properties
 from jsonschema.exceptions import FormatError
 from jsonschema.exceptions import ValidationError
 from jsonschema.exceptions import _WrappedReferencingError
 
+from openapi_schema_validator._annotations import evaluated_item_indexes
+from openapi_schema_validator._annotations import evaluated_property_keys
 from openapi_schema_validator._regex import ECMARegexSyntaxError
+from openapi_schema_validator._regex import UnsafeRegexError
 from openapi_schema_validator._regex import has_ecma_regex
+from openapi_schema_validator._regex import has_safe_regex
 from openapi_schema_validator._regex import search as regex_search
+from openapi_schema_validator._regex import search_property
+from openapi_schema_validator._regex import simple_matcher
+from openapi_schema_validator._types import exact_types
+from openapi_schema_validator._vectorized import numeric_items_failures
+
+# the keyword implementations below shadow the builtin
+_type_of = type
 
 
 def handle_discriminator(
@@ -121,22 +133,53 @@ def type(
     schema: Mapping[str, Any],
 ) -> Iterator[ValidationError]:
     """Default type validator - allows Python bytes for binary format for pragmatic reasons."""
+    return _type_errors(
+        validator,
+        data_type,
+        instance,
+        nullable=schema.get("nullable") is True,
+        # Pragmatic: allow bytes for binary format (common in Python use cases)
+        binary=data_type == "string" and schema.get("format") == "binary",
+    )
+
+
+def strict_type(
+    validator: Any,
+    data_type: str,
+    instance: Any,
+    schema: Any,
+) -> Any:
+    """
+    Strict type validator - follows OAS spec precisely.
+    Does NOT allow Python bytes for binary format.
+    """
+    return _type_errors(
+        validator,
+        data_type,
+        instance,
+        nullable=schema.get("nullable") is True,
+        binary=False,
+    )
+
+
+def _type_errors(
+    validator: Any,
+    data_type: str,
+    instance: Any,
+    nullable: bool,
+    binary: bool,
+) -> Iterator[ValidationError]:
     if instance is None:
         # nullable implementation based on OAS 3.0.3
         # * nullable is only meaningful if its value is true
         # * nullable: true is only meaningful in combination with a type
         #   assertion specified in the same Schema Object.
         # * nullable: true operates within a single Schema Object
-        if schema.get("nullable") is True:
-            return
-        yield ValidationError("None for not nullable")
-
-    # Pragmatic: allow bytes for binary format (common in Python use cases)
-    if (
-        data_type == "string"
-        and schema.get("format") == "binary"
-        and isinstance(instance, bytes)
-    ):
+        if not nullable:
+            yield ValidationError("None for not nullable")
+        return
+
+    if binary and isinstance(instance, bytes):
         return
 
     if not validator.is_type(instance, data_type):
@@ -144,24 +187,87 @@ def type(
         yield ValidationError(f"{instance!r} is not of type {data_repr}")
 
 
-def strict_type(
+def compile_type(validator: Any, data_type: str, schema: Any) -> Any:
+    """Return ``type`` specialized to the ``type`` keyword of ``schema``."""
+    binary = data_type == "string" and schema.get("format") == "binary"
+    return _compile_type(validator, data_type, schema, binary)
+
+
+def compile_strict_type(validator: Any, data_type: str, schema: Any) -> Any:
+    """Return ``strict_type`` specialized to the ``type`` of ``schema``."""
+    return _compile_type(validator, data_type, schema, binary=False)
+
+
+def _compile_type(
     validator: Any,
     data_type: str,
-    instance: Any,
     schema: Any,
+    binary: bool,
 ) -> Any:
-    """
-    Strict type validator - follows OAS spec precisely.
-    Does NOT allow Python bytes for binary format.
-    """
-    if instance is None:
-        if schema.get("nullable") is True:
-            return
-        yield ValidationError("None for not nullable")
+    nullable = schema.get("nullable") is True
+    passing = passing_types(validator, data_type, nullable, binary)
 
-    if not validator.is_type(instance, data_type):
-        data_repr = repr(data_type)
-        yield ValidationError(f"{instance!r} is not of type {data_repr}")
+    def compiled_type(
+        validator: Any,
+        data_type: str,
+        instance: Any,
+        schema: Any,
+    ) -> Iterator[ValidationError] | None:
+        if _type_of(instance) in passing:
+            return None
+        return _type_errors(validator, data_type, instance, nullable, binary)
+
+    return compiled_type
+
+
+def passing_types(
+    validator: Any,
+    data_type: str,
+    nullable: bool,
+    binary: bool,
+) -> frozenset[Any]:
+    """Return the exact types of instances passing ``type`` without a check."""
+    accepted: set[Any] = set()
+    if isinstance(data_type, str):
+        accepted.update(exact_types(validator.TYPE_CHECKER, data_type))
+    if nullable:
+        accepted.add(_type_of(None))
+    if binary:
+        accepted.add(bytes)
+    return frozenset(accepted)
+
+
+def compile_json_type(validator: Any, types: Any, schema: Any) -> Any:
+    """Return the JSON Schema ``type`` specialized to ``types``."""
+    passing = json_passing_types(validator, types)
+
+    def compiled_json_type(
+        validator: Any,
+        types: Any,
+        instance: Any,
+        schema: Any,
+    ) -> Iterator[ValidationError] | None:
+        if _type_of(instance) in passing:
+            return None
+        return cast(
+            Iterator[ValidationError],
+            _json_type(validator, types, instance, schema),
+        )
+
+    return compiled_json_type
+
+
+def json_passing_types(validator: Any, types: Any) -> frozenset[Any]:
+    """Return the exact types of instances passing JSON Schema ``type``."""
+    if isinstance(types, str):
+        types = [types]
+    elif not isinstance(types, list):
+        return frozenset()
+    accepted: set[Any] = set()
+    for name in types:
+        if isinstance(name, str):
+            accepted.update(exact_types(validator.TYPE_CHECKER, name))
+    return frozenset(accepted)
 
 
 def pattern(
@@ -170,16 +276,22 @@ def pattern(
     instance: Any,
     schema: Mapping[str, Any],
 ) -> Iterator[ValidationError]:
-    if not has_ecma_regex():
+    if not validator.is_type(instance, "string"):
+        return
+
+    matcher = simple_matcher(patrn)
+    if matcher is not None:
+        if not matcher(instance):
+            yield ValidationError(f"{instance!r} does not match {patrn!r}")
+        return
+
+    if not has_ecma_regex() and not has_safe_regex():
         yield from cast(
             Iterator[ValidationError],
             _pattern(validator, patrn, instance, schema),
         )
         return
 
-    if not validator.is_type(instance, "string"):
-        return
-
     try:
         matches = regex_search(patrn, instance)
     except ECMARegexSyntaxError as exc:
@@ -187,6 +299,11 @@ def pattern(
             f"{patrn!r} is not a valid regular expression ({exc})"
         )
         return
+    except UnsafeRegexError as exc:
+        yield ValidationError(
+            f"{patrn!r} may backtrack catastrophically ({exc})"
+        )
+        return
 
     if not matches:
         yield ValidationError(f"{instance!r} does not match {patrn!r}")
@@ -217,10 +334,37 @@ def items(
     if not validator.is_type(instance, "array"):
         return
 
+    failures = numeric_items_failures(validator, items, instance)
+    if failures is not None:
+        for index in failures:
+            yield from validator.descend(instance[index], items, path=index)
+        return
+
     for index, item in enumerate(instance):
         yield from validator.descend(item, items, path=index)
 
 
+def items_draft202012(
+    validator: Any,
+    items: Any,
+    instance: Any,
+    schema: Mapping[str, Any],
+) -> Iterator[ValidationError]:
+    if "prefixItems" not in schema and validator.is_type(instance, "array"):
+        failures = numeric_items_failures(validator, items, instance)
+        if failures is not None:
+            for index in failures:
+                yield from validator.descend(
+                    instance[index], items, path=index
+                )
+            return
+
+    yield from cast(
+        Iterator[ValidationError],
+        _items(validator, items, instance, schema),
+    )
+
+
 def required(
     validator: Any,
     required: list[str],
@@ -281,6 +425,42 @@ def write_required(
             yield ValidationError(f"{property!r} is a required property")
 
 
+def find_additional_properties(
+    instance: Mapping[str, Any], schema: Mapping[str, Any]
+) -> Iterator[str]:
+    """Like ``jsonschema``'s, with patterns matched by ``search_property``."""
+    properties = schema.get("properties", {})
+    patterns = schema.get("patternProperties", {})
+    for property in instance:
+        if property in properties:
+            continue
+        if any(search_property(pattern, property) for pattern in patterns):
+            continue
+        yield property
+
+
+def patternProperties(
+    validator: Any,
+    patternProperties: Mapping[str, Any],
+    instance: Any,
+    schema: Mapping[str, Any],
+) -> Iterator[ValidationError]:
+    if not validator.is_type(instance, "object"):
+        return
+
+    for pattern, subschema in patternProperties.items():
+        for k, v in instance.items():
+            try:
+                matches = search_property(pattern, k)
+            except UnsafeRegexError as exc:
+                yield ValidationError(str(exc))
+                break
+            if matches:
+                yield from validator.descend(
+                    v, subschema, path=k, schema_path=pattern
+                )
+
+
 def additionalProperties(
     validator: Any,
     aP: Any,
@@ -290,7 +470,11 @@ def additionalProperties(
     if not validator.is_type(instance, "object"):
         return
 
-    extras = set(find_additional_properties(instance, schema))
+    try:
+        extras = set(find_additional_properties(instance, schema))
+    except UnsafeRegexError as exc:
+        yield ValidationError(str(exc))
+        return
 
     if not extras:
         return
@@ -305,6 +489,97 @@ def additionalProperties(
             yield ValidationError(error % extras_msg(extras))
 
 
+def additionalProperties_draft202012(
+    validator: Any,
+    aP: Any,
+    instance: Any,
+    schema: Mapping[str, Any],
+) -> Iterator[ValidationError]:
+    if not validator.is_type(instance, "object"):
+        return
+
+    try:
+        extras = set(find_additional_properties(instance, schema))
+    except UnsafeRegexError as exc:
+        yield ValidationError(str(exc))
+        return
+
+    if validator.is_type(aP, "object"):
+        for extra in extras:
+            yield from validator.descend(instance[extra], aP, path=extra)
+    elif not aP and extras:
+        if "patternProperties" in schema:
+            verb = "does" if len(extras) == 1 else "do"
+            joined = ", ".join(repr(each) for each in sorted(extras))
+            patterns = ", ".join(
+                repr(each) for each in sorted(schema["patternProperties"])
+            )
+            error = f"{joined} {verb} not match any of the regexes: {patterns}"
+            yield ValidationError(error)
+        else:
+            error = "Additional properties are not allowed (%s %s unexpected)"
+            yield ValidationError(error % extras_msg(sorted(extras, key=str)))
+
+
+def unevaluatedItems(
+    validator: Any,
+    unevaluatedItems: Any,
+    instance: Any,
+    schema: Mapping[str, Any],
+) -> Iterator[ValidationError]:
+    if not validator.is_type(instance, "array"):
+        return
+
+    evaluated_indexes = evaluated_item_indexes(validator, instance, schema)
+    unevaluated_items = [
+        item
+        for index, item in enumerate(instance)
+        if index not in evaluated_indexes
+    ]
+    if unevaluated_items:
+        error = "Unevaluated items are not allowed (%s %s unexpected)"
+        yield ValidationError(error % extras_msg(unevaluated_items))
+
+
+def unevaluatedProperties(
+    validator: Any,
+    unevaluatedProperties: Any,
+    instance: Any,
+    schema: Mapping[str, Any],
+) -> Iterator[ValidationError]:
+    if not validator.is_type(instance, "object"):
+        return
+
+    try:
+        evaluated_keys = evaluated_property_keys(validator, instance, schema)
+    except UnsafeRegexError as exc:
+        yield ValidationError(str(exc))
+        return
+    unevaluated_keys = []
+    for property in instance:
+        if property in evaluated_keys:
+            continue
+        for _ in validator.descend(
+            instance[property],
+            unevaluatedProperties,
+            path=property,
+            schema_path=property,
+        ):
+            unevaluated_keys.append(property)
+
+    if unevaluated_keys:
+        if unevaluatedProperties is False:
+            error = "Unevaluated properties are not allowed (%s %s unexpected)"
+            extras = sorted(unevaluated_keys, key=str)
+            yield ValidationError(error % extras_msg(extras))
+        else:
+            error = (
+                "Unevaluated properties are not valid under "
+                "the given schema (%s %s unevaluated and invalid)"
+            )
+            yield ValidationError(error % extras_msg(unevaluated_keys))
+
+
 def write_readOnly(
     validator: Any,
     ro: bool,
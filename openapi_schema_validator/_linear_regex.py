@@ -0,0 +1,252 @@
+"""Linear-time matching for stdlib ``re`` patterns.
+
+Patterns are compiled from the ``re`` parse tree to a Thompson NFA, which is
+simulated over the input one character at a time. Matching takes
+O(len(pattern) * len(instance)) time whatever the pattern, but only
+patterns without backreferences, lookarounds, atomic groups, possessive
+repeats and the ``IGNORECASE``, ``LOCALE`` and ``ASCII`` flags are
+supported.
+"""
+
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from typing import Any
+from typing import Callable
+
+try:
+    import re._parser as _sre_parse  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover - Python < 3.11
+    import sre_parse as _sre_parse
+
+_MAX_STATES = 10_000
+_UNSUPPORTED_FLAGS = re.IGNORECASE | re.LOCALE | re.ASCII
+
+_CATEGORIES: dict[Any, Callable[[str], bool]] = {
+    _sre_parse.CATEGORY_DIGIT: str.isdecimal,
+    _sre_parse.CATEGORY_NOT_DIGIT: lambda char: not char.isdecimal(),
+    _sre_parse.CATEGORY_SPACE: str.isspace,
+    _sre_parse.CATEGORY_NOT_SPACE: lambda char: not char.isspace(),
+    _sre_parse.CATEGORY_WORD: lambda char: char.isalnum() or char == "_",
+    _sre_parse.CATEGORY_NOT_WORD: lambda char: not (
+        char.isalnum() or char == "_"
+    ),
+}
+_REPEATS = (_sre_parse.MAX_REPEAT, _sre_parse.MIN_REPEAT)
+_ASSERTIONS = (
+    _sre_parse.AT_BEGINNING,
+    _sre_parse.AT_BEGINNING_STRING,
+    _sre_parse.AT_END,
+    _sre_parse.AT_END_STRING,
+    _sre_parse.AT_BOUNDARY,
+    _sre_parse.AT_NON_BOUNDARY,
+)
+
+# state kinds
+_CHAR = 0
+_SPLIT = 1
+_ASSERT = 2
+_MATCH = 3
+
+
+class UnsupportedPatternError(ValueError):
+    pass
+
+
+class _Program:
+    __slots__ = ("kinds", "args", "outs", "start")
+
+    def __init__(self) -> None:
+        self.kinds: list[int] = []
+        self.args: list[Any] = []
+        self.outs: list[list[int]] = []
+        self.start = 0
+
+    def add(self, kind: int, arg: Any, outs: list[int]) -> int:
+        if len(self.kinds) >= _MAX_STATES:
+            raise UnsupportedPatternError("pattern is too large")
+        self.kinds.append(kind)
+        self.args.append(arg)
+        self.outs.append(outs)
+        return len(self.kinds) - 1
+
+
+@lru_cache(maxsize=256)
+def compile_linear(pattern: str) -> _Program:
+    """Compile a pattern for ``linear_search``.
+
+    Raises:
+        re.error: If the pattern is invalid.
+        UnsupportedPatternError: If the pattern uses constructs that cannot
+            be matched in linear time.
+    """
+    parsed = _sre_parse.parse(pattern)
+    flags = parsed.state.flags
+    program = _Program()
+    match = program.add(_MATCH, None, [])
+    program.start = _compile(program, list(parsed), flags, match)
+    return program
+
+
+def linear_search(pattern: str, instance: str) -> bool:
+    """Equivalent of ``re.search(pattern, instance) is not None``."""
+    program = compile_linear(pattern)
+    kinds, args, outs = program.kinds, program.args, program.outs
+    length = len(instance)
+
+    current: list[int] = []
+    for position in range(length + 1):
+        # every position may start a match
+        states = current + [program.start]
+        current = []
+        seen: set[int] = set()
+        while states:
+            state = states.pop()
+            if state in seen:
+                continue
+            seen.add(state)
+            kind = kinds[state]
+            if kind == _CHAR:
+                current.append(state)
+            elif kind == _SPLIT:
+                states.extend(outs[state])
+            elif kind == _ASSERT:
+                if _at(args[state], instance, position, length):
+                    states.extend(outs[state])
+            else:
+                return True
+
+        if position == length:
+            break
+        char = instance[position]
+        current = [outs[state][0] for state in current if args[state](char)]
+    return False
+
+
+def _compile(
+    program: _Program,
+    items: list[Any],
+    flags: int,
+    next_state: int,
+) -> int:
+    if flags & _UNSUPPORTED_FLAGS:
+        raise UnsupportedPatternError("unsupported flags")
+    for op, av in reversed(items):
+        next_state = _compile_item(program, op, av, flags, next_state)
+    return next_state
+
+
+def _compile_item(
+    program: _Program,
+    op: Any,
+    av: Any,
+    flags: int,
+    next_state: int,
+) -> int:
+    if op is _sre_parse.LITERAL:
+        literal = chr(av)
+        return program.add(_CHAR, literal.__eq__, [next_state])
+    if op is _sre_parse.NOT_LITERAL:
+        literal = chr(av)
+        return program.add(_CHAR, literal.__ne__, [next_state])
+    if op is _sre_parse.ANY:
+        if flags & re.DOTALL:
+            return program.add(_CHAR, _any, [next_state])
+        return program.add(_CHAR, "\n".__ne__, [next_state])
+    if op is _sre_parse.IN:
+        return program.add(_CHAR, _char_class(av), [next_state])
+    if op is _sre_parse.AT:
+        if av not in _ASSERTIONS:
+            raise UnsupportedPatternError(f"unsupported assertion {av}")
+        return program.add(_ASSERT, (av, flags), [next_state])
+    if op is _sre_parse.SUBPATTERN:
+        _, add_flags, del_flags, body = av
+        sub_flags = (flags | add_flags) & ~del_flags
+        return _compile(program, list(body), sub_flags, next_state)
+    if op is _sre_parse.BRANCH:
+        starts = [
+            _compile(program, list(branch), flags, next_state)
+            for branch in av[1]
+        ]
+        return program.add(_SPLIT, None, starts)
+    if op in _REPEATS:
+        low, high, body = av
+        body = list(body)
+        if high == _sre_parse.MAXREPEAT:
+            loop = program.add(_SPLIT, None, [])
+            start = _compile(program, body, flags, loop)
+            program.outs[loop] += [start, next_state]
+            next_state = loop
+        else:
+            for _ in range(high - low):
+                start = _compile(program, body, flags, next_state)
+                next_state = program.add(_SPLIT, None, [start, next_state])
+        for _ in range(low):
+            next_state = _compile(program, body, flags, next_state)
+        return next_state
+    raise UnsupportedPatternError(f"unsupported construct {op}")
+
+
+def _any(char: str) -> bool:
+    return True
+
+
+def _char_class(items: list[Any]) -> Callable[[str], bool]:
+    negate = False
+    literals = set()
+    ranges = []
+    categories = []
+    for op, av in items:
+        if op is _sre_parse.NEGATE:
+            negate = True
+        elif op is _sre_parse.LITERAL:
+            literals.add(chr(av))
+        elif op is _sre_parse.RANGE:
+            ranges.append(av)
+        elif op is _sre_parse.CATEGORY and av in _CATEGORIES:
+            categories.append(_CATEGORIES[av])
+        else:
+            raise UnsupportedPatternError(f"unsupported character set {op}")
+
+    def matches(char: str) -> bool:
+        found = (
+            char in literals
+            or any(low <= ord(char) <= high for low, high in ranges)
+            or any(category(char) for category in categories)
+        )
+        return found is not negate
+
+    return matches
+
+
+def _is_word(instance: str, position: int) -> bool:
+    if not 0 <= position < len(instance):
+        return False
+    char = instance[position]
+    return char.isalnum() or char == "_"
+
+
+def _at(
+    arg: tuple[Any, int], instance: str, position: int, length: int
+) -> bool:
+    code, flags = arg
+    multiline = flags & re.MULTILINE
+    if code is _sre_parse.AT_BEGINNING:
+        return position == 0 or bool(
+            multiline and instance[position - 1] == "\n"
+        )
+    if code is _sre_parse.AT_BEGINNING_STRING:
+        return position == 0
+    if code is _sre_parse.AT_END:
+        if position == length:
+            return True
+        if instance[position] != "\n":
+            return False
+        return bool(multiline) or position == length - 1
+    if code is _sre_parse.AT_END_STRING:
+        return position == length
+    if code is _sre_parse.AT_BOUNDARY:
+        return _is_word(instance, position - 1) != _is_word(instance, position)
+    # AT_NON_BOUNDARY
+    return _is_word(instance, position - 1) == _is_word(instance, position)
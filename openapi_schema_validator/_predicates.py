@@ -0,0 +1,543 @@
+"""Boolean keyword implementations used by ``is_valid``.
+
+A keyword implementation yields errors with messages quoting the instance,
+and applicators such as ``anyOf`` collect the errors of every failing
+branch, which ``is_valid`` throws away. The predicates below evaluate the
+same keywords without building errors: they return ``FAILED`` at the first
+failure and ``None`` otherwise, and descend into subschemas only as far as
+the first error. They mirror the keyword implementations of the
+``jsonschema`` version the package requires.
+"""
+
+from __future__ import annotations
+
+from fractions import Fraction
+from typing import Any
+from typing import Callable
+from typing import Mapping
+
+from jsonschema import _keywords
+from jsonschema import _legacy_keywords
+from jsonschema._utils import equal
+from jsonschema._utils import uniq
+from jsonschema.exceptions import ValidationError
+
+from openapi_schema_validator import _keywords as oas_keywords
+from openapi_schema_validator._keywords import find_additional_properties
+from openapi_schema_validator._regex import UnsafeRegexError
+from openapi_schema_validator._regex import search_property
+
+_type_of = type
+
+
+class _FailedErrors:
+    """The error of a failure, built only if a caller asks for it."""
+
+    _done = False
+
+    def __iter__(self) -> _FailedErrors:
+        return self
+
+    def __next__(self) -> ValidationError:
+        if self._done:
+            raise StopIteration
+        self._done = True
+        return ValidationError("invalid")
+
+
+class _Failed:
+    """The errors of a failed predicate.
+
+    Keyword implementations calling ``descend`` may modify the errors they
+    get, so each iteration yields a new error.
+    """
+
+    __slots__ = ()
+
+    def __iter__(self) -> _FailedErrors:
+        return _FailedErrors()
+
+
+FAILED = _Failed()
+
+Predicate = Callable[[Any, Any, Any, Any], Any]
+
+
+def _fails(errors: Any) -> bool:
+    if _type_of(errors) is _FailedErrors:
+        return True
+    for _ in errors:
+        return True
+    return False
+
+
+def type(validator: Any, types: Any, instance: Any, schema: Any) -> Any:
+    if isinstance(types, str):
+        types = [types]
+    if not any(validator.is_type(instance, type) for type in types):
+        return FAILED
+    return None
+
+
+def const(validator: Any, const: Any, instance: Any, schema: Any) -> Any:
+    if not equal(instance, const):
+        return FAILED
+    return None
+
+
+def enum(validator: Any, enums: Any, instance: Any, schema: Any) -> Any:
+    if all(not equal(each, instance) for each in enums):
+        return FAILED
+    return None
+
+
+def minLength(validator: Any, mL: Any, instance: Any, schema: Any) -> Any:
+    if validator.is_type(instance, "string") and len(instance) < mL:
+        return FAILED
+    return None
+
+
+def maxLength(validator: Any, mL: Any, instance: Any, schema: Any) -> Any:
+    if validator.is_type(instance, "string") and len(instance) > mL:
+        return FAILED
+    return None
+
+
+def minItems(validator: Any, mI: Any, instance: Any, schema: Any) -> Any:
+    if validator.is_type(instance, "array") and len(instance) < mI:
+        return FAILED
+    return None
+
+
+def maxItems(validator: Any, mI: Any, instance: Any, schema: Any) -> Any:
+    if validator.is_type(instance, "array") and len(instance) > mI:
+        return FAILED
+    return None
+
+
+def minProperties(validator: Any, mP: Any, instance: Any, schema: Any) -> Any:
+    if validator.is_type(instance, "object") and len(instance) < mP:
+        return FAILED
+    return None
+
+
+def maxProperties(validator: Any, mP: Any, instance: Any, schema: Any) -> Any:
+    if validator.is_type(instance, "object") and len(instance) > mP:
+        return FAILED
+    return None
+
+
+def minimum(validator: Any, minimum: Any, instance: Any, schema: Any) -> Any:
+    if validator.is_type(instance, "number") and instance < minimum:
+        return FAILED
+    return None
+
+
+def maximum(validator: Any, maximum: Any, instance: Any, schema: Any) -> Any:
+    if validator.is_type(instance, "number") and instance > maximum:
+        return FAILED
+    return None
+
+
+def exclusiveMinimum(
+    validator: Any, minimum: Any, instance: Any, schema: Any
+) -> Any:
+    if validator.is_type(instance, "number") and instance <= minimum:
+        return FAILED
+    return None
+
+
+def exclusiveMaximum(
+    validator: Any, maximum: Any, instance: Any, schema: Any
+) -> Any:
+    if validator.is_type(instance, "number") and instance >= maximum:
+        return FAILED
+    return None
+
+
+def minimum_draft4(
+    validator: Any, minimum: Any, instance: Any, schema: Any
+) -> Any:
+    if not validator.is_type(instance, "number"):
+        return None
+    if schema.get("exclusiveMinimum", False):
+        failed = instance <= minimum
+    else:
+        failed = instance < minimum
+    return FAILED if failed else None
+
+
+def maximum_draft4(
+    validator: Any, maximum: Any, instance: Any, schema: Any
+) -> Any:
+    if not validator.is_type(instance, "number"):
+        return None
+    if schema.get("exclusiveMaximum", False):
+        failed = instance >= maximum
+    else:
+        failed = instance > maximum
+    return FAILED if failed else None
+
+
+def multipleOf(validator: Any, dB: Any, instance: Any, schema: Any) -> Any:
+    if not validator.is_type(instance, "number"):
+        return None
+    if isinstance(dB, float):
+        quotient = instance / dB
+        try:
+            failed = int(quotient) != quotient
+        except OverflowError:
+            failed = (Fraction(instance) / Fraction(dB)).denominator != 1
+    else:
+        failed = instance % dB
+    return FAILED if failed else None
+
+
+def uniqueItems(validator: Any, uI: Any, instance: Any, schema: Any) -> Any:
+    if uI and validator.is_type(instance, "array") and not uniq(instance):
+        return FAILED
+    return None
+
+
+def required(validator: Any, required: Any, instance: Any, schema: Any) -> Any:
+    if not validator.is_type(instance, "object"):
+        return None
+    for property in required:
+        if property not in instance:
+            return FAILED
+    return None
+
+
+def dependentRequired(
+    validator: Any, dependentRequired: Any, instance: Any, schema: Any
+) -> Any:
+    if not validator.is_type(instance, "object"):
+        return None
+    for property, dependency in dependentRequired.items():
+        if property in instance:
+            for each in dependency:
+                if each not in instance:
+                    return FAILED
+    return None
+
+
+def properties(
+    validator: Any, properties: Any, instance: Any, schema: Any
+) -> Any:
+    if not validator.is_type(instance, "object"):
+        return None
+    for property, subschema in properties.items():
+        if property in instance and _fails(
+            validator.descend(
+                instance[property],
+                subschema,
+                path=property,
+                schema_path=property,
+            )
+        ):
+            return FAILED
+    return None
+
+
+def patternProperties(
+    validator: Any, patternProperties: Any, instance: Any, schema: Any
+) -> Any:
+    if not validator.is_type(instance, "object"):
+        return None
+    for pattern, subschema in patternProperties.items():
+        for k, v in instance.items():
+            try:
+                matches = search_property(pattern, k)
+            except UnsafeRegexError:
+                return FAILED
+            if matches and _fails(
+                validator.descend(v, subschema, path=k, schema_path=pattern)
+            ):
+                return FAILED
+    return None
+
+
+def additionalProperties(
+    validator: Any, aP: Any, instance: Any, schema: Any
+) -> Any:
+    if not validator.is_type(instance, "object"):
+        return None
+    try:
+        extras = list(find_additional_properties(instance, schema))
+    except UnsafeRegexError:
+        return FAILED
+    if validator.is_type(aP, "object"):
+        for extra in extras:
+            if _fails(validator.descend(instance[extra], aP, path=extra)):
+                return FAILED
+    elif not aP and extras:
+        return FAILED
+    return None
+
+
+def items(validator: Any, items: Any, instance: Any, schema: Any) -> Any:
+    if not validator.is_type(instance, "array"):
+        return None
+    prefix = len(schema.get("prefixItems", []))
+    total = len(instance)
+    if total <= prefix:
+        return None
+    if items is False:
+        return FAILED
+    for index in range(prefix, total):
+        if _fails(validator.descend(instance[index], items, path=index)):
+            return FAILED
+    return None
+
+
+def ref(validator: Any, ref: Any, instance: Any, schema: Any) -> Any:
+    if _fails(validator._validate_reference(ref=ref, instance=instance)):
+        return FAILED
+    return None
+
+
+def dynamicRef(
+    validator: Any, dynamicRef: Any, instance: Any, schema: Any
+) -> Any:
+    return ref(validator, dynamicRef, instance, schema)
+
+
+def allOf(validator: Any, allOf: Any, instance: Any, schema: Any) -> Any:
+    for index, subschema in enumerate(allOf):
+        if _fails(validator.descend(instance, subschema, schema_path=index)):
+            return FAILED
+    return None
+
+
+def anyOf(validator: Any, anyOf: Any, instance: Any, schema: Any) -> Any:
+    for index, subschema in enumerate(anyOf):
+        if not _fails(
+            validator.descend(instance, subschema, schema_path=index)
+        ):
+            return None
+    return FAILED
+
+
+def oneOf(validator: Any, oneOf: Any, instance: Any, schema: Any) -> Any:
+    subschemas = enumerate(oneOf)
+    for index, subschema in subschemas:
+        if not _fails(
+            validator.descend(instance, subschema, schema_path=index)
+        ):
+            break
+    else:
+        return FAILED
+    for _, each in subschemas:
+        if validator.evolve(schema=each).is_valid(instance):
+            return FAILED
+    return None
+
+
+def not_(validator: Any, not_schema: Any, instance: Any, schema: Any) -> Any:
+    if validator.evolve(schema=not_schema).is_valid(instance):
+        return FAILED
+    return None
+
+
+def contains(validator: Any, contains: Any, instance: Any, schema: Any) -> Any:
+    if not validator.is_type(instance, "array"):
+        return None
+    matches = 0
+    min_contains = schema.get("minContains", 1)
+    max_contains = schema.get("maxContains", len(instance))
+    contains_validator = validator.evolve(schema=contains)
+    for each in instance:
+        if contains_validator.is_valid(each):
+            matches += 1
+            if matches > max_contains:
+                return FAILED
+    if matches < min_contains:
+        return FAILED
+    return None
+
+
+def oas_required(
+    validator: Any, required: Any, instance: Any, schema: Any
+) -> Any:
+    return _oas_required(validator, required, instance, schema, True, True)
+
+
+def oas_read_required(
+    validator: Any, required: Any, instance: Any, schema: Any
+) -> Any:
+    return _oas_required(validator, required, instance, schema, False, True)
+
+
+def oas_write_required(
+    validator: Any, required: Any, instance: Any, schema: Any
+) -> Any:
+    return _oas_required(validator, required, instance, schema, True, False)
+
+
+def _oas_required(
+    validator: Any,
+    required: Any,
+    instance: Any,
+    schema: Any,
+    read_only: bool,
+    write_only: bool,
+) -> Any:
+    if not validator.is_type(instance, "object"):
+        return None
+    for property in required:
+        if property in instance:
+            continue
+        prop_schema = schema.get("properties", {}).get(property)
+        if prop_schema and (
+            read_only
+            and getattr(validator, "write", True)
+            and prop_schema.get("readOnly", False)
+            or write_only
+            and getattr(validator, "read", True)
+            and prop_schema.get("writeOnly", False)
+        ):
+            continue
+        return FAILED
+    return None
+
+
+def oas_additionalProperties(
+    validator: Any, aP: Any, instance: Any, schema: Any
+) -> Any:
+    if not validator.is_type(instance, "object"):
+        return None
+    try:
+        extras = list(find_additional_properties(instance, schema))
+    except UnsafeRegexError:
+        return FAILED
+    if validator.is_type(aP, "object"):
+        for extra in extras:
+            if _fails(validator.descend(instance[extra], aP, path=extra)):
+                return FAILED
+    elif validator.is_type(aP, "boolean"):
+        if not aP and extras:
+            return FAILED
+    return None
+
+
+def _compile_type(binary_format: bool) -> Callable[[Any, Any, Any], Any]:
+    def compile_type(validator: Any, data_type: Any, schema: Any) -> Any:
+        nullable = schema.get("nullable") is True
+        binary = (
+            binary_format
+            and data_type == "string"
+            and schema.get("format") == "binary"
+        )
+        passing = oas_keywords.passing_types(
+            validator, data_type, nullable, binary
+        )
+
+        def type(
+            validator: Any, data_type: Any, instance: Any, schema: Any
+        ) -> Any:
+            if _type_of(instance) in passing:
+                return None
+            # None passes only when nullable, and then it is in passing
+            if instance is None:
+                return FAILED
+            if binary and isinstance(instance, bytes):
+                return None
+            if not validator.is_type(instance, data_type):
+                return FAILED
+            return None
+
+        return type
+
+    return compile_type
+
+
+def _compile_json_type(validator: Any, types: Any, schema: Any) -> Any:
+    passing = oas_keywords.json_passing_types(validator, types)
+
+    def compiled_type(
+        validator: Any, types: Any, instance: Any, schema: Any
+    ) -> Any:
+        if _type_of(instance) in passing:
+            return None
+        return type(validator, types, instance, schema)
+
+    return compiled_type
+
+
+def _compile_discriminated(predicate: Predicate) -> Any:
+    def compile_applicator(validator: Any, value: Any, schema: Any) -> Any:
+        # the discriminator reports why no subschema was picked; keep it
+        if "discriminator" in schema:
+            return None
+        return predicate
+
+    return compile_applicator
+
+
+_PREDICATES: dict[Any, Predicate] = {
+    _keywords.type: type,
+    _keywords.const: const,
+    _keywords.enum: enum,
+    _keywords.minLength: minLength,
+    _keywords.maxLength: maxLength,
+    _keywords.minItems: minItems,
+    _keywords.maxItems: maxItems,
+    _keywords.minProperties: minProperties,
+    _keywords.maxProperties: maxProperties,
+    _keywords.minimum: minimum,
+    _keywords.maximum: maximum,
+    _keywords.exclusiveMinimum: exclusiveMinimum,
+    _keywords.exclusiveMaximum: exclusiveMaximum,
+    _legacy_keywords.minimum_draft3_draft4: minimum_draft4,
+    _legacy_keywords.maximum_draft3_draft4: maximum_draft4,
+    _keywords.multipleOf: multipleOf,
+    _keywords.uniqueItems: uniqueItems,
+    _keywords.required: required,
+    _keywords.dependentRequired: dependentRequired,
+    _keywords.properties: properties,
+    _keywords.additionalProperties: additionalProperties,
+    oas_keywords.patternProperties: patternProperties,
+    oas_keywords.additionalProperties_draft202012: additionalProperties,
+    _keywords.items: items,
+    _keywords.ref: ref,
+    _keywords.dynamicRef: dynamicRef,
+    _keywords.allOf: allOf,
+    _keywords.anyOf: anyOf,
+    _keywords.oneOf: oneOf,
+    _keywords.not_: not_,
+    _keywords.contains: contains,
+    oas_keywords.required: oas_required,
+    oas_keywords.read_required: oas_read_required,
+    oas_keywords.write_required: oas_write_required,
+    oas_keywords.additionalProperties: oas_additionalProperties,
+}
+
+# predicates specialized to a subschema, returning None to keep the
+# keyword implementation
+_COMPILERS: dict[Any, Callable[[Any, Any, Any], Any]] = {
+    _keywords.type: _compile_json_type,
+    oas_keywords.type: _compile_type(binary_format=True),
+    oas_keywords.strict_type: _compile_type(binary_format=False),
+    oas_keywords.allOf: _compile_discriminated(allOf),
+    oas_keywords.anyOf: _compile_discriminated(anyOf),
+    oas_keywords.oneOf: _compile_discriminated(oneOf),
+}
+
+
+def predicate(
+    validator: Any,
+    implementation: Any,
+    value: Any,
+    schema: Mapping[str, Any],
+) -> Any:
+    """Return the boolean variant of a keyword ``implementation``.
+
+    Keywords without one keep ``implementation``.
+    """
+    compile_predicate = _COMPILERS.get(implementation)
+    if compile_predicate is not None:
+        compiled = compile_predicate(validator, value, schema)
+        if compiled is not None:
+            return compiled
+        return implementation
+    return _PREDICATES.get(implementation, implementation)
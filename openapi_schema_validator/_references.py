@@ -0,0 +1,97 @@
+"""Memoized reference resolution.
+
+``referencing`` joins URIs, finds the resource in the registry and walks the
+JSON pointer again on every lookup, so recursive schemas pay for the same
+resolution at each level of the instance. Lookups are remembered for each
+registry, keyed by the resolver's base URI and dynamic scope and the
+reference, which is everything a lookup depends on.
+"""
+
+from __future__ import annotations
+
+import weakref
+from typing import Any
+from typing import Iterator
+
+import attrs
+from jsonschema.exceptions import ValidationError
+from jsonschema.exceptions import _WrappedReferencingError
+from referencing.exceptions import Unresolvable
+
+# registry id -> (base URI, dynamic scope, reference) -> resolved target
+_CACHES: dict[int, dict[tuple[Any, Any, str], tuple[Any, Any, Any, Any]]] = {}
+
+
+def _cache_for(
+    registry: Any,
+) -> dict[tuple[Any, Any, str], tuple[Any, Any, Any, Any]]:
+    cache = _CACHES.get(id(registry))
+    if cache is None:
+        cache = _CACHES[id(registry)] = {}
+        weakref.finalize(registry, _CACHES.pop, id(registry), None)
+    return cache
+
+
+def resolve(resolver: Any, ref: str) -> tuple[Any, Any]:
+    """Resolve ``ref`` and return the contents with their resolver.
+
+    Raises ``referencing.exceptions.Unresolvable`` like
+    ``Resolver.lookup``; failed lookups are not remembered.
+    """
+    registry = resolver._registry
+    cache = _cache_for(registry)
+    key = (resolver._base_uri, resolver._previous, ref)
+    target = cache.get(key)
+    if target is None:
+        resolved = resolver.lookup(ref)
+        found = resolved.resolver
+        # the target registry is only kept when the lookup crawled or
+        # retrieved into a new one, so entries never pin their own registry
+        cache[key] = (
+            resolved.contents,
+            found._base_uri,
+            found._previous,
+            None if found._registry is registry else found._registry,
+        )
+        return resolved.contents, found
+
+    contents, base_uri, previous, target_registry = target
+    if (
+        target_registry is None
+        and base_uri == resolver._base_uri
+        and previous == resolver._previous
+    ):
+        # e.g. a local reference in a schema without $id
+        return contents, resolver
+    return contents, attrs.evolve(
+        resolver,
+        base_uri=base_uri,
+        previous=previous,
+        registry=registry if target_registry is None else target_registry,
+    )
+
+
+def cache_references(validator_class: Any) -> None:
+    """Resolve the references of ``validator_class`` through the memo.
+
+    Validators using a legacy ``RefResolver`` keep the original behavior.
+    """
+    validate_reference = validator_class._validate_reference
+
+    def cached_validate_reference(
+        self: Any,
+        ref: str,
+        instance: Any,
+    ) -> Iterator[ValidationError]:
+        errors: Iterator[ValidationError]
+        if self._ref_resolver is not None:
+            errors = validate_reference(self, ref, instance)
+            return errors
+        try:
+            contents, resolver = resolve(self._resolver, ref)
+        except Unresolvable as err:
+            raise _WrappedReferencingError(err) from err
+        errors = self.descend(instance, contents, resolver=resolver)
+        return errors
+
+    validator_class._validate_reference = cached_validate_reference
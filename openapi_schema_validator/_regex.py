@@ -1,5 +1,18 @@
 import re
+from functools import lru_cache
 from typing import Any
+from typing import Callable
+
+try:
+    import re._parser as _sre_parse  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover - Python < 3.11
+    import sre_parse as _sre_parse
+
+from openapi_schema_validator._linear_regex import UnsupportedPatternError
+from openapi_schema_validator._linear_regex import compile_linear
+from openapi_schema_validator._linear_regex import linear_search
+from openapi_schema_validator._simple_regex import compile_simple
+from openapi_schema_validator.settings import get_settings
 
 _REGEX_CLASS: Any = None
 _REGRESS_ERROR: type[Exception] = Exception
@@ -15,10 +28,19 @@ class ECMARegexSyntaxError(ValueError):
     pass
 
 
+class UnsafeRegexError(ValueError):
+    pass
+
+
 def has_ecma_regex() -> bool:
     return _REGEX_CLASS is not None
 
 
+def has_safe_regex() -> bool:
+    """Whether stdlib ``re`` patterns are guarded against backtracking."""
+    return _REGEX_CLASS is None and get_settings().safe_regex
+
+
 def is_valid_regex(pattern: str) -> bool:
     if _REGEX_CLASS is None:
         try:
@@ -34,11 +56,269 @@ def is_valid_regex(pattern: str) -> bool:
     return True
 
 
+def simple_matcher(pattern: str) -> Callable[[str], bool] | None:
+    """Return a fast equivalent of ``search`` for simple patterns."""
+    if _REGEX_CLASS is None:
+        return compile_simple(pattern, False)
+    return _ecma_simple_matcher(pattern)
+
+
+@lru_cache(maxsize=1024)
+def _ecma_simple_matcher(pattern: str) -> Callable[[str], bool] | None:
+    # the stdlib parser accepts escapes ECMAScript rejects
+    if not is_valid_regex(pattern):
+        return None
+    return compile_simple(pattern, True)
+
+
+def unsafe_regex_reason(pattern: str) -> str | None:
+    """Explain why a pattern cannot be matched safely by ``search``.
+
+    Patterns that may backtrack catastrophically are matched in linear time
+    in safe regex mode, except those using constructs the linear-time
+    matcher does not support.
+    """
+    reason = redos_reason(pattern)
+    if reason is None:
+        return None
+    try:
+        compile_linear(pattern)
+    except UnsupportedPatternError as exc:
+        return f"{reason}; {exc}"
+    return None
+
+
 def search(pattern: str, instance: str) -> bool:
     if _REGEX_CLASS is None:
+        if has_safe_regex() and redos_reason(pattern) is not None:
+            reason = unsafe_regex_reason(pattern)
+            if reason is not None:
+                raise UnsafeRegexError(reason)
+            return linear_search(pattern, instance)
         return re.search(pattern, instance) is not None
 
     try:
         return _REGEX_CLASS(pattern).find(instance) is not None
     except _REGRESS_ERROR as exc:
         raise ECMARegexSyntaxError(str(exc)) from exc
+
+
+def search_property(pattern: str, name: str) -> bool:
+    """Match a property name against a ``patternProperties`` pattern.
+
+    Patterns are stdlib ``re`` patterns, as in ``jsonschema``, but are
+    guarded like ``search`` in safe regex mode, where an ``UnsafeRegexError``
+    explains which pattern cannot be matched.
+    """
+    if not has_safe_regex():
+        return re.search(pattern, name) is not None
+    try:
+        return search(pattern, name)
+    except UnsafeRegexError as exc:
+        raise UnsafeRegexError(
+            f"{pattern!r} may backtrack catastrophically ({exc})"
+        ) from exc
+
+
+# character ranges of the categories a pattern may start with
+_CATEGORY_RANGES = {
+    _sre_parse.CATEGORY_DIGIT: [(0x30, 0x39)],
+    _sre_parse.CATEGORY_WORD: [
+        (0x30, 0x39),
+        (0x41, 0x5A),
+        (0x5F, 0x5F),
+        (0x61, 0x7A),
+    ],
+    _sre_parse.CATEGORY_SPACE: [(0x09, 0x0D), (0x20, 0x20)],
+}
+_REPEATS = (_sre_parse.MAX_REPEAT, _sre_parse.MIN_REPEAT)
+_ANY_CHAR = None
+_MAX_CHAR = 0x10FFFF
+
+
+@lru_cache(maxsize=1024)
+def redos_reason(pattern: str) -> str | None:
+    """Explain why a pattern may backtrack catastrophically.
+
+    Detects, in the stdlib ``re`` syntax, subpatterns repeated more than
+    once that can match the same string in more than one way: nested
+    quantifiers that compete for the same characters (``(a+)+``,
+    ``(.*a){9}``) and overlapping alternatives (``(a|aa)*``). Such patterns
+    can take exponential or high polynomial time on non-matching input.
+    Returns ``None`` for patterns without these constructs or that do not
+    compile.
+    """
+    try:
+        parsed = _sre_parse.parse(pattern)
+    except (re.error, RecursionError):
+        return None
+    return _redos_reason(list(parsed), [])
+
+
+def _redos_reason(items: list[Any], follow: Any) -> str | None:
+    for index, (op, av) in enumerate(items):
+        after = _after(items, index, follow)
+        reason = None
+        if op in _REPEATS:
+            low, high, body = av
+            body = list(body)
+            if high > 1:
+                # the body may be followed by its next repetition
+                after = _union(_first(body)[0], after)
+                reason = _ambiguous(body, after)
+            reason = reason or _redos_reason(body, after)
+        elif op is _sre_parse.SUBPATTERN:
+            reason = _redos_reason(list(av[-1]), after)
+        elif op is _sre_parse.BRANCH:
+            for branch in av[1]:
+                reason = reason or _redos_reason(list(branch), after)
+        elif op in (_sre_parse.ASSERT, _sre_parse.ASSERT_NOT):
+            reason = _redos_reason(list(av[1]), _ANY_CHAR)
+        elif op is _sre_parse.GROUPREF_EXISTS:
+            for branch in av[1:]:
+                if branch is not None:
+                    reason = reason or _redos_reason(list(branch), after)
+        # atomic groups and possessive repeats never backtrack into
+        # their body
+        if reason is not None:
+            return reason
+    return None
+
+
+def _ambiguous(items: list[Any], follow: Any) -> str | None:
+    """Explain how a subpattern can match a string in more than one way.
+
+    ``follow`` has the ranges that can come right after ``items``. A
+    quantifier is ambiguous if the characters it repeats can also follow
+    it, and alternatives if they can start with the same character. The
+    parser factors common prefixes out of alternatives, which turns
+    ``(a|aa)`` into ``a(|a)``, so an alternative that can be empty competes
+    with what follows it, and two such alternatives with each other.
+    """
+    for index, (op, av) in enumerate(items):
+        after = _after(items, index, follow)
+        reason = None
+        if op is _sre_parse.SUBPATTERN:
+            reason = _ambiguous(list(av[-1]), after)
+        elif op in _REPEATS:
+            low, high, body = av
+            body = list(body)
+            first = _first(body)[0]
+            if low != high and _overlap(first, after):
+                return "nested quantifiers"
+            if high > 1:
+                after = _union(first, after)
+            reason = _ambiguous(body, after)
+        elif op is _sre_parse.BRANCH:
+            starts: list[tuple[Any, bool]] = []
+            for branch in av[1]:
+                first, nullable = _first(list(branch))
+                if nullable and any(other for _, other in starts):
+                    return "overlapping alternatives in a repeated group"
+                starts.append(
+                    (_union(first, after) if nullable else first, nullable)
+                )
+                reason = reason or _ambiguous(list(branch), after)
+            for position, (first, _) in enumerate(starts):
+                for other, _ in starts[position + 1 :]:
+                    if _overlap(first, other):
+                        return "overlapping alternatives in a repeated group"
+        if reason is not None:
+            return reason
+    return None
+
+
+def _after(items: list[Any], index: int, follow: Any) -> Any:
+    """Return the ranges that can come right after ``items[index]``."""
+    rest, nullable = _first(items[index + 1 :])
+    return _union(rest, follow) if nullable else rest
+
+
+def _first(items: list[Any]) -> tuple[Any, bool]:
+    """Return the ranges a subpattern can start with and if it can be empty."""
+    ranges: list[tuple[int, int]] = []
+    for op, av in items:
+        if op is _sre_parse.LITERAL:
+            return ranges + [(av, av)], False
+        if op is _sre_parse.IN:
+            in_ranges = _in_ranges(av)
+            if in_ranges is _ANY_CHAR:
+                return _ANY_CHAR, False
+            return ranges + in_ranges, False
+        if op is _sre_parse.NOT_LITERAL:
+            return ranges + _complement([(av, av)]), False
+        if op is _sre_parse.ANY:
+            return _ANY_CHAR, False
+        if op in _REPEATS or op is _sre_parse.SUBPATTERN:
+            body = av[-1] if op is _sre_parse.SUBPATTERN else av[2]
+            first, nullable = _first(list(body))
+            if first is _ANY_CHAR:
+                return _ANY_CHAR, False
+            ranges += first
+            if op in _REPEATS:
+                nullable = nullable or av[0] == 0
+            if not nullable:
+                return ranges, False
+        elif op is _sre_parse.BRANCH:
+            nullable = False
+            for branch in av[1]:
+                first, branch_nullable = _first(list(branch))
+                if first is _ANY_CHAR:
+                    return _ANY_CHAR, False
+                ranges += first
+                nullable = nullable or branch_nullable
+            if not nullable:
+                return ranges, False
+        elif op is not _sre_parse.AT:
+            # back references, lookarounds, ...: assume anything
+            return _ANY_CHAR, False
+    return ranges, True
+
+
+def _in_ranges(items: list[Any]) -> Any:
+    ranges: list[tuple[int, int]] = []
+    negate = False
+    for op, av in items:
+        if op is _sre_parse.NEGATE:
+            negate = True
+        elif op is _sre_parse.LITERAL:
+            ranges.append((av, av))
+        elif op is _sre_parse.RANGE:
+            ranges.append(av)
+        elif op is _sre_parse.CATEGORY and av in _CATEGORY_RANGES:
+            ranges += _CATEGORY_RANGES[av]
+        else:
+            return _ANY_CHAR
+    if negate:
+        return _complement(ranges)
+    return ranges
+
+
+def _complement(ranges: list[tuple[int, int]]) -> list[tuple[int, int]]:
+    complement = []
+    start = 0
+    for low, high in sorted(ranges):
+        if low > start:
+            complement.append((start, low - 1))
+        start = max(start, high + 1)
+    if start <= _MAX_CHAR:
+        complement.append((start, _MAX_CHAR))
+    return complement
+
+
+def _union(first: Any, other: Any) -> Any:
+    if first is _ANY_CHAR or other is _ANY_CHAR:
+        return _ANY_CHAR
+    return first + other
+
+
+def _overlap(first: Any, other: Any) -> bool:
+    if first is _ANY_CHAR:
+        return other is _ANY_CHAR or bool(other)
+    if other is _ANY_CHAR:
+        return bool(first)
+    return any(
+        low <= other_high and other_low <= high
+        for low, high in first
+        for other_low, other_high in other
+    )
@@ -0,0 +1,219 @@
+"""Fast paths for simple ``pattern`` values.
+
+Patterns made of literals and ASCII character classes, optionally repeated
+and anchored (``^[A-Z]{3}$``, ``^[a-z0-9-]+$``, ``^x-``), are matched with
+string operations instead of a regex engine.
+"""
+
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from typing import Any
+from typing import Callable
+from typing import NamedTuple
+from typing import cast
+
+try:
+    import re._parser as _sre_parse  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover - Python < 3.11
+    import sre_parse as _sre_parse
+
+_REPEATS = (_sre_parse.MAX_REPEAT, _sre_parse.MIN_REPEAT)
+_ASCII_DIGITS = "0123456789"
+# the (unicode) digits of the stdlib ``\d``
+_DECIMAL = None
+
+
+class _Segment(NamedTuple):
+    #: literal text, allowed characters or ``_DECIMAL``
+    chars: str | None
+    literal: bool
+    min: int
+    max: int | None
+
+    def matches(self, text: str) -> bool:
+        if self.literal:
+            return text == self.chars
+        if self.chars is _DECIMAL:
+            return not text or text.isdecimal()
+        return not text.lstrip(self.chars)
+
+
+@lru_cache(maxsize=1024)
+def compile_simple(pattern: str, ecma: bool) -> Callable[[str], bool] | None:
+    """Return a function searching ``pattern`` in a string, if it is simple.
+
+    ``ecma`` selects the semantics of the engine the function replaces:
+    ECMAScript (``regress``) or the stdlib ``re``, where ``\\d`` matches
+    unicode digits and ``$`` also matches before a trailing newline.
+    Returns ``None`` for other patterns.
+    """
+    if "{," in pattern:
+        # not a quantifier in ECMAScript
+        return None
+    try:
+        parsed = _sre_parse.parse(pattern)
+    except (re.error, RecursionError):
+        return None
+    if parsed.state.flags & ~re.UNICODE:
+        return None
+
+    items = list(parsed)
+    start = bool(items) and items[0] == (
+        _sre_parse.AT,
+        _sre_parse.AT_BEGINNING,
+    )
+    end = len(items) > start and items[-1] == (
+        _sre_parse.AT,
+        _sre_parse.AT_END,
+    )
+    segments = _segments(items[start : len(items) - end], ecma)
+    if segments is None:
+        return None
+
+    if start:
+        if not _deterministic(segments):
+            return None
+        matcher = _prefix_matcher(segments, end)
+    elif end:
+        variable = [seg for seg in segments if seg.min != seg.max]
+        if variable[1:] or (variable and segments[0] is not variable[0]):
+            return None
+        matcher = _suffix_matcher(segments)
+    elif len(segments) == 1 and segments[0].literal:
+        literal = cast(str, segments[0].chars)
+        return lambda instance: literal in instance
+    else:
+        return None
+
+    if ecma or not end:
+        return matcher
+    return lambda instance: matcher(instance) or (
+        instance.endswith("\n") and matcher(instance[:-1])
+    )
+
+
+def _segments(items: list[Any], ecma: bool) -> list[_Segment] | None:
+    segments: list[_Segment] = []
+    for op, av in items:
+        if op is _sre_parse.LITERAL:
+            if segments and segments[-1].literal:
+                text = cast(str, segments[-1].chars) + chr(av)
+                segments[-1] = _Segment(text, True, len(text), len(text))
+            else:
+                segments.append(_Segment(chr(av), True, 1, 1))
+            continue
+        low: int = 1
+        high: int | None = 1
+        if op in _REPEATS:
+            low, high, body = av
+            if len(body) != 1:
+                return None
+            op, av = body[0]
+            if high == _sre_parse.MAXREPEAT:
+                high = None
+        if op is _sre_parse.LITERAL:
+            chars: str | None = chr(av)
+        elif op is _sre_parse.IN:
+            chars = _class_chars(av, ecma)
+            if chars == "":
+                return None
+        else:
+            return None
+        segments.append(_Segment(chars, False, low, high))
+    return segments
+
+
+def _class_chars(items: list[Any], ecma: bool) -> str | None:
+    """Return the characters of an ASCII class, ``_DECIMAL`` for ``\\d``."""
+    if items == [(_sre_parse.CATEGORY, _sre_parse.CATEGORY_DIGIT)]:
+        return _ASCII_DIGITS if ecma else _DECIMAL
+    chars = []
+    for op, av in items:
+        if op is _sre_parse.LITERAL and av < 0x80:
+            chars.append(chr(av))
+        elif op is _sre_parse.RANGE and av[1] < 0x80:
+            chars.extend(map(chr, range(av[0], av[1] + 1)))
+        else:
+            return ""
+    return "".join(chars)
+
+
+def _deterministic(segments: list[_Segment]) -> bool:
+    """Whether matching the segments greedily never needs backtracking."""
+    for segment, following in zip(segments, segments[1:]):
+        if segment.min == segment.max:
+            continue
+        if following.min == 0:
+            return False
+        first = following.chars
+        if following.literal:
+            first = cast(str, first)[:1]
+        if first is _DECIMAL or segment.chars is _DECIMAL:
+            other = segment.chars if first is _DECIMAL else first
+            if other is _DECIMAL or any(map(str.isdecimal, other)):
+                return False
+        elif set(segment.chars) & set(first):
+            return False
+    return True
+
+
+def _span(segment: _Segment, instance: str, position: int) -> int:
+    """Count the characters of a segment's class from ``position``."""
+    end = None if segment.max is None else position + segment.max
+    text = instance[position:end]
+    if segment.chars is _DECIMAL:
+        count = 0
+        for char in text:
+            if not char.isdecimal():
+                break
+            count += 1
+        return count
+    return len(text) - len(text.lstrip(segment.chars))
+
+
+def _prefix_matcher(
+    segments: list[_Segment],
+    end: bool,
+) -> Callable[[str], bool]:
+    if len(segments) == 1 and segments[0].literal:
+        literal = cast(str, segments[0].chars)
+        if end:
+            return literal.__eq__
+        return lambda instance: instance.startswith(literal)
+
+    def matches(instance: str) -> bool:
+        position = 0
+        for segment in segments:
+            if segment.literal:
+                if not instance.startswith(cast(str, segment.chars), position):
+                    return False
+                position += segment.min
+                continue
+            count = _span(segment, instance, position)
+            if count < segment.min:
+                return False
+            position += count
+        return not end or position == len(instance)
+
+    return matches
+
+
+def _suffix_matcher(segments: list[_Segment]) -> Callable[[str], bool]:
+    # leading repetitions only need their minimum count
+    if segments and segments[0].min != segments[0].max:
+        first = segments[0]
+        segments = [first._replace(max=first.min)] + segments[1:]
+    if len(segments) == 1 and segments[0].literal:
+        suffix = cast(str, segments[0].chars)
+        return lambda instance: instance.endswith(suffix)
+    length = sum(segment.min for segment in segments)
+    prefix_matcher = _prefix_matcher(segments, True)
+
+    def matches(instance: str) -> bool:
+        return len(instance) >= length and prefix_matcher(
+            instance[len(instance) - length :]
+        )
+
+    return matches
@@ -1,13 +1,17 @@
+from functools import lru_cache
 from typing import Any
 from typing import cast
 
 from jsonschema._types import TypeChecker
 from jsonschema._types import draft202012_type_checker
+from jsonschema._types import is_any
 from jsonschema._types import is_array
 from jsonschema._types import is_bool
 from jsonschema._types import is_integer
+from jsonschema._types import is_null
 from jsonschema._types import is_number
 from jsonschema._types import is_object
+from jsonschema._types import is_string as _is_string
 
 
 def is_string(checker: Any, instance: Any) -> bool:
@@ -30,3 +34,81 @@ oas30_type_checker = TypeChecker(
 )
 
 oas31_type_checker = draft202012_type_checker
+
+# type arrays of normalized OpenAPI 3.0 schemas replace nullable with "null"
+oas30_normalized_type_checker = oas30_type_checker.redefine("null", is_null)
+
+# instances of these exact types have one JSON type each, however the
+# checker functions below are defined
+_SAMPLES: dict[type, Any] = {
+    dict: {},
+    list: [],
+    str: "",
+    int: 0,
+    bool: False,
+    float: 0.5,
+    type(None): None,
+}
+# checker functions and the exact types their result depends on only
+_TYPE_DETERMINED: dict[Any, tuple[type, ...]] = {
+    check: tuple(_SAMPLES)
+    for check in (
+        is_any,
+        is_array,
+        is_bool,
+        is_integer,
+        is_null,
+        is_number,
+        is_object,
+        _is_string,
+        is_string,
+    )
+}
+# draft 6+ integers include floats with a zero fractional part
+_TYPE_DETERMINED[draft202012_type_checker._type_checkers["integer"]] = tuple(
+    python_type for python_type in _SAMPLES if python_type is not float
+)
+
+
+@lru_cache(maxsize=None)
+def _type_table(type_checker: Any) -> dict[type, dict[str, bool]]:
+    table: dict[type, dict[str, bool]] = {}
+    for name, check in type_checker._type_checkers.items():
+        for python_type in _TYPE_DETERMINED.get(check, ()):
+            sample = _SAMPLES[python_type]
+            table.setdefault(python_type, {})[name] = check(
+                type_checker, sample
+            )
+    return table
+
+
+def exact_types(type_checker: Any, name: str) -> frozenset[type]:
+    """Return the built-in types whose instances are all of type ``name``."""
+    return frozenset(
+        python_type
+        for python_type, types in _type_table(type_checker).items()
+        if types.get(name)
+    )
+
+
+def dispatch_types(validator_class: Any) -> None:
+    """Answer ``is_type`` of ``validator_class`` from a type table.
+
+    The JSON types of instances of the built-in JSON types are looked up by
+    ``type(instance)``; other instances and type names with custom checker
+    functions go through ``TYPE_CHECKER``.
+    """
+    is_type = validator_class.is_type
+    table = _type_table(validator_class.TYPE_CHECKER)
+    type_of = type
+
+    def dispatched_is_type(self: Any, instance: Any, type: str) -> bool:
+        types = table.get(type_of(instance))
+        if types is not None:
+            result = types.get(type)
+            if result is not None:
+                return result
+        checked: bool = is_type(self, instance, type)
+        return checked
+
+    validator_class.is_type = dispatched_is_type
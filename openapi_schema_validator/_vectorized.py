@@ -0,0 +1,203 @@
+from functools import lru_cache
+from math import isnan
+from typing import Any
+from typing import Sequence
+
+from jsonschema import _keywords
+from jsonschema import _legacy_keywords
+
+from openapi_schema_validator import _format as oas_format
+
+_np: Any = None
+
+try:
+    import numpy as _np
+except ImportError:  # pragma: no cover - optional dependency
+    pass
+
+# Arrays shorter than this are cheaper to check item by item.
+MIN_VECTORIZED_LENGTH = 16
+
+_INT64_BOUND = 1 << 63
+
+_PASSING_FORMAT_CHECKS = (
+    oas_format.is_float,
+    oas_format.is_double,
+    oas_format.is_password,
+)
+_INT_FORMAT_CHECKS = (oas_format.is_int32, oas_format.is_int64)
+
+
+@lru_cache(maxsize=None)
+def _numeric_keywords() -> tuple[dict[str, tuple[Any, ...]], Any]:
+    """Keyword implementations whose semantics the checks reproduce."""
+    # imported lazily, the keywords module imports this module
+    from openapi_schema_validator import _keywords as oas_keywords
+
+    keywords = {
+        "type": (oas_keywords.type, oas_keywords.strict_type, _keywords.type),
+        "minimum": (
+            _legacy_keywords.minimum_draft3_draft4,
+            _keywords.minimum,
+        ),
+        "maximum": (
+            _legacy_keywords.maximum_draft3_draft4,
+            _keywords.maximum,
+        ),
+        "exclusiveMinimum": (_keywords.exclusiveMinimum,),
+        "exclusiveMaximum": (_keywords.exclusiveMaximum,),
+        "multipleOf": (_keywords.multipleOf,),
+        "format": (oas_keywords.format, _keywords.format),
+    }
+    return keywords, oas_keywords.not_implemented
+
+
+def numeric_items_failures(
+    validator: Any,
+    items: Any,
+    instance: Sequence[Any],
+) -> list[int] | None:
+    """Find the items of a homogeneous numeric array that may be invalid.
+
+    Returns ``None`` if ``items`` or ``instance`` is not eligible for the
+    vectorized checks. Otherwise returns the indices of the items that
+    have to be validated individually; every invalid item is included,
+    so descending into just these items yields the same errors as
+    descending into all of them.
+    """
+    if len(instance) < MIN_VECTORIZED_LENGTH or not isinstance(items, dict):
+        return None
+
+    numeric_keywords, not_implemented = _numeric_keywords()
+    int_check = None
+    # (bound, exclusive) pairs
+    lower: list[tuple[Any, bool]] = []
+    upper: list[tuple[Any, bool]] = []
+    for keyword, value in items.items():
+        implementation = validator.VALIDATORS.get(keyword)
+        if implementation is None or implementation is not_implemented:
+            continue
+        if implementation not in numeric_keywords.get(keyword, ()):
+            return None
+        if keyword == "type" and value not in ("number", "integer"):
+            return None
+        if implementation is _legacy_keywords.minimum_draft3_draft4:
+            lower.append((value, bool(items.get("exclusiveMinimum", False))))
+        elif implementation is _legacy_keywords.maximum_draft3_draft4:
+            upper.append((value, bool(items.get("exclusiveMaximum", False))))
+        elif keyword in ("minimum", "exclusiveMinimum"):
+            lower.append((value, keyword == "exclusiveMinimum"))
+        elif keyword in ("maximum", "exclusiveMaximum"):
+            upper.append((value, keyword == "exclusiveMaximum"))
+        if keyword == "format":
+            format_checker = validator.format_checker
+            if format_checker is None or value not in format_checker.checkers:
+                continue
+            check = format_checker.checkers[value][0]
+            if check in _INT_FORMAT_CHECKS:
+                int_check = check
+            elif check not in _PASSING_FORMAT_CHECKS:
+                return None
+
+    types = set(map(type, instance))
+    if not types <= {int, float}:
+        return None
+    if items.get("type") == "integer" and types != {int}:
+        return None
+    # NaN breaks the ordering min() and max() rely on
+    if float in types and any(map(isnan, instance)):
+        return None
+
+    failures: set[int] = set()
+    lowest = min(instance)
+    highest = max(instance)
+
+    for minimum, exclusive in lower:
+        if exclusive:
+            if lowest <= minimum:
+                failures.update(_indices(instance, lambda x: x <= minimum))
+        elif lowest < minimum:
+            failures.update(_indices(instance, lambda x: x < minimum))
+
+    for maximum, exclusive in upper:
+        if exclusive:
+            if highest >= maximum:
+                failures.update(_indices(instance, lambda x: x >= maximum))
+        elif highest > maximum:
+            failures.update(_indices(instance, lambda x: x > maximum))
+
+    if int_check is not None and int in types:
+        # the format only applies to ints, so the extremes of a mixed
+        # array do not bound the checked items
+        if types != {int} or not (int_check(lowest) and int_check(highest)):
+            failures.update(_indices(instance, lambda x: not int_check(x)))
+
+    if "multipleOf" in items:
+        failures.update(
+            _multiple_of_failures(instance, items["multipleOf"], types)
+        )
+
+    return sorted(failures)
+
+
+def _indices(instance: Sequence[Any], failed: Any) -> list[int]:
+    return [index for index, item in enumerate(instance) if failed(item)]
+
+
+def _not_multiple_of(instance: Any, dB: Any) -> bool:
+    # mirrors jsonschema's multipleOf; inexact cases are reported as
+    # failures and settled by the keyword itself
+    if isinstance(dB, float):
+        quotient = instance / dB
+        try:
+            return bool(int(quotient) != quotient)
+        except (OverflowError, ValueError):
+            return True
+    return bool(instance % dB)
+
+
+def _multiple_of_failures(
+    instance: Sequence[Any],
+    dB: Any,
+    types: set[type],
+) -> list[int]:
+    if _np is not None:
+        try:
+            failures = _np_multiple_of_failures(instance, dB, types)
+        except (OverflowError, TypeError, ValueError):
+            failures = None
+        if failures is not None:
+            return failures
+    return _indices(instance, lambda x: _not_multiple_of(x, dB))
+
+
+def _np_multiple_of_failures(
+    instance: Sequence[Any],
+    dB: Any,
+    types: set[type],
+) -> list[int] | None:
+    if isinstance(dB, float):
+        # int / float and float / float both divide in double precision,
+        # as numpy does after converting the items to float64
+        values = _np.asarray(instance, dtype=_np.float64)
+        with _np.errstate(all="ignore"):
+            quotient = values / dB
+            failed = ~_np.isfinite(quotient) | (
+                _np.trunc(quotient) != quotient
+            )
+    elif isinstance(dB, int) and -_INT64_BOUND < dB < _INT64_BOUND:
+        if types == {float}:
+            values = _np.asarray(instance, dtype=_np.float64)
+        elif types == {int}:
+            values = _np.asarray(instance)
+            if values.dtype.kind not in "iu":
+                return None
+        else:
+            return None
+        if dB == 0:
+            return None
+        with _np.errstate(all="ignore"):
+            failed = _np.remainder(values, dB) != 0
+    else:
+        return None
+    return [int(index) for index in _np.flatnonzero(failed)]
@@ -0,0 +1,384 @@
+"""Static worst-case cost analysis of OpenAPI schemas.
+
+Run ``python -m openapi_schema_validator.analysis schema.json`` to print a
+report for a schema file.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from dataclasses import asdict
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Any
+from typing import Mapping
+from typing import Sequence
+
+from jsonschema.protocols import Validator
+from referencing import Registry
+from referencing.exceptions import Unresolvable
+
+from openapi_schema_validator import _keywords as oas_keywords
+from openapi_schema_validator._regex import redos_reason
+from openapi_schema_validator._specifications import (
+    REGISTRY as OPENAPI_SPECIFICATIONS,
+)
+from openapi_schema_validator.collectors import _pointer
+from openapi_schema_validator.validators import OAS30Validator
+from openapi_schema_validator.validators import OAS31Validator
+from openapi_schema_validator.validators import OAS32Validator
+
+#: ``anyOf``/``oneOf`` nesting evaluating many branches per instance
+FAN_OUT = "fan-out"
+#: ``additionalProperties`` schema without ``maxProperties``
+UNBOUNDED_ADDITIONAL_PROPERTIES = "unbounded-additional-properties"
+#: ``uniqueItems`` on arrays that may hold objects or arrays
+UNIQUE_OBJECT_ITEMS = "unique-object-items"
+#: ``$ref`` cycle
+RECURSIVE_REF = "recursive-ref"
+#: ``pattern`` prone to catastrophic backtracking in the stdlib ``re``
+REDOS_PATTERN = "redos-pattern"
+
+_VALIDATORS = {
+    "oas30": OAS30Validator,
+    "oas31": OAS31Validator,
+    "oas32": OAS32Validator,
+}
+# OAS 3.0 combinators validating only the branch a discriminator selects
+_DISCRIMINATING_KEYWORDS = (
+    oas_keywords.allOf,
+    oas_keywords.anyOf,
+    oas_keywords.oneOf,
+)
+_SCALAR_TYPES = frozenset(["string", "number", "integer", "boolean", "null"])
+
+
+@dataclass(frozen=True)
+class Hotspot:
+    kind: str
+    #: URI fragment or reference of the schema location
+    location: str
+    message: str
+
+
+@dataclass(frozen=True)
+class SchemaReport:
+    """Result of ``analyze_schema``.
+
+    ``cost`` estimates the number of keyword evaluations needed to validate
+    a worst-case instance, assuming unbounded arrays and objects have the
+    configured number of members and each recursion is entered once.
+    """
+
+    cost: float
+    hotspots: tuple[Hotspot, ...] = field(default_factory=tuple)
+
+    @property
+    def recursive(self) -> bool:
+        return any(hotspot.kind == RECURSIVE_REF for hotspot in self.hotspots)
+
+
+def analyze_schema(
+    schema: Mapping[str, Any] | bool,
+    cls: type[Validator] = OAS32Validator,
+    *,
+    registry: Registry | None = None,
+    assumed_array_length: int = 100,
+    assumed_property_count: int = 100,
+    fan_out_threshold: int = 16,
+) -> SchemaReport:
+    """Estimate the worst-case validation cost of a schema.
+
+    References are resolved with the package registry, combined with
+    ``registry`` if given, without retrieving remote resources.
+
+    Args:
+        schema: OpenAPI schema to analyze.
+        cls: Validator class whose dialect ``schema`` uses. Defaults to
+            ``OAS32Validator``.
+        registry: Registry with resources referenced by ``schema``.
+        assumed_array_length: Length assumed for arrays without
+            ``maxItems``.
+        assumed_property_count: Number of members assumed for objects
+            without ``maxProperties``.
+        fan_out_threshold: Number of ``anyOf``/``oneOf`` branch evaluations
+            at one instance location from which nested combinators are
+            reported.
+    """
+    if registry is not None:
+        registry = OPENAPI_SPECIFICATIONS.combine(registry)
+    else:
+        registry = OPENAPI_SPECIFICATIONS
+    validator: Any = cls(schema, registry=registry)
+    analyzer = _Analyzer(
+        validator,
+        assumed_array_length=assumed_array_length,
+        assumed_property_count=assumed_property_count,
+        fan_out_threshold=fan_out_threshold,
+    )
+    cost, _ = analyzer.visit(schema, validator._resolver, "#")
+    return SchemaReport(cost=cost, hotspots=tuple(analyzer.hotspots))
+
+
+class _Analyzer:
+    def __init__(
+        self,
+        validator: Any,
+        *,
+        assumed_array_length: int,
+        assumed_property_count: int,
+        fan_out_threshold: int,
+    ) -> None:
+        self.validator = validator
+        self.assumed_array_length = assumed_array_length
+        self.assumed_property_count = assumed_property_count
+        self.fan_out_threshold = fan_out_threshold
+        self.hotspots: list[Hotspot] = []
+        # cost and number of branch evaluations per schema object
+        self._results: dict[int, tuple[float, int]] = {}
+        self._visiting: set[int] = set()
+
+    def visit(
+        self,
+        schema: Any,
+        resolver: Any,
+        location: str,
+    ) -> tuple[float, int]:
+        if not isinstance(schema, Mapping):
+            return 0, 1
+        result = self._results.get(id(schema))
+        if result is None:
+            self._visiting.add(id(schema))
+            try:
+                result = self._visit(schema, resolver, location)
+            finally:
+                self._visiting.discard(id(schema))
+            self._results[id(schema)] = result
+        return result
+
+    def _visit(
+        self,
+        schema: Mapping[str, Any],
+        resolver: Any,
+        location: str,
+    ) -> tuple[float, int]:
+        known = self.validator.VALIDATORS
+        cost: float = sum(1 for keyword in schema if keyword in known)
+        branches = 1
+
+        def child(keyword: str, *path: Any) -> float:
+            subschema = schema[keyword]
+            for token in path:
+                subschema = subschema[token]
+            child_location = location + _pointer((keyword,) + path)
+            return self.visit(subschema, resolver, child_location)[0]
+
+        def members(limit_keyword: str, assumed: int) -> int:
+            limit = schema.get(limit_keyword)
+            if isinstance(limit, int) and not isinstance(limit, bool):
+                return limit
+            return assumed
+
+        items = members("maxItems", self.assumed_array_length)
+        properties = members("maxProperties", self.assumed_property_count)
+
+        if "$ref" in schema and "$ref" in known:
+            ref_cost, branches = self._visit_ref(
+                schema["$ref"], resolver, location
+            )
+            cost += ref_cost
+
+        for keyword in ("anyOf", "oneOf", "allOf"):
+            subschemas = schema.get(keyword)
+            if keyword not in known or not isinstance(subschemas, list):
+                continue
+            results = [
+                self.visit(
+                    subschema, resolver, location + _pointer((keyword, index))
+                )
+                for index, subschema in enumerate(subschemas)
+            ]
+            if (
+                "discriminator" in schema
+                and known[keyword] in _DISCRIMINATING_KEYWORDS
+            ):
+                # only the branch selected by the discriminator is evaluated
+                cost += max((subcost for subcost, _ in results), default=0)
+                count = max((count for _, count in results), default=1)
+            else:
+                cost += sum(subcost for subcost, _ in results)
+                count = sum(count for _, count in results)
+            # nested combinators multiply the branches to evaluate
+            nested = count > len(results)
+            if (
+                keyword != "allOf"
+                and nested
+                and count >= self.fan_out_threshold
+            ):
+                self._report(
+                    FAN_OUT,
+                    location,
+                    f"{keyword} evaluates up to {count} branches",
+                )
+            branches = max(branches, count)
+
+        if "not" in known and "not" in schema:
+            cost += child("not")
+        if "if" in known:
+            for keyword in ("if", "then", "else"):
+                if keyword in schema:
+                    cost += child(keyword)
+
+        for keyword in ("properties", "patternProperties", "dependentSchemas"):
+            subschemas = schema.get(keyword)
+            if keyword in known and isinstance(subschemas, Mapping):
+                cost += sum(child(keyword, name) for name in subschemas)
+        if "patternProperties" in known:
+            for pattern in schema.get("patternProperties", ()):
+                self._check_pattern(pattern, location + "/patternProperties")
+
+        additional = schema.get("additionalProperties")
+        if "additionalProperties" in known and isinstance(additional, Mapping):
+            cost += properties * child("additionalProperties")
+            if additional and "maxProperties" not in schema:
+                self._report(
+                    UNBOUNDED_ADDITIONAL_PROPERTIES,
+                    location,
+                    "additionalProperties schema applies to any number of "
+                    "properties",
+                )
+        for keyword in ("propertyNames", "unevaluatedProperties"):
+            if keyword in known and keyword in schema:
+                cost += properties * child(keyword)
+
+        item_schema: Any = None
+        if "prefixItems" in known and isinstance(
+            schema.get("prefixItems"), list
+        ):
+            cost += sum(
+                child("prefixItems", index)
+                for index in range(len(schema["prefixItems"]))
+            )
+        if isinstance(schema.get("items"), list):
+            cost += sum(
+                child("items", index) for index in range(len(schema["items"]))
+            )
+        elif "items" in known and "items" in schema:
+            item_schema = schema["items"]
+            cost += items * child("items")
+        for keyword in ("contains", "unevaluatedItems", "additionalItems"):
+            if keyword in known and keyword in schema:
+                cost += items * child(keyword)
+
+        if schema.get("uniqueItems") is True and "uniqueItems" in known:
+            if not _holds_scalars(item_schema):
+                cost += items * (items - 1) / 2
+                self._report(
+                    UNIQUE_OBJECT_ITEMS,
+                    location,
+                    "uniqueItems compares objects or arrays pairwise",
+                )
+
+        pattern = schema.get("pattern")
+        if "pattern" in known and isinstance(pattern, str):
+            self._check_pattern(pattern, location + "/pattern")
+
+        return cost, branches
+
+    def _visit_ref(
+        self,
+        ref: str,
+        resolver: Any,
+        location: str,
+    ) -> tuple[float, int]:
+        try:
+            resolved = resolver.lookup(ref)
+        except Unresolvable:
+            return 0, 1
+        if id(resolved.contents) in self._visiting:
+            self._report(
+                RECURSIVE_REF,
+                location,
+                f"{ref} refers to an enclosing schema",
+            )
+            return 0, 1
+        if "#" not in ref:
+            ref += "#"
+        return self.visit(resolved.contents, resolved.resolver, ref)
+
+    def _check_pattern(self, pattern: str, location: str) -> None:
+        reason = redos_reason(pattern)
+        if reason is not None:
+            self._report(
+                REDOS_PATTERN,
+                location,
+                f"{pattern!r} may backtrack catastrophically ({reason})",
+            )
+
+    def _report(self, kind: str, location: str, message: str) -> None:
+        self.hotspots.append(Hotspot(kind, location, message))
+
+
+def _holds_scalars(item_schema: Any) -> bool:
+    if not isinstance(item_schema, Mapping):
+        return False
+    types = item_schema.get("type")
+    if isinstance(types, str):
+        types = [types]
+    return isinstance(types, list) and set(types) <= _SCALAR_TYPES
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m openapi_schema_validator.analysis",
+        description="Report the worst-case validation cost of a schema.",
+        epilog=(
+            "Exits with status 1 if the cost exceeds --max-cost, or if "
+            "hotspots are found and --fail-on-hotspots is given, "
+            "and with status 0 otherwise."
+        ),
+    )
+    parser.add_argument("schema", help="path to a JSON schema file")
+    parser.add_argument(
+        "--dialect",
+        choices=sorted(_VALIDATORS),
+        default="oas32",
+        help="OpenAPI version of the schema (default: oas32)",
+    )
+    parser.add_argument(
+        "--max-cost",
+        type=float,
+        help="fail if the estimated cost exceeds this value",
+    )
+    parser.add_argument(
+        "--fail-on-hotspots",
+        action="store_true",
+        help="fail if any hotspot is found",
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="print the report as JSON",
+    )
+    args = parser.parse_args(argv)
+
+    with open(args.schema, encoding="utf-8") as schema_file:
+        schema = json.load(schema_file)
+    report = analyze_schema(schema, _VALIDATORS[args.dialect])
+
+    if args.json:
+        print(json.dumps(asdict(report), indent=2))
+    else:
+        print(f"estimated cost: {report.cost:g}")
+        for hotspot in report.hotspots:
+            print(f"{hotspot.kind}: {hotspot.location}: {hotspot.message}")
+
+    too_expensive = args.max_cost is not None and report.cost > args.max_cost
+    has_hotspots = args.fail_on_hotspots and bool(report.hotspots)
+    return 1 if too_expensive or has_hotspots else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+import random
+from collections import Counter
+from dataclasses import dataclass
+from queue import Empty
+from queue import Full
+from queue import Queue
+from threading import Lock
+from threading import Thread
+from typing import Any
+from typing import Mapping
+
+from jsonschema.exceptions import SchemaError
+from jsonschema.exceptions import ValidationError
+
+from openapi_schema_validator.collectors import ErrorCollector
+from openapi_schema_validator.collectors import ErrorKey
+from openapi_schema_validator.shortcuts import validate
+
+DROP_NEWEST = "newest"
+DROP_OLDEST = "oldest"
+
+_STOP = object()
+
+
+@dataclass(frozen=True)
+class BackgroundValidationStats:
+    submitted: int
+    sampled_out: int
+    dropped: int
+    validated: int
+    invalid: int
+    schema_errors: int
+    exceptions: int
+    errors: dict[str, dict[ErrorKey, int]]
+
+
+class BackgroundValidator:
+    """Validate sampled instances on worker threads, off the request path.
+
+    Submitted instances are put on a bounded queue and validated with
+    ``validate`` by a pool of worker threads. Validation errors are not
+    raised; they are counted per schema name with an ``ErrorCollector``.
+
+    Args:
+        workers: Number of worker threads.
+        max_queue_size: Maximum number of instances waiting for validation.
+        sample_rate: Fraction of submitted instances that are validated.
+        sample_rates: Per schema name overrides of ``sample_rate``.
+        drop_policy: What to drop when the queue is full: the submitted
+            instance (``"newest"``, default) or the longest waiting one
+            (``"oldest"``).
+        **validate_kwargs: Default keyword arguments for ``validate``, for
+            example ``cls`` or ``format_checker``.
+    """
+
+    def __init__(
+        self,
+        *,
+        workers: int = 1,
+        max_queue_size: int = 1000,
+        sample_rate: float = 1.0,
+        sample_rates: Mapping[str, float] | None = None,
+        drop_policy: str = DROP_NEWEST,
+        **validate_kwargs: Any,
+    ) -> None:
+        if drop_policy not in (DROP_NEWEST, DROP_OLDEST):
+            raise ValueError(f"Unknown drop policy {drop_policy!r}")
+
+        self._queue: Queue[Any] = Queue(maxsize=max_queue_size)
+        self._sample_rate = sample_rate
+        self._sample_rates = dict(sample_rates or {})
+        self._drop_policy = drop_policy
+        self._validate_kwargs = validate_kwargs
+        self._random = random.Random()
+        self._lock = Lock()
+        # serializes enqueueing with close(), so that no instance is queued
+        # after the stop sentinels and no sentinel is dropped
+        self._queue_lock = Lock()
+        self._counters: Counter[str] = Counter()
+        self._collectors: dict[str, ErrorCollector] = {}
+        self._closed = False
+        self._threads = [
+            Thread(
+                target=self._run,
+                name=f"openapi-schema-validator-{index}",
+                daemon=True,
+            )
+            for index in range(workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def submit(
+        self,
+        instance: Any,
+        schema: Mapping[str, Any],
+        *,
+        name: str = "",
+        **validate_kwargs: Any,
+    ) -> bool:
+        """Queue an instance for validation without waiting for it.
+
+        Args:
+            instance: Value to validate against ``schema``.
+            schema: OpenAPI schema mapping used for validation.
+            name: Schema name used for sampling and error aggregation.
+            **validate_kwargs: Keyword arguments for ``validate``, merged
+                over the defaults given to the constructor.
+
+        Returns:
+            ``True`` if the instance was queued, ``False`` if it was sampled
+            out or dropped.
+        """
+        rate = self._sample_rates.get(name, self._sample_rate)
+        kwargs = {**self._validate_kwargs, **validate_kwargs}
+        item = (instance, schema, name, kwargs)
+        with self._queue_lock:
+            if self._closed:
+                raise RuntimeError("BackgroundValidator is closed")
+
+            with self._lock:
+                self._counters["submitted"] += 1
+                if rate < 1.0 and self._random.random() >= rate:
+                    self._counters["sampled_out"] += 1
+                    return False
+
+            try:
+                self._queue.put_nowait(item)
+            except Full:
+                if self._drop_policy == DROP_NEWEST:
+                    self._count("dropped")
+                    return False
+                self._put_dropping_oldest(item)
+        return True
+
+    def _put_dropping_oldest(self, item: Any) -> None:
+        while True:
+            try:
+                self._queue.get_nowait()
+            except Empty:
+                pass
+            else:
+                self._queue.task_done()
+                self._count("dropped")
+            try:
+                self._queue.put_nowait(item)
+            except Full:
+                continue
+            return
+
+    def stats(self) -> BackgroundValidationStats:
+        with self._lock:
+            return BackgroundValidationStats(
+                submitted=self._counters["submitted"],
+                sampled_out=self._counters["sampled_out"],
+                dropped=self._counters["dropped"],
+                validated=self._counters["validated"],
+                invalid=self._counters["invalid"],
+                schema_errors=self._counters["schema_errors"],
+                exceptions=self._counters["exceptions"],
+                errors={
+                    name: collector.counts()
+                    for name, collector in self._collectors.items()
+                },
+            )
+
+    def join(self) -> None:
+        """Wait until every queued instance has been validated."""
+        self._queue.join()
+
+    def close(self) -> None:
+        """Validate the queued instances and stop the worker threads."""
+        with self._queue_lock:
+            if self._closed:
+                return
+            self._closed = True
+        # submit() no longer queues anything, so the workers make room for
+        # the blocking puts and nothing can drop the sentinels
+        for _ in self._threads:
+            self._queue.put(_STOP)
+        for thread in self._threads:
+            thread.join()
+
+    def __enter__(self) -> BackgroundValidator:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            self._counters[counter] += 1
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            try:
+                if item is _STOP:
+                    return
+                self._validate(*item)
+            finally:
+                self._queue.task_done()
+
+    def _validate(
+        self,
+        instance: Any,
+        schema: Mapping[str, Any],
+        name: str,
+        kwargs: dict[str, Any],
+    ) -> None:
+        try:
+            validate(instance, schema, **kwargs)
+        except ValidationError as error:
+            with self._lock:
+                self._counters["validated"] += 1
+                self._counters["invalid"] += 1
+                collector = self._collectors.get(name)
+                if collector is None:
+                    collector = self._collectors[name] = ErrorCollector()
+            collector.add([error])
+        except SchemaError:
+            self._count("schema_errors")
+        except Exception:
+            self._count("exceptions")
+        else:
+            self._count("validated")
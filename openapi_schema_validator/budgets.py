@@ -0,0 +1,245 @@
+"""Per-call limits on the cost of validating an instance."""
+
+from __future__ import annotations
+
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from functools import lru_cache
+from time import monotonic
+from typing import Any
+from typing import Iterator
+from typing import cast
+
+from jsonschema.exceptions import ValidationError
+from jsonschema.protocols import Validator
+from jsonschema.validators import extend
+
+# (deadline, timeout) of the enclosing validation call that ends first
+_DEADLINE: ContextVar[tuple[float, float] | None] = ContextVar(
+    "openapi_schema_validator_deadline", default=None
+)
+
+
+class BudgetExceededError(ValidationError):  # type: ignore[misc]
+    """Validation was aborted because it exceeded a ``ValidationBudget``.
+
+    ``limit`` is the name of the exceeded budget field and
+    ``validator_value`` its value.
+    """
+
+    def __init__(self, message: str, limit: str, **kwargs: Any) -> None:
+        super().__init__(message, **kwargs)
+        self.limit = limit
+
+
+@dataclass(frozen=True)
+class ValidationBudget:
+    """Limits on the instances a validator accepts and on validation time.
+
+    Args:
+        max_depth: Maximum nesting of objects and arrays.
+        max_nodes: Maximum number of JSON values (objects, arrays and
+            scalars) in the instance.
+        max_array_length: Maximum number of items in a single array.
+        timeout: Maximum wall-clock time in seconds one validation call may
+            take.
+    """
+
+    max_depth: int | None = None
+    max_nodes: int | None = None
+    max_array_length: int | None = None
+    timeout: float | None = None
+
+    def __post_init__(self) -> None:
+        for name in ("max_depth", "max_nodes", "max_array_length"):
+            value = getattr(self, name)
+            if value is not None and value < 0:
+                raise ValueError(f"{name} must not be negative")
+        if self.timeout is not None and self.timeout <= 0:
+            raise ValueError("timeout must be positive")
+
+    def instance_error(self, instance: Any) -> BudgetExceededError | None:
+        """Check the structural limits of an instance.
+
+        The walk stops at the first exceeded limit, so its cost is bounded
+        by ``max_nodes`` and ``max_array_length`` when they are set.
+        """
+        if (
+            self.max_depth is None
+            and self.max_nodes is None
+            and self.max_array_length is None
+        ):
+            return None
+
+        nodes = 0
+        # paths are linked (token, parent) pairs to keep pushes O(1)
+        stack: list[tuple[Any, int, Any]] = [(instance, 0, None)]
+        while stack:
+            value, depth, path = stack.pop()
+            nodes += 1
+            if self.max_nodes is not None and nodes > self.max_nodes:
+                return self._error(
+                    "max_nodes",
+                    f"Instance has more than {self.max_nodes} values",
+                    instance,
+                    path,
+                )
+
+            if isinstance(value, dict):
+                children: Iterator[tuple[Any, Any]] = iter(value.items())
+            elif isinstance(value, (list, tuple)):
+                if (
+                    self.max_array_length is not None
+                    and len(value) > self.max_array_length
+                ):
+                    return self._error(
+                        "max_array_length",
+                        f"Array has more than {self.max_array_length} items",
+                        value,
+                        path,
+                    )
+                children = enumerate(value)
+            else:
+                continue
+
+            depth += 1
+            if self.max_depth is not None and depth > self.max_depth:
+                return self._error(
+                    "max_depth",
+                    f"Instance is nested deeper than {self.max_depth} levels",
+                    value,
+                    path,
+                )
+            stack.extend(
+                (child, depth, (token, path)) for token, child in children
+            )
+        return None
+
+    def _error(
+        self,
+        limit: str,
+        message: str,
+        instance: Any,
+        path: Any,
+    ) -> BudgetExceededError:
+        tokens: deque[Any] = deque()
+        while path is not None:
+            token, path = path
+            tokens.appendleft(token)
+        return BudgetExceededError(
+            message,
+            limit,
+            validator_value=getattr(self, limit),
+            instance=instance,
+            path=tokens,
+        )
+
+
+def check_deadline() -> None:
+    """Raise ``BudgetExceededError`` if the current timeout has passed.
+
+    The validator classes of this package call it each time they descend
+    into a subschema.
+    """
+    deadline = _DEADLINE.get()
+    if deadline is not None and monotonic() > deadline[0]:
+        raise BudgetExceededError(
+            f"Validation took longer than {deadline[1]}s",
+            "timeout",
+            validator_value=deadline[1],
+        )
+
+
+@contextmanager
+def enforce_budget(budget: ValidationBudget, instance: Any) -> Iterator[None]:
+    """Enforce ``budget`` on validating ``instance`` within the block.
+
+    Checks the structural limits of ``instance`` right away, and with a
+    ``timeout`` starts the deadline ``check_deadline`` compares against.
+    The budget is a per-call value, so no validator class is built for it.
+    """
+    error = budget.instance_error(instance)
+    if error is not None:
+        raise error
+    if budget.timeout is None:
+        yield
+        return
+
+    with _enforce_deadline(monotonic() + budget.timeout, budget.timeout):
+        yield
+
+
+@contextmanager
+def _enforce_deadline(deadline: float, timeout: float) -> Iterator[None]:
+    previous = _DEADLINE.get()
+    if previous is not None and previous[0] <= deadline:
+        yield
+        return
+    token = _DEADLINE.set((deadline, timeout))
+    try:
+        yield
+    finally:
+        _DEADLINE.reset(token)
+
+
+@lru_cache(maxsize=32)
+def build_budgeted_validator(
+    validator_class: Any,
+    budget: ValidationBudget,
+) -> type[Validator]:
+    """Extend a validator class to enforce a validation budget.
+
+    Each ``iter_errors`` call (and so ``validate`` and ``is_valid``) first
+    checks the instance against the structural limits of ``budget``, and
+    with a ``timeout`` checks the deadline before every subschema.
+    Exceeding the budget raises ``BudgetExceededError`` instead of yielding
+    errors.
+
+    One class is built per budget, so pass budgets that vary per call to
+    ``validate`` or ``is_valid`` instead.
+    """
+    # imported lazily, the dispatch module imports this module
+    from openapi_schema_validator._dispatch import plan_keywords
+    from openapi_schema_validator._types import dispatch_types
+
+    budgeted_validator = extend(validator_class)
+    # keep the keyword and type dispatch of the OAS validators
+    plan_keywords(budgeted_validator)
+    dispatch_types(budgeted_validator)
+    iter_errors = budgeted_validator.iter_errors
+
+    def iter_budgeted_errors(
+        self: Any,
+        instance: Any,
+        *args: Any,
+    ) -> Iterator[ValidationError]:
+        error = budget.instance_error(instance)
+        if error is not None:
+            raise error
+        errors = iter_errors(self, instance, *args)
+        if budget.timeout is None:
+            yield from errors
+            return
+
+        # the deadline applies only while an error is computed, not while
+        # the caller holds the suspended generator
+        deadline = monotonic() + budget.timeout
+        while True:
+            with _enforce_deadline(deadline, budget.timeout):
+                error = next(errors, None)
+            if error is None:
+                return
+            yield error
+
+    budgeted_validator.iter_errors = iter_budgeted_errors
+    # keep the memoized reference resolution of the OAS validators
+    budgeted_validator._validate_reference = (
+        validator_class._validate_reference
+    )
+    if hasattr(validator_class, "check_schema"):
+        budgeted_validator.check_schema = classmethod(
+            validator_class.check_schema.__func__
+        )
+    return cast(type[Validator], budgeted_validator)
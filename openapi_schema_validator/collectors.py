@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import sys
+from threading import Lock
+from typing import Any
+from typing import Iterable
+from typing import NamedTuple
+
+from jsonschema.exceptions import ValidationError
+
+
+class ErrorKey(NamedTuple):
+    #: keyword that failed, e.g. ``"type"``
+    keyword: str
+    #: JSON pointer to the failed keyword within the schema
+    schema_path: str
+    #: JSON pointer to the instance location, array indices replaced by
+    #: ``*``
+    instance_path: str
+
+
+def _pointer(parts: Iterable[Any], template: bool = False) -> str:
+    tokens = []
+    for part in parts:
+        if template and isinstance(part, int):
+            tokens.append("*")
+        else:
+            tokens.append(str(part).replace("~", "~0").replace("/", "~1"))
+    return "".join("/" + token for token in tokens)
+
+
+class ErrorCollector:
+    """Count validation errors by keyword, schema path and instance path.
+
+    Only interned keys and counters are kept, never the errors, instances
+    or schemas, so memory use is bounded by the number of distinct keys.
+
+    Args:
+        include_context: Also count the errors in ``error.context``, i.e.
+            the failures of ``anyOf``/``oneOf`` branches.
+        max_keys: Maximum number of distinct keys. Errors with new keys
+            beyond it are only counted in ``overflow``.
+    """
+
+    def __init__(
+        self,
+        *,
+        include_context: bool = False,
+        max_keys: int = 10_000,
+    ) -> None:
+        self.include_context = include_context
+        self.max_keys = max_keys
+        self.overflow = 0
+        self._counts: dict[ErrorKey, int] = {}
+        self._lock = Lock()
+
+    def add(self, errors: Iterable[ValidationError]) -> int:
+        """Count errors, e.g. from ``validator.iter_errors(instance)``.
+
+        Returns:
+            The number of counted errors.
+        """
+        count = 0
+        for error in errors:
+            stack = [error]
+            while stack:
+                error = stack.pop()
+                if self.include_context and error.context:
+                    stack.extend(error.context)
+                self._count(error)
+                count += 1
+        return count
+
+    def counts(self) -> dict[ErrorKey, int]:
+        with self._lock:
+            return dict(self._counts)
+
+    def most_common(self, n: int | None = None) -> list[tuple[ErrorKey, int]]:
+        ordered = sorted(
+            self.counts().items(),
+            key=lambda item: item[1],
+            reverse=True,
+        )
+        return ordered if n is None else ordered[:n]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._counts.clear()
+            self.overflow = 0
+
+    def _count(self, error: ValidationError) -> None:
+        # a plain tuple hashes and compares equal to the ErrorKey built
+        # from it, so existing keys are found without building a new one
+        raw = (
+            str(error.validator),
+            _pointer(error.absolute_schema_path),
+            _pointer(error.absolute_path, template=True),
+        )
+        with self._lock:
+            if raw in self._counts:
+                self._counts[raw] += 1
+            elif len(self._counts) < self.max_keys:
+                key = ErrorKey(*(sys.intern(part) for part in raw))
+                self._counts[key] = 1
+            else:
+                self.overflow += 1
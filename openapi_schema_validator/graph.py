@@ -0,0 +1,263 @@
+"""Schema graphs with references replaced by direct links.
+
+``build_schema_graph`` resolves the ``$ref`` keywords of a schema ahead of
+time, so that validating against the returned graph follows subschemas
+directly instead of resolving URIs and JSON pointers.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+from urllib.parse import urljoin
+
+from jsonschema import _keywords
+from jsonschema.protocols import Validator
+from referencing import Registry
+from referencing.exceptions import Unresolvable
+
+from openapi_schema_validator import _keywords as oas_keywords
+from openapi_schema_validator._specifications import (
+    REGISTRY as OPENAPI_SPECIFICATIONS,
+)
+from openapi_schema_validator.validators import OAS32Validator
+
+_SCHEMA_KEYWORDS = frozenset(
+    [
+        "additionalItems",
+        "additionalProperties",
+        "contains",
+        "contentSchema",
+        "else",
+        "if",
+        "items",
+        "not",
+        "propertyNames",
+        "then",
+        "unevaluatedItems",
+        "unevaluatedProperties",
+    ]
+)
+_SCHEMA_LIST_KEYWORDS = frozenset(
+    ["allOf", "anyOf", "items", "oneOf", "prefixItems"]
+)
+_SCHEMA_MAP_KEYWORDS = frozenset(
+    [
+        "$defs",
+        "definitions",
+        "dependentSchemas",
+        "patternProperties",
+        "properties",
+    ]
+)
+# resolving these depends on the dynamic scope, which links would lose
+_DYNAMIC_KEYWORDS = frozenset(
+    ["$dynamicAnchor", "$dynamicRef", "$recursiveAnchor", "$recursiveRef"]
+)
+# siblings of $ref that a link must not drop
+_IDENTIFYING_KEYWORDS = frozenset(
+    ["$anchor", "$defs", "$id", "$schema", "$vocabulary", "definitions", "id"]
+)
+
+
+class _Dynamic(Exception):
+    """The schema uses dynamic references."""
+
+
+class _NotLinkable(Exception):
+    """A reference inside another resource cannot be linked."""
+
+
+def build_schema_graph(
+    schema: Any,
+    cls: type[Validator] = OAS32Validator,
+    *,
+    registry: Registry | None = None,
+) -> Any:
+    """Return a copy of ``schema`` with references replaced by links.
+
+    A subschema consisting of a ``$ref`` and keywords that do not validate
+    anything is replaced by the subschema the reference resolves to,
+    local or from ``registry``. Subschemas referenced more than once are
+    shared. References back to an enclosing subschema are kept, so the
+    graph has no cycles, as are references that cannot be replaced, such
+    as ``$ref`` next to other validation keywords or references into
+    embedded resources; these are resolved during validation as usual.
+    Schemas using dynamic references are returned unchanged.
+
+    ``schema`` is not modified. Errors from validating against the graph
+    have schema paths without the replaced ``$ref`` segments, and messages
+    quoting a subschema show the linked subschema.
+
+    Args:
+        schema: OpenAPI schema to transform.
+        cls: Validator class the graph is used with. Defaults to
+            ``OAS32Validator``.
+        registry: Registry with resources referenced by ``schema``. Pass
+            the same registry to the validator.
+    """
+    if registry is not None:
+        registry = OPENAPI_SPECIFICATIONS.combine(registry)
+    else:
+        registry = OPENAPI_SPECIFICATIONS
+    validator: Any = cls(schema, registry=registry)
+    builder = _GraphBuilder(validator)
+    try:
+        return builder.root(schema)
+    except _Dynamic:
+        return schema
+
+
+class _GraphBuilder:
+    def __init__(self, validator: Any) -> None:
+        self.validator = validator
+        self._base_uri = validator._resolver._base_uri
+        # copy or link target per (schema object, base URI)
+        self._nodes: dict[tuple[int, str], Any] = {}
+        self._copying: set[tuple[int, str]] = set()
+        self._following: set[int] = set()
+        # nodes added while linking another resource, dropped on failure
+        self._attempt: list[tuple[int, str]] | None = None
+
+    def root(self, schema: Any) -> Any:
+        if not isinstance(schema, dict):
+            return schema
+        return self._copy(schema, self.validator._resolver, root=True)
+
+    def node(self, schema: Any, resolver: Any) -> Any:
+        if not isinstance(schema, dict):
+            return schema
+        if not _DYNAMIC_KEYWORDS.isdisjoint(schema):
+            raise _Dynamic
+        if self.validator.ID_OF(schema):
+            # embedded resources change the base URI of their references
+            if resolver._base_uri != self._base_uri:
+                raise _NotLinkable
+            return schema
+        key = (id(schema), resolver._base_uri)
+        node = self._nodes.get(key)
+        if node is not None:
+            return node
+        if "$ref" in schema and self._linkable(schema):
+            node = self._follow(schema, resolver)
+            if node is not None:
+                self._add(key, node)
+                return node
+        return self._copy(schema, resolver)
+
+    def _add(self, key: tuple[int, str], node: Any) -> None:
+        self._nodes[key] = node
+        if self._attempt is not None:
+            self._attempt.append(key)
+
+    def _copy(
+        self,
+        schema: dict[str, Any],
+        resolver: Any,
+        root: bool = False,
+    ) -> dict[str, Any]:
+        key = (id(schema), resolver._base_uri)
+        copy: dict[str, Any] = {}
+        self._add(key, copy)
+        self._copying.add(key)
+        try:
+            for keyword, value in schema.items():
+                if root and keyword == "components":
+                    copy[keyword] = self._components(value, resolver)
+                else:
+                    copy[keyword] = self._subschemas(keyword, value, resolver)
+        finally:
+            self._copying.discard(key)
+        return copy
+
+    def _components(self, components: Any, resolver: Any) -> Any:
+        # OpenAPI documents keep the targets of discriminator mappings here
+        if not isinstance(components, dict) or not isinstance(
+            components.get("schemas"), dict
+        ):
+            return components
+        return dict(
+            components,
+            schemas={
+                name: self.node(subschema, resolver)
+                for name, subschema in components["schemas"].items()
+            },
+        )
+
+    def _subschemas(self, keyword: str, value: Any, resolver: Any) -> Any:
+        if keyword == "$ref" and resolver._base_uri != self._base_uri:
+            # kept references would resolve against the wrong base URI
+            raise _NotLinkable
+        if keyword in _SCHEMA_MAP_KEYWORDS and isinstance(value, dict):
+            if keyword in self.validator.VALIDATORS or keyword in (
+                "$defs",
+                "definitions",
+            ):
+                return {
+                    name: self.node(subschema, resolver)
+                    for name, subschema in value.items()
+                }
+        if keyword not in self.validator.VALIDATORS:
+            return value
+        if keyword in _SCHEMA_LIST_KEYWORDS and isinstance(value, list):
+            return [self.node(subschema, resolver) for subschema in value]
+        if keyword in _SCHEMA_KEYWORDS:
+            return self.node(value, resolver)
+        return value
+
+    def _linkable(self, schema: dict[str, Any]) -> bool:
+        known = self.validator.VALIDATORS
+        if known.get("$ref") is not _keywords.ref:
+            return False
+        return all(
+            keyword == "$ref"
+            or keyword not in _IDENTIFYING_KEYWORDS
+            and known.get(keyword, oas_keywords.not_implemented)
+            is oas_keywords.not_implemented
+            for keyword in schema
+        )
+
+    def _follow(self, schema: dict[str, Any], resolver: Any) -> Any:
+        if id(schema) in self._following:
+            # a reference cycle without any subschema in between
+            return None
+        try:
+            resolved = resolver.lookup(schema["$ref"])
+        except Unresolvable:
+            return None
+        target = resolved.contents
+        target_resolver = resolved.resolver
+
+        if isinstance(target, dict):
+            if (id(target), target_resolver._base_uri) in self._copying:
+                # keep back-edges as references, so the graph stays acyclic
+                return None
+            target_id = self.validator.ID_OF(target)
+            if target_id:
+                # a linked resource gets its base URI from its own id
+                if urljoin(resolver._base_uri, target_id) != urljoin(
+                    target_resolver._base_uri, target_id
+                ):
+                    return None
+                return target
+
+        self._following.add(id(schema))
+        try:
+            if (
+                target_resolver._base_uri == self._base_uri
+                or self._attempt is not None
+            ):
+                return self.node(target, target_resolver)
+            return self._link_resource(target, target_resolver)
+        finally:
+            self._following.discard(id(schema))
+
+    def _link_resource(self, target: Any, resolver: Any) -> Any:
+        self._attempt = []
+        try:
+            return self.node(target, resolver)
+        except _NotLinkable:
+            for key in self._attempt:
+                self._nodes.pop(key, None)
+            return None
+        finally:
+            self._attempt = None
@@ -0,0 +1,132 @@
+"""OpenAPI 3.0 schemas rewritten in the OpenAPI 3.1 style.
+
+``normalize_oas30_schema`` rewrites the OpenAPI 3.0 specific keywords of a
+schema into their OpenAPI 3.1 equivalents once, so that OpenAPI 3.0
+schemas are validated by the same keyword implementations as OpenAPI 3.1
+ones, with ``OAS30NormalizedValidator``.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from openapi_schema_validator import _keywords as oas_keywords
+from openapi_schema_validator.validators import OAS30_VALIDATORS
+from openapi_schema_validator.validators import OAS30NormalizedValidator
+
+_SCHEMA_KEYWORDS = frozenset(["additionalProperties", "items", "not"])
+_SCHEMA_LIST_KEYWORDS = frozenset(["allOf", "anyOf", "oneOf"])
+_SCHEMA_MAP_KEYWORDS = frozenset(["$defs", "definitions", "properties"])
+# OpenAPI 3.1 keywords that OpenAPI 3.0 does not validate
+_IGNORED_KEYWORDS = frozenset(
+    keyword
+    for keyword, implementation in OAS30NormalizedValidator.VALIDATORS.items()
+    if implementation is not oas_keywords.not_implemented
+    and keyword not in OAS30_VALIDATORS
+    # the boolean 3.0 bounds are rewritten instead
+    and keyword not in ("exclusiveMaximum", "exclusiveMinimum")
+) | frozenset(["$anchor", "$dynamicAnchor", "$id", "$schema", "$vocabulary"])
+
+
+def normalize_oas30_schema(schema: Any) -> Any:
+    """Return an OpenAPI 3.1 style copy of an OpenAPI 3.0 ``schema``.
+
+    ``OAS30NormalizedValidator`` accepts the same instances for the copy as
+    ``OAS30Validator`` for ``schema``, except for ``bytes`` instances of
+    ``format: binary`` strings, which it rejects like
+    ``OAS30StrictValidator``. Errors are reported at the same instance
+    paths, with the messages and schema paths of the OpenAPI 3.1 keywords.
+
+    Schema objects are rewritten wherever OpenAPI 3.0 keywords validate
+    them, as well as under ``definitions``, ``$defs`` and the
+    ``components/schemas`` of the root, where local references point to:
+
+    * ``nullable: true`` adds ``"null"`` to ``type``
+    * boolean ``exclusiveMinimum`` and ``exclusiveMaximum`` become the
+      numeric bounds of OpenAPI 3.1
+    * ``example`` becomes a single item of ``examples``
+    * an ``id`` becomes the ``$anchor`` or ``$id`` it identifies, so that
+      references resolve against the same base URIs; like in OpenAPI 3.0,
+      the URI of an ``id`` next to a ``$ref`` is ignored
+    * OpenAPI 3.1 keywords that OpenAPI 3.0 ignores, such as ``const`` or
+      ``$id``, are dropped; ``patternProperties`` keep only their patterns,
+      which still exempt properties from ``additionalProperties``
+
+    ``schema`` is not modified.
+
+    Args:
+        schema: OpenAPI 3.0 schema to rewrite.
+    """
+    normalizer = _Normalizer()
+    normalized = normalizer.schema(schema)
+    if isinstance(schema, dict) and isinstance(schema.get("components"), dict):
+        normalized["components"] = normalizer.components(schema["components"])
+    return normalized
+
+
+class _Normalizer:
+    def __init__(self) -> None:
+        # copies by schema object, so shared subschemas stay shared
+        self._copies: dict[int, Any] = {}
+
+    def components(self, components: dict[str, Any]) -> dict[str, Any]:
+        schemas = components.get("schemas")
+        if not isinstance(schemas, dict):
+            return components
+        return dict(components, schemas=self.schemas(schemas))
+
+    def schemas(self, schemas: dict[str, Any]) -> dict[str, Any]:
+        return {name: self.schema(value) for name, value in schemas.items()}
+
+    def schema(self, schema: Any) -> Any:
+        if not isinstance(schema, dict):
+            return schema
+        copy = self._copies.get(id(schema))
+        if copy is None:
+            copy = self._copies[id(schema)] = self._normalize(schema)
+        return copy
+
+    def _normalize(self, schema: dict[str, Any]) -> dict[str, Any]:
+        normalized: dict[str, Any] = {}
+        for keyword, value in schema.items():
+            if keyword == "patternProperties" and isinstance(value, dict):
+                normalized[keyword] = dict.fromkeys(value, True)
+            elif keyword in _IGNORED_KEYWORDS:
+                continue
+            elif keyword in _SCHEMA_KEYWORDS:
+                normalized[keyword] = self.schema(value)
+            elif keyword in _SCHEMA_LIST_KEYWORDS and isinstance(value, list):
+                normalized[keyword] = [self.schema(each) for each in value]
+            elif keyword in _SCHEMA_MAP_KEYWORDS and isinstance(value, dict):
+                normalized[keyword] = self.schemas(value)
+            else:
+                normalized[keyword] = value
+
+        if normalized.pop("nullable", False) is True and isinstance(
+            normalized.get("type"), str
+        ):
+            normalized["type"] = [normalized["type"], "null"]
+
+        for bound, exclusive in (
+            ("minimum", "exclusiveMinimum"),
+            ("maximum", "exclusiveMaximum"),
+        ):
+            # the 3.0 bounds are only exclusive next to the bound itself
+            if normalized.pop(exclusive, False) and bound in normalized:
+                normalized[exclusive] = normalized.pop(bound)
+
+        if "example" in normalized:
+            example = normalized.pop("example")
+            normalized.setdefault("examples", [example])
+
+        # identifies what it does in OpenAPI 3.0, i.e. JSON Schema draft 4
+        identifier = normalized.pop("id", None)
+        if isinstance(identifier, str):
+            if identifier.startswith("#"):
+                normalized["$anchor"] = identifier[1:]
+            # draft 4 ignores the URI next to a $ref, 2020-12 would not
+            elif "$ref" not in normalized:
+                normalized["$id"] = identifier
+        elif identifier is not None:
+            normalized["id"] = identifier
+        return normalized
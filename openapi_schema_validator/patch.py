@@ -0,0 +1,531 @@
+"""Incremental revalidation of documents changed by JSON Patch (RFC 6902)."""
+
+from __future__ import annotations
+
+import re
+from copy import deepcopy
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Any
+from typing import Iterator
+from typing import Mapping
+from typing import Sequence
+
+from jsonschema import _keywords
+from jsonschema._utils import equal
+from jsonschema.exceptions import ValidationError
+from jsonschema.exceptions import best_match
+from referencing.exceptions import Unresolvable
+
+from openapi_schema_validator import _keywords as oas_keywords
+from openapi_schema_validator._regex import has_safe_regex
+from openapi_schema_validator._regex import search_property
+from openapi_schema_validator._regex import unsafe_regex_reason
+
+Path = tuple[Any, ...]
+
+# Keywords that apply subschemas to child locations; they are followed
+# along the patched paths only and skipped at untouched siblings.
+_CHILD_KEYWORDS = {
+    "properties": (_keywords.properties,),
+    "patternProperties": (
+        _keywords.patternProperties,
+        oas_keywords.patternProperties,
+    ),
+    "additionalProperties": (
+        _keywords.additionalProperties,
+        oas_keywords.additionalProperties,
+        oas_keywords.additionalProperties_draft202012,
+    ),
+    "items": (
+        _keywords.items,
+        oas_keywords.items,
+        oas_keywords.items_draft202012,
+    ),
+    "prefixItems": (_keywords.prefixItems,),
+}
+# Keywords that apply subschemas to the same location; their subschemas
+# are walked like the schema containing them.
+_IN_PLACE_KEYWORDS = {
+    "allOf": (_keywords.allOf, oas_keywords.allOf),
+    "$ref": (_keywords.ref,),
+}
+# Keywords whose outcome may depend on any part of the instance; schemas
+# using them are fully revalidated at the patched location.
+_WHOLE_INSTANCE_KEYWORDS = frozenset(
+    [
+        "anyOf",
+        "oneOf",
+        "not",
+        "if",
+        "dependentSchemas",
+        "dependencies",
+        "contains",
+        "additionalItems",
+        "unevaluatedItems",
+        "unevaluatedProperties",
+        "$dynamicRef",
+        "$recursiveRef",
+    ]
+)
+
+
+class PatchError(ValueError):
+    pass
+
+
+@dataclass
+class PatchChanges:
+    """Instance locations changed by a patch, as paths of tokens."""
+
+    #: locations whose value was added or replaced
+    values: set[Path] = field(default_factory=set)
+    #: objects and arrays whose members were added or removed
+    containers: set[Path] = field(default_factory=set)
+    #: arrays whose items moved to other indices
+    shifted: set[Path] = field(default_factory=set)
+
+
+def apply_patch(
+    document: Any,
+    patch: Sequence[Mapping[str, Any]],
+) -> tuple[Any, PatchChanges]:
+    """Apply a JSON Patch without modifying ``document``.
+
+    Only the objects and arrays on the patched paths are copied; the
+    patched document shares all other values with ``document``.
+
+    Returns:
+        The patched document and the locations it changed.
+
+    Raises:
+        PatchError: If an operation is malformed, targets a missing location
+            or a ``test`` operation fails.
+    """
+    patcher = _Patcher(document)
+    for operation in patch:
+        patcher.apply(operation)
+    return patcher.document, patcher.changes
+
+
+def iter_patch_errors(
+    validator: Any,
+    document: Any,
+    changes: PatchChanges,
+) -> Iterator[ValidationError]:
+    """Revalidate the locations of a patched document that changed.
+
+    The document before the patch must have been valid. Changed values are
+    validated against every subschema that applies to them, and the schemas
+    of their ancestors are re-checked only for keywords that do not descend
+    into other members, such as ``required`` or ``maxItems``. Schemas that
+    combine subschemas in other ways than ``allOf`` (``anyOf``, ``oneOf``,
+    ``not``, ``if``, ...) are revalidated as a whole.
+    """
+    trie = _Trie()
+    for path in changes.values:
+        trie.insert(path).value = True
+    for path in changes.containers:
+        trie.insert(path)
+    for path in changes.shifted:
+        trie.insert(path).shifted = True
+
+    frontier = [(validator, validator.schema, ())]
+    yield from _revalidate(trie, frontier, document, ())
+
+
+def validate_patch(
+    validator: Any,
+    document: Any,
+    patch: Sequence[Mapping[str, Any]],
+) -> Any:
+    """Apply a JSON Patch to a valid document and revalidate the changes.
+
+    Args:
+        validator: Validator the document was validated with.
+        document: Valid document; it is not modified.
+        patch: JSON Patch operations.
+
+    Returns:
+        The patched document.
+
+    Raises:
+        PatchError: If the patch cannot be applied.
+        jsonschema.exceptions.ValidationError: If the patched document is
+            invalid.
+    """
+    patched, changes = apply_patch(document, patch)
+    error = best_match(iter_patch_errors(validator, patched, changes))
+    if error is not None:
+        raise error
+    return patched
+
+
+class _Trie:
+    __slots__ = ("children", "value", "shifted")
+
+    def __init__(self) -> None:
+        self.children: dict[Any, _Trie] = {}
+        self.value = False
+        self.shifted = False
+
+    def insert(self, path: Path) -> _Trie:
+        node = self
+        for token in path:
+            node = node.children.setdefault(token, _Trie())
+        return node
+
+
+def _revalidate(
+    trie: _Trie,
+    frontier: list[tuple[Any, Any, Path]],
+    instance: Any,
+    path: Path,
+) -> Iterator[ValidationError]:
+    if trie.value:
+        for validator, schema, schema_path in frontier:
+            errors = validator.descend(instance, schema)
+            yield from _prefixed(errors, path, schema_path)
+        return
+
+    schemas = []
+    for validator, schema, schema_path in _expand(frontier):
+        whole = not isinstance(schema, Mapping) or _needs_whole_instance(
+            validator, schema, trie.shifted
+        )
+        if whole:
+            errors = validator.descend(instance, schema)
+            yield from _prefixed(errors, path, schema_path)
+        else:
+            yield from _check_members(
+                validator, schema, instance, path, schema_path
+            )
+            schemas.append((validator, schema, schema_path))
+
+    for token, child in trie.children.items():
+        child_frontier = [
+            (validator, subschema, schema_path + subschema_path)
+            for validator, schema, schema_path in schemas
+            for subschema, subschema_path in _child_schemas(
+                validator, schema, instance, token
+            )
+        ]
+        yield from _revalidate(
+            child, child_frontier, instance[token], path + (token,)
+        )
+
+
+def _expand(
+    frontier: list[tuple[Any, Any, Path]],
+) -> Iterator[tuple[Any, Any, Path]]:
+    """Yield the schemas of a frontier with ``$ref`` and ``allOf`` inlined."""
+    stack = list(reversed(frontier))
+    seen: set[int] = set()
+    while stack:
+        validator, schema, schema_path = stack.pop()
+        if schema is True or id(schema) in seen:
+            continue
+        seen.add(id(schema))
+        yield validator, schema, schema_path
+        if not isinstance(schema, Mapping) or _needs_whole_instance(
+            validator, schema, False
+        ):
+            continue
+
+        if "$ref" in schema:
+            try:
+                resolved = validator._resolver.lookup(schema["$ref"])
+            except Unresolvable:
+                # left to the $ref keyword, which reports it
+                pass
+            else:
+                stack.append(
+                    (
+                        validator.evolve(
+                            schema=resolved.contents,
+                            _resolver=resolved.resolver,
+                        ),
+                        resolved.contents,
+                        schema_path,
+                    )
+                )
+        for index, subschema in reversed(
+            list(enumerate(schema.get("allOf", ())))
+        ):
+            stack.append(
+                (validator, subschema, schema_path + ("allOf", index))
+            )
+
+
+def _needs_whole_instance(
+    validator: Any,
+    schema: Mapping[str, Any],
+    shifted: bool,
+) -> bool:
+    if validator.ID_OF(schema):
+        # subschemas would be resolved against another base URI
+        return True
+    for keyword in schema:
+        implementation = validator.VALIDATORS.get(keyword)
+        if implementation is None or implementation is (
+            oas_keywords.not_implemented
+        ):
+            continue
+        if keyword in _WHOLE_INSTANCE_KEYWORDS:
+            return True
+        known = _CHILD_KEYWORDS.get(keyword) or _IN_PLACE_KEYWORDS.get(keyword)
+        if known is not None and implementation not in known:
+            return True
+    if "allOf" in schema and "discriminator" in schema:
+        return True
+    patterns = schema.get("patternProperties")
+    if (
+        has_safe_regex()
+        and isinstance(patterns, Mapping)
+        and any(map(unsafe_regex_reason, patterns))
+    ):
+        # left to the keywords, which report the pattern
+        return True
+    if isinstance(schema.get("items"), list):
+        return True
+    # items matched by position move to other subschemas
+    return shifted and "prefixItems" in schema
+
+
+def _check_members(
+    validator: Any,
+    schema: Mapping[str, Any],
+    instance: Any,
+    path: Path,
+    schema_path: Path,
+) -> Iterator[ValidationError]:
+    """Check the keywords of a schema that do not descend into members."""
+    for keyword, value in schema.items():
+        implementation = validator.VALIDATORS.get(keyword)
+        if implementation is None or keyword in _IN_PLACE_KEYWORDS:
+            continue
+        if keyword in _CHILD_KEYWORDS and not isinstance(value, bool):
+            continue
+        for error in implementation(validator, value, instance, schema) or ():
+            error._set(
+                validator=keyword,
+                validator_value=value,
+                instance=instance,
+                schema=schema,
+                type_checker=validator.TYPE_CHECKER,
+            )
+            error.schema_path.appendleft(keyword)
+            error.path.extendleft(reversed(path))
+            error.schema_path.extendleft(reversed(schema_path))
+            yield error
+
+
+def _child_schemas(
+    validator: Any,
+    schema: Mapping[str, Any],
+    instance: Any,
+    token: Any,
+) -> Iterator[tuple[Any, Path]]:
+    if isinstance(token, int):
+        if not validator.is_type(instance, "array"):
+            return
+        prefix_items = schema.get("prefixItems", ())
+        if token < len(prefix_items):
+            yield prefix_items[token], ("prefixItems", token)
+        elif isinstance(schema.get("items"), Mapping):
+            yield schema["items"], ("items",)
+        return
+
+    if not validator.is_type(instance, "object"):
+        return
+    properties = schema.get("properties", {})
+    if token in properties:
+        yield properties[token], ("properties", token)
+    matched = False
+    if "patternProperties" in validator.VALIDATORS:
+        for pattern, subschema in schema.get("patternProperties", {}).items():
+            if search_property(pattern, token):
+                matched = True
+                yield subschema, ("patternProperties", pattern)
+    additional = schema.get("additionalProperties")
+    if isinstance(additional, Mapping) and token not in properties:
+        if not matched:
+            yield additional, ("additionalProperties",)
+
+
+def _prefixed(
+    errors: Iterator[ValidationError],
+    path: Path,
+    schema_path: Path,
+) -> Iterator[ValidationError]:
+    for error in errors:
+        error.path.extendleft(reversed(path))
+        error.schema_path.extendleft(reversed(schema_path))
+        yield error
+
+
+class _Patcher:
+    def __init__(self, document: Any) -> None:
+        self.document = document
+        self.changes = PatchChanges()
+        self._copied: set[int] = set()
+
+    def apply(self, operation: Mapping[str, Any]) -> None:
+        op = operation.get("op")
+        path = self._parse(operation, "path")
+        if op == "add":
+            self._add(path, deepcopy(self._value(operation)))
+        elif op == "remove":
+            self._remove(path)
+        elif op == "replace":
+            if path:
+                self._remove(path)
+            self._add(path, deepcopy(self._value(operation)))
+        elif op == "move":
+            source = self._parse(operation, "from")
+            if path[: len(source)] == source and path != source:
+                raise PatchError(f"Cannot move {source!r} into itself")
+            value = self._get(source)
+            self._remove(source)
+            self._add(path, value)
+        elif op == "copy":
+            source = self._parse(operation, "from")
+            self._add(path, deepcopy(self._get(source)))
+        elif op == "test":
+            # JSON values: booleans are not numbers
+            if not equal(self._get(path), self._value(operation)):
+                raise PatchError(f"Test operation failed at {path!r}")
+        else:
+            raise PatchError(f"Unknown patch operation {op!r}")
+
+    def _value(self, operation: Mapping[str, Any]) -> Any:
+        if "value" not in operation:
+            raise PatchError(f"Missing 'value' in {operation!r}")
+        return operation["value"]
+
+    def _parse(self, operation: Mapping[str, Any], member: str) -> list[str]:
+        pointer = operation.get(member)
+        if not isinstance(pointer, str) or (
+            pointer and not pointer.startswith("/")
+        ):
+            raise PatchError(f"Invalid JSON pointer {pointer!r}")
+        if not pointer:
+            return []
+        return [
+            token.replace("~1", "/").replace("~0", "~")
+            for token in pointer[1:].split("/")
+        ]
+
+    def _resolve(self, tokens: list[str], writable: bool) -> tuple[Any, Path]:
+        """Return the container holding ``tokens`` and its concrete path."""
+        container = self.document
+        if writable:
+            container = self.document = self._writable(self.document)
+        path: Path = ()
+        for token in tokens[:-1]:
+            key = self._key(container, token)
+            try:
+                child = container[key]
+            except (KeyError, IndexError, TypeError):
+                raise PatchError(f"Path {tokens!r} does not exist") from None
+            if writable:
+                child = container[key] = self._writable(child)
+            container = child
+            path += (key,)
+        return container, path
+
+    def _writable(self, value: Any) -> Any:
+        if id(value) in self._copied or not isinstance(value, (dict, list)):
+            return value
+        value = value.copy()
+        self._copied.add(id(value))
+        return value
+
+    def _key(self, container: Any, token: str, append: bool = False) -> Any:
+        if isinstance(container, list):
+            if append and token == "-":
+                return len(container)
+            if not re.fullmatch(r"0|[1-9][0-9]*", token):
+                raise PatchError(f"Invalid array index {token!r}")
+            return int(token)
+        if isinstance(container, dict):
+            return token
+        raise PatchError(f"Cannot index {type(container).__name__}")
+
+    def _get(self, tokens: list[str]) -> Any:
+        if not tokens:
+            return self.document
+        container, _ = self._resolve(tokens, writable=False)
+        try:
+            return container[self._key(container, tokens[-1])]
+        except (KeyError, IndexError):
+            raise PatchError(f"Path {tokens!r} does not exist") from None
+
+    def _add(self, tokens: list[str], value: Any) -> None:
+        if not tokens:
+            self.document = value
+            self._replaced(())
+            return
+        container, parent = self._resolve(tokens, writable=True)
+        key = self._key(container, tokens[-1], append=True)
+        if isinstance(container, list):
+            if key > len(container):
+                raise PatchError(f"Index {key} is out of range")
+            container.insert(key, value)
+            self._shift(parent, key, 1)
+            self.changes.containers.add(parent)
+        else:
+            if key not in container:
+                self.changes.containers.add(parent)
+            container[key] = value
+        self._replaced(parent + (key,))
+
+    def _remove(self, tokens: list[str]) -> None:
+        if not tokens:
+            raise PatchError("Cannot remove the document root")
+        container, parent = self._resolve(tokens, writable=True)
+        key = self._key(container, tokens[-1])
+        try:
+            del container[key]
+        except (KeyError, IndexError):
+            raise PatchError(f"Path {tokens!r} does not exist") from None
+        self._forget(parent + (key,))
+        if isinstance(container, list):
+            self._shift(parent, key + 1, -1)
+        self.changes.containers.add(parent)
+
+    def _replaced(self, path: Path) -> None:
+        self._forget(path)
+        self.changes.values.add(path)
+
+    def _forget(self, path: Path) -> None:
+        for paths in (
+            self.changes.values,
+            self.changes.containers,
+            self.changes.shifted,
+        ):
+            for changed in list(paths):
+                if changed[: len(path)] == path:
+                    paths.discard(changed)
+
+    def _shift(self, array: Path, start: int, offset: int) -> None:
+        """Move recorded paths after ``start`` in ``array`` by ``offset``."""
+        depth = len(array)
+        for paths in (
+            self.changes.values,
+            self.changes.containers,
+            self.changes.shifted,
+        ):
+            moved = [
+                changed
+                for changed in paths
+                if len(changed) > depth
+                and changed[:depth] == array
+                and changed[depth] >= start
+            ]
+            paths.difference_update(moved)
+            paths.update(
+                array + (changed[depth] + offset,) + changed[depth + 1 :]
+                for changed in moved
+            )
+        self.changes.shifted.add(array)
@@ -12,6 +12,11 @@ class OpenAPISchemaValidatorSettings(BaseSettings):
     )
 
     compiled_validator_cache_max_size: int = Field(default=128, ge=0)
+    validation_result_cache_max_size: int = Field(default=0, ge=0)
+    validation_result_cache_ttl: float | None = Field(default=None, gt=0)
+    async_offload_node_threshold: int = Field(default=10_000, ge=0)
+    format_check_cache_max_value_length: int = Field(default=1024, ge=0)
+    safe_regex: bool = False
 
 
 @lru_cache(maxsize=1)
@@ -1,6 +1,13 @@
 from __future__ import annotations
 
+import asyncio
+import gc
+import json
+from concurrent.futures import Executor
+from os import PathLike
 from typing import Any
+from typing import Hashable
+from typing import Iterable
 from typing import Mapping
 from typing import cast
 
@@ -8,9 +15,22 @@ from jsonschema.exceptions import best_match
 from jsonschema.protocols import Validator
 from referencing import Registry
 
+from openapi_schema_validator._artefacts import ArtefactEntry
+from openapi_schema_validator._artefacts import dump_artefact
+from openapi_schema_validator._artefacts import load_artefact
+from openapi_schema_validator._artefacts import validator_name
+from openapi_schema_validator._caches import CacheStats
+from openapi_schema_validator._caches import ResultCache
 from openapi_schema_validator._caches import ValidatorCache
+from openapi_schema_validator._caches import copy_error
+from openapi_schema_validator._caches import instance_digest
 from openapi_schema_validator._dialects import OAS31_BASE_DIALECT_ID
 from openapi_schema_validator._dialects import OAS32_BASE_DIALECT_ID
+from openapi_schema_validator._instances import exceeds_node_count
+from openapi_schema_validator._json import root_type_mismatch
+from openapi_schema_validator.budgets import ValidationBudget
+from openapi_schema_validator.budgets import enforce_budget
+from openapi_schema_validator.settings import get_settings
 from openapi_schema_validator.validators import OAS32Validator
 from openapi_schema_validator.validators import (
     build_enforce_properties_required_validator,
@@ -19,6 +39,7 @@ from openapi_schema_validator.validators import check_openapi_schema
 
 _LOCAL_ONLY_REGISTRY = Registry()
 _VALIDATOR_CACHE = ValidatorCache()
+_RESULT_CACHE = ResultCache()
 
 
 def _check_schema(
@@ -38,6 +59,57 @@ def _check_schema(
         cls.check_schema(schema)
 
 
+def _get_validator(
+    schema: Mapping[str, Any],
+    cls: type[Validator],
+    args: tuple[Any, ...],
+    kwargs: Mapping[str, Any],
+    *,
+    allow_remote_references: bool,
+    check_schema: bool,
+    enforce_properties_required: bool,
+    schema_trusted: bool = False,
+) -> tuple[Hashable, Any]:
+    if enforce_properties_required:
+        cls = build_enforce_properties_required_validator(cls)  # type: ignore[arg-type]
+
+    schema_dict = cast(dict[str, Any], schema)
+
+    validator_kwargs = dict(kwargs)
+    if not allow_remote_references:
+        validator_kwargs.setdefault("registry", _LOCAL_ONLY_REGISTRY)
+
+    key = _VALIDATOR_CACHE.build_key(
+        schema=schema_dict,
+        cls=cls,
+        args=args,
+        kwargs=validator_kwargs,
+        allow_remote_references=allow_remote_references,
+    )
+
+    cached = _VALIDATOR_CACHE.get(key)
+
+    if cached is None:
+        if check_schema and not schema_trusted:
+            _check_schema(cls, schema_dict)
+
+        validator = cls(schema_dict, *args, **validator_kwargs)
+        cached = _VALIDATOR_CACHE.set(
+            key,
+            validator=validator,
+            schema_checked=check_schema or schema_trusted,
+        )
+    elif schema_trusted and not cached.schema_checked:
+        _VALIDATOR_CACHE.mark_schema_checked(key)
+    elif check_schema and not cached.schema_checked:
+        _check_schema(cls, schema_dict)
+        _VALIDATOR_CACHE.mark_schema_checked(key)
+    else:
+        _VALIDATOR_CACHE.touch(key)
+
+    return key, cached.validator.evolve(schema=schema_dict)
+
+
 def validate(
     instance: Any,
     schema: Mapping[str, Any],
@@ -46,6 +118,7 @@ def validate(
     allow_remote_references: bool = False,
     check_schema: bool = True,
     enforce_properties_required: bool = False,
+    budget: ValidationBudget | None = None,
     **kwargs: Any,
 ) -> None:
     """
@@ -74,6 +147,8 @@ def validate(
             present in the instance (except those marked as ``writeOnly`` or
             ``readOnly`` where appropriate), regardless of the schema's
             ``required`` array. Defaults to ``False``.
+        budget: Optional ``ValidationBudget`` limiting the depth, size and
+            validation time of ``instance``.
         **kwargs: Keyword arguments forwarded to ``cls`` constructor
             (for example ``registry`` and ``format_checker``). If omitted,
             a local-only empty ``Registry`` is used to avoid implicit remote
@@ -82,48 +157,381 @@ def validate(
     Raises:
         jsonschema.exceptions.SchemaError: If ``schema`` is invalid.
         jsonschema.exceptions.ValidationError: If ``instance`` is invalid.
+        openapi_schema_validator.budgets.BudgetExceededError: If validating
+            ``instance`` exceeds ``budget``.
     """
-    if enforce_properties_required:
-        cls = build_enforce_properties_required_validator(cls)  # type: ignore[arg-type]
+    key, validator = _get_validator(
+        schema,
+        cls,
+        args,
+        kwargs,
+        allow_remote_references=allow_remote_references,
+        check_schema=check_schema,
+        enforce_properties_required=enforce_properties_required,
+    )
 
-    schema_dict = cast(dict[str, Any], schema)
+    if budget is None:
+        _validate_instance(key, validator, instance)
+        return
+    with enforce_budget(budget, instance):
+        _validate_instance(key, validator, instance)
 
-    validator_kwargs = kwargs.copy()
-    if not allow_remote_references:
-        validator_kwargs.setdefault("registry", _LOCAL_ONLY_REGISTRY)
 
-    key = _VALIDATOR_CACHE.build_key(
-        schema=schema_dict,
-        cls=cls,
-        args=args,
-        kwargs=validator_kwargs,
+def is_valid(
+    instance: Any,
+    schema: Mapping[str, Any],
+    cls: type[Validator] = OAS32Validator,
+    *args: Any,
+    allow_remote_references: bool = False,
+    check_schema: bool = True,
+    enforce_properties_required: bool = False,
+    budget: ValidationBudget | None = None,
+    **kwargs: Any,
+) -> bool:
+    """
+    Check whether an instance is valid against a given schema.
+
+    Takes the same arguments as ``validate`` and shares its caches, but
+    only answers yes or no: validation stops at the first failure and no
+    error describing it is built, which makes rejecting invalid instances
+    much cheaper.
+
+    Raises:
+        jsonschema.exceptions.SchemaError: If ``schema`` is invalid.
+        openapi_schema_validator.budgets.BudgetExceededError: If validating
+            ``instance`` exceeds ``budget``.
+    """
+    key, validator = _get_validator(
+        schema,
+        cls,
+        args,
+        kwargs,
         allow_remote_references=allow_remote_references,
+        check_schema=check_schema,
+        enforce_properties_required=enforce_properties_required,
     )
 
-    cached = _VALIDATOR_CACHE.get(key)
+    if budget is None:
+        return _is_valid_instance(key, validator, instance)
+    with enforce_budget(budget, instance):
+        return _is_valid_instance(key, validator, instance)
 
-    if cached is None:
-        if check_schema:
-            _check_schema(cls, schema_dict)
 
-        validator = cls(schema_dict, *args, **validator_kwargs)
-        cached = _VALIDATOR_CACHE.set(
-            key,
-            validator=validator,
-            schema_checked=check_schema,
-        )
-    elif check_schema and not cached.schema_checked:
-        _check_schema(cls, schema_dict)
-        _VALIDATOR_CACHE.mark_schema_checked(key)
-    else:
-        _VALIDATOR_CACHE.touch(key)
+def validate_json(
+    data: bytes | bytearray | memoryview | str,
+    schema: Mapping[str, Any],
+    cls: type[Validator] = OAS32Validator,
+    *args: Any,
+    allow_remote_references: bool = False,
+    check_schema: bool = True,
+    enforce_properties_required: bool = False,
+    **kwargs: Any,
+) -> Any:
+    """
+    Decode a JSON document and validate it against a given schema.
+
+    Behaves like ``validate(json.loads(data), schema, ...)``. A document
+    whose root value does not match the schema's root ``type`` is rejected
+    with the same error as soon as it is decoded, without freezing it for
+    the result cache.
+
+    Args:
+        data: JSON document as ``bytes``, ``bytearray``, ``memoryview`` or
+            ``str``.
+        schema: OpenAPI schema mapping used for validation.
+        cls: Validator class to use. Defaults to ``OAS32Validator``.
+        *args: Positional arguments forwarded to ``cls`` constructor.
+        allow_remote_references: Same as for ``validate``.
+        check_schema: Same as for ``validate``.
+        enforce_properties_required: Same as for ``validate``.
+        **kwargs: Keyword arguments forwarded to ``cls`` constructor.
+
+    Returns:
+        The decoded instance, so callers do not need to decode it again.
+
+    Raises:
+        json.JSONDecodeError: If ``data`` is not a valid JSON document.
+        jsonschema.exceptions.SchemaError: If ``schema`` is invalid.
+        jsonschema.exceptions.ValidationError: If the instance is invalid.
+    """
+    key, validator = _get_validator(
+        schema,
+        cls,
+        args,
+        kwargs,
+        allow_remote_references=allow_remote_references,
+        check_schema=check_schema,
+        enforce_properties_required=enforce_properties_required,
+    )
+
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    instance = json.loads(data)
+
+    if root_type_mismatch(validator, instance):
+        # invalid, so not worth freezing for the result cache
+        error = best_match(validator.iter_errors(instance))
+        if error is not None:
+            raise error
+    _validate_instance(key, validator, instance)
+    return instance
+
+
+async def validate_async(
+    instance: Any,
+    schema: Mapping[str, Any],
+    cls: type[Validator] = OAS32Validator,
+    *args: Any,
+    allow_remote_references: bool = False,
+    check_schema: bool = True,
+    enforce_properties_required: bool = False,
+    executor: Executor | None = None,
+    offload_threshold: int | None = None,
+    **kwargs: Any,
+) -> None:
+    """
+    Validate an instance without blocking the running event loop.
+
+    Behaves like ``validate`` and shares its caches. Instances with more
+    JSON nodes than ``offload_threshold`` are validated in ``executor``,
+    so a large payload does not stall other tasks on the event loop;
+    smaller instances are validated inline, where a thread hand-off would
+    cost more than the validation itself.
+
+    Args:
+        instance: Value to validate against ``schema``.
+        schema: OpenAPI schema mapping used for validation.
+        cls: Validator class to use. Defaults to ``OAS32Validator``.
+        *args: Positional arguments forwarded to ``cls`` constructor.
+        allow_remote_references: Same as for ``validate``.
+        check_schema: Same as for ``validate``.
+        enforce_properties_required: Same as for ``validate``.
+        executor: ``concurrent.futures`` executor used for large instances.
+            Defaults to the event loop's default executor.
+        offload_threshold: Number of instance nodes (objects, arrays and
+            scalar values) above which validation is offloaded. Defaults to
+            the ``async_offload_node_threshold`` setting (``10000``).
+        **kwargs: Keyword arguments forwarded to ``cls`` constructor.
 
-    error = best_match(
-        cached.validator.evolve(schema=schema_dict).iter_errors(instance)
+    Raises:
+        jsonschema.exceptions.SchemaError: If ``schema`` is invalid.
+        jsonschema.exceptions.ValidationError: If ``instance`` is invalid.
+    """
+    key, validator = _get_validator(
+        schema,
+        cls,
+        args,
+        kwargs,
+        allow_remote_references=allow_remote_references,
+        check_schema=check_schema,
+        enforce_properties_required=enforce_properties_required,
+    )
+
+    if offload_threshold is None:
+        offload_threshold = get_settings().async_offload_node_threshold
+
+    if not exceeds_node_count(instance, offload_threshold):
+        _validate_instance(key, validator, instance)
+        return
+
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(
+        executor,
+        _validate_instance,
+        key,
+        validator,
+        instance,
     )
+
+
+def _is_valid_instance(key: Hashable, validator: Any, instance: Any) -> bool:
+    if _RESULT_CACHE.enabled:
+        instance_key = instance_digest(instance)
+        if instance_key is not None:
+            # verdicts of validate; is_valid has no error to remember
+            error = _RESULT_CACHE.get((key, instance_key))
+            if error is not _RESULT_CACHE.MISSING:
+                return error is None
+
+    valid: bool = validator.is_valid(instance)
+    return valid
+
+
+def _validate_instance(key: Hashable, validator: Any, instance: Any) -> None:
+    result_key = None
+    if _RESULT_CACHE.enabled:
+        instance_key = instance_digest(instance)
+        if instance_key is not None:
+            result_key = (key, instance_key)
+            error = _RESULT_CACHE.get(result_key)
+            if error is None:
+                return
+            if error is not _RESULT_CACHE.MISSING:
+                raise copy_error(error, instance)
+
+    error = best_match(validator.iter_errors(instance))
+    if result_key is not None:
+        _RESULT_CACHE.set(
+            result_key, None if error is None else copy_error(error, None)
+        )
     if error is not None:
         raise error
 
 
+def warm_validate_cache(
+    schemas: Iterable[Mapping[str, Any]],
+    cls: type[Validator] = OAS32Validator,
+    *args: Any,
+    allow_remote_references: bool = False,
+    check_schema: bool = True,
+    enforce_properties_required: bool = False,
+    freeze: bool = True,
+    **kwargs: Any,
+) -> None:
+    """
+    Compile and cache validators for the given schemas ahead of time.
+
+    Intended to be called in a pre-fork parent process (for example gunicorn
+    with ``--preload``), so that workers start with checked, compiled
+    validators and ``validate`` calls with the same arguments are cache hits.
+
+    Args:
+        schemas: OpenAPI schema mappings to compile.
+        cls: Validator class to use. Defaults to ``OAS32Validator``.
+        *args: Positional arguments forwarded to ``cls`` constructor.
+        allow_remote_references: Same as for ``validate``.
+        check_schema: If ``True`` (default), check every schema before
+            compiling it.
+        enforce_properties_required: Same as for ``validate``.
+        freeze: If ``True`` (default), switch the compiled-validator cache
+            to read-mostly mode, so that cache hits do not reorder entries,
+            and move all tracked objects to the permanent garbage collector
+            generation with ``gc.freeze`` so that collections in forked
+            workers do not touch the shared memory pages.
+        **kwargs: Keyword arguments forwarded to ``cls`` constructor.
+
+    Raises:
+        jsonschema.exceptions.SchemaError: If any of ``schemas`` is invalid.
+    """
+    for schema in schemas:
+        _get_validator(
+            schema,
+            cls,
+            args,
+            kwargs,
+            allow_remote_references=allow_remote_references,
+            check_schema=check_schema,
+            enforce_properties_required=enforce_properties_required,
+        )
+
+    if freeze:
+        _freeze_validate_cache()
+
+
+def export_validators(
+    path: str | PathLike[str],
+    schemas: Iterable[Mapping[str, Any]],
+    cls: type[Validator] = OAS32Validator,
+) -> None:
+    """
+    Check schemas and write them to a versioned validator artefact file.
+
+    Loading the artefact with ``import_validators`` compiles the validators
+    without re-running the metaschema checks, which dominate cold start.
+
+    Args:
+        path: Destination file path.
+        schemas: OpenAPI schema mappings to store.
+        cls: Validator class the schemas are checked and compiled with.
+            Must be one of the validator classes of this package.
+            Defaults to ``OAS32Validator``.
+
+    Raises:
+        jsonschema.exceptions.SchemaError: If any of ``schemas`` is invalid.
+        ValueError: If ``schemas`` are not JSON documents.
+    """
+    name = validator_name(cls)
+    entries = []
+    for schema in schemas:
+        schema_dict = dict(schema)
+        _check_schema(cls, schema_dict)
+        entries.append(ArtefactEntry(validator_name=name, schema=schema_dict))
+    dump_artefact(path, entries)
+
+
+def import_validators(
+    path: str | PathLike[str],
+    *args: Any,
+    allow_remote_references: bool = False,
+    enforce_properties_required: bool = False,
+    freeze: bool = False,
+    **kwargs: Any,
+) -> list[dict[str, Any]]:
+    """
+    Load a validator artefact written by ``export_validators``.
+
+    Every stored schema is compiled into the ``validate`` cache and marked
+    as checked, so later ``validate`` calls with the same arguments skip
+    both compilation and the metaschema check.
+    Artefacts are JSON files. Their schemas are not checked again, so
+    artefacts must come from a trusted source.
+
+    Args:
+        path: Artefact file path.
+        *args: Positional arguments forwarded to the validator constructor.
+        allow_remote_references: Same as for ``validate``.
+        enforce_properties_required: Same as for ``validate``.
+        freeze: Same as for ``warm_validate_cache``. Defaults to ``False``.
+        **kwargs: Keyword arguments forwarded to the validator constructor,
+            for example ``registry`` and ``format_checker``. They are not
+            stored in the artefact and must match those passed later to
+            ``validate``.
+
+    Returns:
+        The loaded schemas, in artefact order.
+
+    Raises:
+        ValueError: If the file is not an artefact or is malformed, or was
+            written by a different artefact format or package version.
+    """
+    entries = load_artefact(path)
+    for entry in entries:
+        _get_validator(
+            entry.schema,
+            entry.validator_class,
+            args,
+            kwargs,
+            allow_remote_references=allow_remote_references,
+            check_schema=True,
+            enforce_properties_required=enforce_properties_required,
+            schema_trusted=True,
+        )
+
+    if freeze:
+        _freeze_validate_cache()
+
+    return [entry.schema for entry in entries]
+
+
+def _freeze_validate_cache() -> None:
+    _VALIDATOR_CACHE.freeze()
+    gc.collect()
+    gc.freeze()
+
+
+def validate_cache_stats() -> dict[str, CacheStats]:
+    """
+    Return hit/miss statistics of the ``validate`` caches.
+
+    The ``"validators"`` entry covers the compiled-validator cache and the
+    ``"results"`` entry the optional validation result cache.
+    """
+    return {
+        "validators": _VALIDATOR_CACHE.stats(),
+        "results": _RESULT_CACHE.stats(),
+    }
+
+
 def clear_validate_cache() -> None:
     _VALIDATOR_CACHE.clear()
+    _RESULT_CACHE.clear()
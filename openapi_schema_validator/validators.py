@@ -17,14 +17,20 @@ from jsonschema.validators import validator_for
 from openapi_schema_validator import _format as oas_format
 from openapi_schema_validator import _keywords as oas_keywords
 from openapi_schema_validator import _types as oas_types
+from openapi_schema_validator._annotations import track_annotations
 from openapi_schema_validator._dialects import OAS31_BASE_DIALECT_ID
 from openapi_schema_validator._dialects import OAS31_BASE_DIALECT_METASCHEMA
 from openapi_schema_validator._dialects import OAS32_BASE_DIALECT_ID
 from openapi_schema_validator._dialects import OAS32_BASE_DIALECT_METASCHEMA
 from openapi_schema_validator._dialects import register_openapi_dialect
+from openapi_schema_validator._dispatch import plan_keywords
+from openapi_schema_validator._references import cache_references
+from openapi_schema_validator._regex import has_safe_regex
+from openapi_schema_validator._regex import unsafe_regex_reason
 from openapi_schema_validator._specifications import (
     REGISTRY as OPENAPI_SPECIFICATIONS,
 )
+from openapi_schema_validator._types import dispatch_types
 from openapi_schema_validator._types import oas31_type_checker
 
 _CHECK_SCHEMA_UNSET = object()
@@ -49,6 +55,38 @@ def check_openapi_schema(
     for error in validator_for_metaschema.iter_errors(schema):
         raise SchemaError.create_from(error)
 
+    if has_safe_regex():
+        for pattern in _iter_patterns(schema):
+            reason = unsafe_regex_reason(pattern)
+            if reason is not None:
+                raise SchemaError(
+                    f"{pattern!r} may backtrack catastrophically ({reason})"
+                )
+
+
+# keywords whose values are instances rather than schemas
+_INSTANCE_KEYWORDS = frozenset(
+    ["const", "default", "enum", "example", "examples"]
+)
+
+
+def _iter_patterns(schema: Any) -> Iterator[str]:
+    stack = [schema]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, list):
+            stack.extend(value)
+            continue
+        if not isinstance(value, dict):
+            continue
+        for keyword, subvalue in value.items():
+            if keyword == "pattern" and isinstance(subvalue, str):
+                yield subvalue
+            elif keyword == "patternProperties" and isinstance(subvalue, dict):
+                yield from subvalue
+            if keyword not in _INSTANCE_KEYWORDS:
+                stack.append(subvalue)
+
 
 def _oas30_id_of(schema: Any) -> str:
     if isinstance(schema, dict):
@@ -119,7 +157,14 @@ def _build_oas31_validator() -> Any:
         Draft202012Validator,
         {
             # adjusted to OAS
+            "items": oas_keywords.items_draft202012,
             "pattern": oas_keywords.pattern,
+            "patternProperties": oas_keywords.patternProperties,
+            "additionalProperties": (
+                oas_keywords.additionalProperties_draft202012
+            ),
+            "unevaluatedItems": oas_keywords.unevaluatedItems,
+            "unevaluatedProperties": oas_keywords.unevaluatedProperties,
             "description": oas_keywords.not_implemented,
             # fixed OAS fields
             # discriminator is annotation-only in OAS 3.1+
@@ -183,6 +228,26 @@ OAS30WriteValidator = extend(
 OAS31Validator = _build_oas31_validator()
 OAS32Validator = _build_oas32_validator()
 
+# Validates OpenAPI 3.0 schemas rewritten by normalize_oas30_schema with the
+# OpenAPI 3.1 keywords, keeping the OpenAPI 3.0 types, formats, required
+# properties and discriminators. Like OAS31Validator it extends the 2020-12
+# validator, whose referencing specification identifies resources by the
+# $id and $anchor that an OpenAPI 3.0 id is rewritten to.
+OAS30NormalizedValidator = extend(
+    Draft202012Validator,
+    dict(
+        OAS31Validator.VALIDATORS,
+        allOf=oas_keywords.allOf,
+        anyOf=oas_keywords.anyOf,
+        oneOf=oas_keywords.oneOf,
+        format=oas_keywords.format,
+        required=oas_keywords.required,
+    ),
+    type_checker=oas_types.oas30_normalized_type_checker,
+    format_checker=oas_format.oas30_format_checker,
+)
+OAS30NormalizedValidator.META_SCHEMA = OAS31Validator.META_SCHEMA
+
 # These validator classes are generated via jsonschema create/extend, so there
 # is no simpler hook to inject registry-aware schema checking while preserving
 # each class's FORMAT_CHECKER. Override check_schema on each class to keep
@@ -191,6 +256,28 @@ OAS32Validator = _build_oas32_validator()
 OAS30Validator.check_schema = classmethod(check_openapi_schema)
 OAS31Validator.check_schema = classmethod(check_openapi_schema)
 OAS32Validator.check_schema = classmethod(check_openapi_schema)
+OAS30NormalizedValidator.check_schema = classmethod(check_openapi_schema)
+
+# Remember resolved references and the asserting keywords of each subschema
+# for the lifetime of each validator's registry, which evolved validators
+# share, and look the JSON types of built-in instances up in a table.
+for _validator_class in (
+    OAS30Validator,
+    OAS30StrictValidator,
+    OAS30ReadValidator,
+    OAS30WriteValidator,
+    OAS31Validator,
+    OAS32Validator,
+    OAS30NormalizedValidator,
+):
+    cache_references(_validator_class)
+    plan_keywords(_validator_class)
+    dispatch_types(_validator_class)
+
+# Let unevaluatedProperties/unevaluatedItems reuse the subschema results of
+# the validation pass instead of validating each branch again.
+track_annotations(OAS31Validator)
+track_annotations(OAS32Validator)
 
 
 @lru_cache(maxsize=None)
@@ -230,6 +317,11 @@ def build_enforce_properties_required_validator(
         validator_class,
         validators={"properties": enforce_properties},
     )
+    extended_validator._validate_reference = (
+        validator_class._validate_reference
+    )
+    plan_keywords(extended_validator)
+    dispatch_types(extended_validator)
     if hasattr(validator_class, "check_schema"):
         extended_validator.check_schema = classmethod(
             validator_class.check_schema.__func__
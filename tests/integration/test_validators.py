@@ -303,6 +303,14 @@ class TestOAS30ValidatorValidate(BaseTestOASValidatorValidate):
         with pytest.raises(ValidationError):
             validator.validate(value)
 
+    def test_null_single_error(self, validator_class):
+        schema = {"type": "string"}
+        validator = validator_class(schema)
+
+        errors = [error.message for error in validator.iter_errors(None)]
+
+        assert errors == ["None for not nullable"]
+
     @pytest.mark.parametrize("is_nullable", [True, False])
     def test_nullable_untyped(self, validator_class, is_nullable):
         schema = {"nullable": is_nullable}
@@ -1330,6 +1338,15 @@ class TestOAS30StrictValidator:
         with pytest.raises(ValidationError, match="is not a 'binary'"):
             validator.validate("not base64")
 
+    def test_strict_null_single_error(self):
+        """Strict validator reports None for a non-nullable type once."""
+        schema = {"type": "string", "nullable": False}
+        validator = OAS30StrictValidator(schema)
+
+        errors = [error.message for error in validator.iter_errors(None)]
+
+        assert errors == ["None for not nullable"]
+
 
 class TestValidatorForDiscovery:
     def test_oas31_base_dialect_resolves_to_oas31_validator(self):
@@ -0,0 +1,202 @@
+import json
+
+import pytest
+from referencing import Registry
+from referencing import Resource
+
+from openapi_schema_validator import OAS30Validator
+from openapi_schema_validator import OAS31Validator
+from openapi_schema_validator._regex import redos_reason
+from openapi_schema_validator.analysis import FAN_OUT
+from openapi_schema_validator.analysis import RECURSIVE_REF
+from openapi_schema_validator.analysis import REDOS_PATTERN
+from openapi_schema_validator.analysis import UNBOUNDED_ADDITIONAL_PROPERTIES
+from openapi_schema_validator.analysis import UNIQUE_OBJECT_ITEMS
+from openapi_schema_validator.analysis import analyze_schema
+from openapi_schema_validator.analysis import main
+
+SCHEMA = {
+    "type": "object",
+    "additionalProperties": {"type": "string", "pattern": "^(a+)+$"},
+    "properties": {
+        "tree": {"$ref": "#/$defs/node"},
+        "tags": {
+            "type": "array",
+            "uniqueItems": True,
+            "items": {"type": "object"},
+        },
+        "kind": {
+            "oneOf": [
+                {"anyOf": [{"type": "string"}, {"type": "integer"}]},
+                {"anyOf": [{"minimum": 1}, {"maximum": 2}, {"const": 4}]},
+            ]
+        },
+    },
+    "$defs": {
+        "node": {
+            "type": "object",
+            "properties": {
+                "children": {
+                    "type": "array",
+                    "items": {"$ref": "#/$defs/node"},
+                },
+            },
+        },
+    },
+}
+
+
+def _hotspots(report):
+    return {(hotspot.kind, hotspot.location) for hotspot in report.hotspots}
+
+
+def test_analyze_schema_hotspots():
+    report = analyze_schema(SCHEMA, OAS31Validator, fan_out_threshold=5)
+
+    assert _hotspots(report) == {
+        (UNBOUNDED_ADDITIONAL_PROPERTIES, "#"),
+        (REDOS_PATTERN, "#/additionalProperties/pattern"),
+        (UNIQUE_OBJECT_ITEMS, "#/properties/tags"),
+        (FAN_OUT, "#/properties/kind"),
+        (RECURSIVE_REF, "#/$defs/node/properties/children/items"),
+    }
+    assert report.recursive
+
+
+def test_analyze_schema_bounded_repeat_patterns():
+    schema = {
+        "properties": {
+            "any": {"pattern": "^(.*a){9}$"},
+            "optional": {"pattern": "^(a?){9}a{9}$"},
+            "slug": {"pattern": "^[a-z]+(-[a-z]+)*$"},
+        },
+    }
+
+    report = analyze_schema(schema, OAS31Validator)
+
+    assert _hotspots(report) == {
+        (REDOS_PATTERN, "#/properties/any/pattern"),
+        (REDOS_PATTERN, "#/properties/optional/pattern"),
+    }
+
+
+def test_analyze_schema_bounded_schema():
+    schema = {
+        "type": "object",
+        "maxProperties": 3,
+        "additionalProperties": {"type": "string"},
+        "properties": {
+            "ids": {
+                "type": "array",
+                "maxItems": 2,
+                "uniqueItems": True,
+                "items": {"type": "integer"},
+            },
+            "kind": {"oneOf": [{"type": "string"}, {"type": "integer"}]},
+        },
+    }
+
+    report = analyze_schema(schema, OAS31Validator)
+
+    assert report.hotspots == ()
+    assert not report.recursive
+    # 4 root keywords, 3 * 1 additional, 4 ids + 2 * 1 items, 1 + 2 kind
+    assert report.cost == 4 + 3 + 6 + 3
+
+
+def test_analyze_schema_array_cost_uses_max_items():
+    schema = {"type": "array", "items": {"type": "integer"}}
+
+    unbounded = analyze_schema(schema, assumed_array_length=10)
+    bounded = analyze_schema(dict(schema, maxItems=2))
+
+    assert unbounded.cost == 2 + 10
+    assert bounded.cost == 3 + 2
+
+
+def test_analyze_schema_oas30_discriminator():
+    schema = {
+        "components": {
+            "schemas": {
+                "Cat": {"type": "object"},
+                "Dog": {"type": "object", "required": ["bark"]},
+            },
+        },
+        "oneOf": [
+            {"$ref": "#/components/schemas/Cat"},
+            {"$ref": "#/components/schemas/Dog"},
+        ],
+        "discriminator": {"propertyName": "petType"},
+    }
+
+    report = analyze_schema(schema, OAS30Validator)
+
+    # oneOf, discriminator, $ref and the keywords of the largest branch
+    assert report.cost == 2 + 1 + 2
+
+
+def test_analyze_schema_registry():
+    registry = Registry().with_resource(
+        "urn:pattern",
+        Resource.from_contents(
+            {
+                "$schema": "https://json-schema.org/draft/2020-12/schema",
+                "type": "string",
+                "pattern": "(.|\\s)*",
+            }
+        ),
+    )
+
+    report = analyze_schema({"$ref": "urn:pattern"}, registry=registry)
+
+    assert _hotspots(report) == {(REDOS_PATTERN, "urn:pattern#/pattern")}
+
+
+@pytest.mark.parametrize(
+    "pattern,dangerous",
+    [
+        ("^(a+)+$", True),
+        ("^(\\d+)*$", True),
+        ("(a*)*", True),
+        ("(.|\\s)*", True),
+        ("(a|[^b])*", True),
+        ("^(a|aa)+$", True),
+        ("^(\\d|\\d\\d)+$", True),
+        ("^(a|a)*b", True),
+        ("^(.*a){9}$", True),
+        ("^(a?){9}a{9}$", True),
+        ("^(\\w+\\s?)*$", True),
+        ("(a+|b)+", True),
+        ("^[a-z]+(-[a-z]+)*$", False),
+        ("^([a-z]+\\.)*[a-z]+$", False),
+        ("^(a+b)+$", False),
+        ("^(?:a{2}){3}$", False),
+        ("(a|ab)*c", False),
+        ("^[a-z]+$", False),
+        ("^(?:[0-9]{3}-)+$", False),
+        ('("|[^"])*', False),
+        ("(ab|cd)+", False),
+        ("(?>a+)+", False),
+        ("[", False),
+    ],
+)
+def test_redos_reason(pattern, dangerous):
+    assert (redos_reason(pattern) is not None) is dangerous
+
+
+def test_main(tmp_path, capsys):
+    path = tmp_path / "schema.json"
+    path.write_text(json.dumps(SCHEMA))
+
+    assert main([str(path), "--dialect", "oas31"]) == 0
+    output = capsys.readouterr().out
+    assert output.startswith("estimated cost: ")
+    assert "recursive-ref: #/$defs/node/properties/children/items" in output
+    assert main([str(path), "--dialect", "oas31", "--fail-on-hotspots"]) == 1
+    assert capsys.readouterr().out == output
+
+    path.write_text(json.dumps({"type": "string"}))
+    assert main([str(path), "--json"]) == 0
+    assert json.loads(capsys.readouterr().out) == {"cost": 1, "hotspots": []}
+    assert main([str(path), "--max-cost", "0.5"]) == 1
+    assert main([str(path), "--fail-on-hotspots"]) == 0
@@ -0,0 +1,148 @@
+import pytest
+from jsonschema import FormatChecker
+from jsonschema import _keywords
+from jsonschema.validators import extend
+
+from openapi_schema_validator import OAS31Validator
+from openapi_schema_validator import OAS32Validator
+
+REFERENCE_VALIDATOR = extend(
+    OAS31Validator,
+    {
+        "unevaluatedItems": _keywords.unevaluatedItems,
+        "unevaluatedProperties": _keywords.unevaluatedProperties,
+    },
+)
+
+
+def _chain(depth, leaf=None):
+    defs = {
+        "Model0": {
+            "type": "object",
+            "properties": {"field0": {"type": "string"}},
+        }
+    }
+    for level in range(1, depth + 1):
+        defs[f"Model{level}"] = {
+            "allOf": [
+                {"$ref": f"#/$defs/Model{level - 1}"},
+                {"properties": {f"field{level}": leaf or {"type": "integer"}}},
+            ]
+        }
+    return {
+        "$defs": defs,
+        "$ref": f"#/$defs/Model{depth}",
+        "unevaluatedProperties": False,
+    }
+
+
+SCHEMAS = [
+    _chain(4),
+    {
+        "anyOf": [
+            {"properties": {"a": {"type": "integer"}}},
+            {"properties": {"b": {"type": "integer"}}, "required": ["b"]},
+        ],
+        "unevaluatedProperties": False,
+    },
+    {
+        "oneOf": [
+            {"properties": {"a": {"type": "integer"}}, "required": ["a"]},
+            {"properties": {"b": {"type": "integer"}}, "required": ["b"]},
+        ],
+        "unevaluatedProperties": {"type": "string"},
+    },
+    {
+        "if": {"properties": {"kind": {"const": "a"}}},
+        "then": {"properties": {"a": True}},
+        "else": {"properties": {"b": True}},
+        "unevaluatedProperties": False,
+    },
+    {
+        "properties": {"a": True},
+        "dependentSchemas": {"a": {"properties": {"b": True}}},
+        "patternProperties": {"^x-": True},
+        "unevaluatedProperties": False,
+    },
+    {
+        "allOf": [
+            {"prefixItems": [{"type": "integer"}]},
+            {"contains": {"type": "string"}},
+        ],
+        "unevaluatedItems": {"type": "boolean"},
+    },
+    {
+        "$defs": {"Tree": {"prefixItems": [True], "items": {"$ref": "#"}}},
+        "anyOf": [{"$ref": "#/$defs/Tree"}, {"type": "integer"}],
+        "unevaluatedItems": False,
+    },
+]
+
+INSTANCES = [
+    {},
+    {"field0": "x", "field1": 1, "field4": 4},
+    {"field0": 1, "field2": 2},
+    {"field5": 5},
+    {"a": 1},
+    {"a": 1, "b": 2},
+    {"a": "x", "b": 2, "c": "y"},
+    {"b": 2, "c": 3},
+    {"kind": "a", "a": 1},
+    {"kind": "b", "a": 1},
+    {"kind": "b", "b": 1, "x-extra": 1},
+    [],
+    [1, "x", True],
+    [1, "x", 2],
+    ["x", 1],
+    [1, [2, [3]], []],
+    [[1, 2], 3],
+    1,
+]
+
+
+@pytest.mark.parametrize("validator_class", [OAS31Validator, OAS32Validator])
+@pytest.mark.parametrize("schema", SCHEMAS)
+def test_unevaluated_matches_jsonschema(validator_class, schema):
+    validator = validator_class(schema)
+    reference = REFERENCE_VALIDATOR(schema)
+
+    for instance in INSTANCES:
+        errors = [
+            (error.message, list(error.path), list(error.schema_path))
+            for error in validator.iter_errors(instance)
+        ]
+        expected = [
+            (error.message, list(error.path), list(error.schema_path))
+            for error in reference.iter_errors(instance)
+        ]
+        assert errors == expected, instance
+        assert validator.is_valid(instance) is reference.is_valid(instance)
+
+
+def test_unevaluated_dynamic_ref():
+    schema = {
+        "$id": "https://example.com/tree",
+        "$dynamicAnchor": "node",
+        "type": "object",
+        "properties": {
+            "children": {"items": {"$dynamicRef": "#node"}},
+        },
+        "unevaluatedProperties": False,
+    }
+    validator = OAS31Validator(schema)
+
+    assert validator.is_valid({"children": [{"children": []}]})
+    assert not validator.is_valid({"children": [{"name": "x"}]})
+
+
+def test_unevaluated_deep_allof_evaluates_once():
+    calls = []
+    format_checker = FormatChecker()
+    format_checker.checks("counted")(lambda instance: calls.append(1) or True)
+    depth = 10
+    schema = _chain(depth, leaf={"format": "counted"})
+    instance = {f"field{level}": level for level in range(1, depth + 1)}
+    validator = OAS31Validator(schema, format_checker=format_checker)
+
+    assert not list(validator.iter_errors(instance))
+    assert len(calls) == depth
@@ -0,0 +1,147 @@
+from threading import Event
+from threading import Thread
+from unittest.mock import patch
+
+import pytest
+
+from openapi_schema_validator import OAS30Validator
+from openapi_schema_validator.background import BackgroundValidator
+from openapi_schema_validator.shortcuts import clear_validate_cache
+
+
+@pytest.fixture(autouse=True)
+def clear_validate_cache_fixture():
+    clear_validate_cache()
+    yield
+    clear_validate_cache()
+
+
+@pytest.fixture
+def schema():
+    return {
+        "type": "object",
+        "properties": {"id": {"type": "integer"}},
+    }
+
+
+def test_background_validator_aggregates_errors(schema):
+    with BackgroundValidator(workers=2, cls=OAS30Validator) as validator:
+        for instance in ({"id": 1}, {"id": "a"}, {"id": "b"}, []):
+            assert validator.submit(instance, schema, name="Pet")
+
+    stats = validator.stats()
+    assert stats.submitted == 4
+    assert stats.validated == 4
+    assert stats.invalid == 3
+    assert stats.errors == {
+        "Pet": {
+            ("type", "/properties/id/type", "/id"): 2,
+            ("type", "/type", ""): 1,
+        },
+    }
+
+
+def test_background_validator_counts_schema_errors():
+    with BackgroundValidator() as validator:
+        validator.submit("foo", {"type": "string", "pattern": "["})
+
+    stats = validator.stats()
+    assert stats.schema_errors == 1
+    assert stats.validated == 0
+
+
+def test_background_validator_sampling(schema):
+    with BackgroundValidator(
+        sample_rate=0.0, sample_rates={"Pet": 1.0}
+    ) as validator:
+        assert validator.submit({"id": 1}, schema, name="Pet")
+        assert not validator.submit({"id": 1}, schema, name="Order")
+
+    stats = validator.stats()
+    assert stats.sampled_out == 1
+    assert stats.validated == 1
+
+
+@pytest.mark.parametrize(
+    "drop_policy, expected_queued",
+    [("newest", False), ("oldest", True)],
+)
+def test_background_validator_drop_policy(
+    schema, drop_policy, expected_queued
+):
+    started = Event()
+    release = Event()
+
+    def blocking_validate(*args, **kwargs):
+        started.set()
+        release.wait()
+
+    with patch(
+        "openapi_schema_validator.background.validate", blocking_validate
+    ):
+        validator = BackgroundValidator(
+            max_queue_size=1, drop_policy=drop_policy
+        )
+        validator.submit({"id": 1}, schema)
+        started.wait()
+        validator.submit({"id": 2}, schema)
+
+        queued = validator.submit({"id": 3}, schema)
+
+        release.set()
+        validator.close()
+
+    stats = validator.stats()
+    assert queued is expected_queued
+    assert stats.dropped == 1
+    assert stats.validated == 2
+
+
+def test_background_validator_rejects_submit_after_close(schema):
+    validator = BackgroundValidator()
+    validator.close()
+
+    with pytest.raises(RuntimeError):
+        validator.submit({"id": 1}, schema)
+
+
+@pytest.mark.parametrize("drop_policy", ["newest", "oldest"])
+def test_background_validator_concurrent_submit_and_close(schema, drop_policy):
+    def submit_until_closed(validator, start):
+        start.wait()
+        while True:
+            try:
+                validator.submit({"id": 1}, schema)
+            except RuntimeError:
+                return
+
+    for _ in range(20):
+        validator = BackgroundValidator(
+            workers=2, max_queue_size=2, drop_policy=drop_policy
+        )
+        start = Event()
+        submitters = [
+            Thread(
+                target=submit_until_closed,
+                args=(validator, start),
+                daemon=True,
+            )
+            for _ in range(4)
+        ]
+        closer = Thread(target=validator.close, daemon=True)
+        for thread in submitters:
+            thread.start()
+        start.set()
+        closer.start()
+
+        closer.join(timeout=10)
+        assert not closer.is_alive()
+        for thread in submitters:
+            thread.join(timeout=10)
+        stats = validator.stats()
+        assert stats.submitted == stats.dropped + stats.validated
+
+
+def test_background_validator_unknown_drop_policy():
+    with pytest.raises(ValueError, match="drop policy"):
+        BackgroundValidator(drop_policy="random")
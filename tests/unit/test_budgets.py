@@ -0,0 +1,175 @@
+from unittest import mock
+
+import pytest
+from jsonschema.exceptions import ValidationError
+
+from openapi_schema_validator import OAS30Validator
+from openapi_schema_validator import OAS31Validator
+from openapi_schema_validator import validate
+from openapi_schema_validator.budgets import BudgetExceededError
+from openapi_schema_validator.budgets import ValidationBudget
+from openapi_schema_validator.budgets import build_budgeted_validator
+from openapi_schema_validator.shortcuts import clear_validate_cache
+from openapi_schema_validator.shortcuts import is_valid
+from openapi_schema_validator.shortcuts import validate_cache_stats
+
+SCHEMA = {
+    "type": "object",
+    "properties": {
+        "items": {"type": "array", "items": {"type": "integer"}},
+    },
+}
+
+
+@pytest.mark.parametrize(
+    "budget,instance,limit,path",
+    [
+        (
+            ValidationBudget(max_depth=2),
+            {"a": {"b": {"c": 1}}},
+            "max_depth",
+            ["a", "b"],
+        ),
+        (ValidationBudget(max_depth=2), [[[]]], "max_depth", [0, 0]),
+        (
+            ValidationBudget(max_nodes=3),
+            {"items": [1, 2, 3]},
+            "max_nodes",
+            None,
+        ),
+        (
+            ValidationBudget(max_array_length=2),
+            {"items": [1, 2, 3]},
+            "max_array_length",
+            ["items"],
+        ),
+    ],
+)
+def test_budget_structural_limits(budget, instance, limit, path):
+    validator_class = build_budgeted_validator(OAS31Validator, budget)
+
+    with pytest.raises(BudgetExceededError) as exc_info:
+        validator_class({}).validate(instance)
+
+    assert exc_info.value.limit == limit
+    assert exc_info.value.validator_value == getattr(budget, limit)
+    if path is not None:
+        assert list(exc_info.value.path) == path
+
+
+def test_budget_within_limits():
+    budget = ValidationBudget(
+        max_depth=2, max_nodes=5, max_array_length=3, timeout=10
+    )
+    validator_class = build_budgeted_validator(OAS30Validator, budget)
+    validator = validator_class(SCHEMA)
+
+    assert validator.is_valid({"items": [1, 2, 3]})
+    with pytest.raises(ValidationError) as exc_info:
+        validator.validate({"items": [1, "2"]})
+    assert not isinstance(exc_info.value, BudgetExceededError)
+
+
+def test_budget_timeout():
+    budget = ValidationBudget(timeout=1)
+    validator = build_budgeted_validator(OAS31Validator, budget)(SCHEMA)
+
+    with mock.patch(
+        "openapi_schema_validator.budgets.monotonic",
+        side_effect=[0.0, 0.5, 0.9, 2.0, 3.0],
+    ):
+        with pytest.raises(BudgetExceededError) as exc_info:
+            validator.validate({"items": [1, 2, 3, 4, 5]})
+
+    assert exc_info.value.limit == "timeout"
+    assert str(exc_info.value.message) == "Validation took longer than 1s"
+
+
+def test_budget_timeout_not_kept_by_suspended_errors():
+    budget = ValidationBudget(timeout=1)
+    validator = build_budgeted_validator(OAS31Validator, budget)(SCHEMA)
+
+    now = [0.0]
+
+    with mock.patch(
+        "openapi_schema_validator.budgets.monotonic", lambda: now[0]
+    ):
+        errors = validator.iter_errors({"items": ["a", "b"]})
+        assert next(errors).validator == "type"
+        now[0] = 5.0
+        assert not validator.is_valid({"items": ["a"]})
+
+        # validations outside the budget are not limited by its deadline
+        with pytest.raises(ValidationError) as exc_info:
+            validate({"items": ["a"]}, SCHEMA)
+        assert not isinstance(exc_info.value, BudgetExceededError)
+
+
+def _clock(*times):
+    # returns the given times, then the last one forever
+    times = list(times)
+    return lambda: times.pop(0) if len(times) > 1 else times[0]
+
+
+@pytest.mark.parametrize("validate_fn", [validate, is_valid])
+def test_validate_budget_timeout(validate_fn):
+    budget = ValidationBudget(timeout=1)
+
+    with mock.patch(
+        "openapi_schema_validator.budgets.monotonic",
+        _clock(0.0, 0.5, 0.9, 2.0),
+    ):
+        with pytest.raises(BudgetExceededError) as exc_info:
+            validate_fn({"items": [1, 2, 3, 4, 5]}, SCHEMA, budget=budget)
+
+    assert exc_info.value.limit == "timeout"
+
+
+def test_validate_budget_builds_no_validator_class():
+    clear_validate_cache()
+    build_budgeted_validator.cache_clear()
+
+    for timeout in (1.0, 2.0, 3.0):
+        budget = ValidationBudget(max_depth=3, timeout=timeout)
+        validate({"items": [1, 2]}, SCHEMA, budget=budget)
+        assert is_valid({"items": [1, 2]}, SCHEMA, budget=budget)
+
+    assert build_budgeted_validator.cache_info().currsize == 0
+    assert validate_cache_stats()["validators"].size == 1
+
+
+def test_budgeted_validator_keeps_keyword_implementations():
+    budget = ValidationBudget(timeout=1)
+    validator_class = build_budgeted_validator(OAS30Validator, budget)
+
+    assert validator_class.VALIDATORS == OAS30Validator.VALIDATORS
+
+
+def test_budget_is_cached_per_class_and_budget():
+    budget = ValidationBudget(max_depth=1)
+
+    assert build_budgeted_validator(
+        OAS31Validator, budget
+    ) is build_budgeted_validator(
+        OAS31Validator, ValidationBudget(max_depth=1)
+    )
+    assert build_budgeted_validator(
+        OAS31Validator, budget
+    ) is not build_budgeted_validator(OAS30Validator, budget)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"max_depth": -1}, {"max_nodes": -1}, {"timeout": 0}],
+)
+def test_budget_invalid(kwargs):
+    with pytest.raises(ValueError):
+        ValidationBudget(**kwargs)
+
+
+def test_validate_budget():
+    budget = ValidationBudget(max_array_length=2)
+
+    validate({"items": [1, 2]}, SCHEMA, budget=budget)
+    with pytest.raises(BudgetExceededError):
+        validate({"items": [1, 2, 3]}, SCHEMA, budget=budget)
@@ -0,0 +1,81 @@
+import pytest
+
+from openapi_schema_validator import OAS31Validator
+from openapi_schema_validator.collectors import ErrorCollector
+from openapi_schema_validator.collectors import ErrorKey
+
+
+@pytest.fixture
+def validator():
+    return OAS31Validator(
+        {
+            "type": "object",
+            "properties": {
+                "items": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "required": ["id"],
+                        "properties": {"a/b": {"type": "string"}},
+                    },
+                },
+                "kind": {"anyOf": [{"type": "integer"}, {"type": "null"}]},
+            },
+        }
+    )
+
+
+def test_error_collector_aggregates_by_path_template(validator):
+    collector = ErrorCollector()
+
+    for instance in (
+        {"items": [{"id": 1}, {}, {}]},
+        {"items": [{}, {"id": 2, "a/b": 3}]},
+    ):
+        collector.add(validator.iter_errors(instance))
+
+    assert collector.counts() == {
+        ("required", "/properties/items/items/required", "/items/*"): 3,
+        (
+            "type",
+            "/properties/items/items/properties/a~1b/type",
+            "/items/*/a~1b",
+        ): 1,
+    }
+
+
+def test_error_collector_keys_are_interned(validator):
+    collector = ErrorCollector()
+
+    collector.add(validator.iter_errors({"items": [{}]}))
+    collector.add(validator.iter_errors({"items": [{}, {}]}))
+
+    ((key, count),) = collector.most_common()
+    assert isinstance(key, ErrorKey)
+    assert key.keyword == "required"
+    assert count == 3
+
+
+def test_error_collector_include_context(validator):
+    collector = ErrorCollector(include_context=True)
+
+    counted = collector.add(validator.iter_errors({"kind": "x"}))
+
+    assert counted == 3
+    assert (
+        collector.counts()[("type", "/properties/kind/anyOf/1/type", "/kind")]
+        == 1
+    )
+
+
+def test_error_collector_max_keys(validator):
+    collector = ErrorCollector(max_keys=1)
+
+    collector.add(validator.iter_errors({"items": [{"a/b": 1}]}))
+
+    assert len(collector.counts()) == 1
+    assert collector.overflow == 1
+
+    collector.clear()
+    assert collector.counts() == {}
+    assert collector.overflow == 0
@@ -0,0 +1,465 @@
+import gc
+
+import pytest
+from jsonschema import FormatChecker
+from jsonschema.exceptions import ValidationError
+from jsonschema.validators import extend
+
+from openapi_schema_validator import OAS30ReadValidator
+from openapi_schema_validator import OAS30StrictValidator
+from openapi_schema_validator import OAS30Validator
+from openapi_schema_validator import OAS30WriteValidator
+from openapi_schema_validator import OAS31Validator
+from openapi_schema_validator import OAS32Validator
+from openapi_schema_validator import _dispatch
+from openapi_schema_validator import oas31_format_checker
+from openapi_schema_validator._keywords import not_implemented
+
+ANNOTATIONS = {
+    "description": "documented",
+    "example": "example",
+    "xml": {"name": "value"},
+    "externalDocs": {"url": "https://example.com"},
+    "deprecated": False,
+    "readOnly": False,
+    "writeOnly": False,
+}
+
+SCHEMA = {
+    "type": "object",
+    "properties": {
+        "name": dict(ANNOTATIONS, type="string", maxLength=3),
+        "tags": dict(
+            ANNOTATIONS,
+            type="array",
+            items=dict(ANNOTATIONS, type="string", minLength=1),
+        ),
+        "owner": {"$ref": "#/$defs/Owner", "description": "owner"},
+    },
+    "required": ["name"],
+    "$defs": {"Owner": dict(ANNOTATIONS, type="object", required=["id"])},
+    **ANNOTATIONS,
+}
+
+INSTANCES = [
+    {"name": "abc", "tags": ["a", "b"], "owner": {"id": 1}},
+    {"name": "abcd", "tags": ["", 1], "owner": {}},
+    {"tags": "a"},
+    [],
+]
+
+
+@pytest.mark.parametrize(
+    "validator_class",
+    [OAS30Validator, OAS31Validator, OAS32Validator],
+)
+def test_errors_match_unplanned(validator_class):
+    schema = dict(SCHEMA)
+    if validator_class is OAS30Validator:
+        schema["definitions"] = schema.pop("$defs")
+        schema["properties"] = dict(
+            schema["properties"], owner={"$ref": "#/definitions/Owner"}
+        )
+    validator = validator_class(schema)
+    reference = extend(validator_class, {})(schema)
+
+    for instance in INSTANCES:
+        assert [
+            (error.message, list(error.path), list(error.schema_path))
+            for error in validator.iter_errors(instance)
+        ] == [
+            (error.message, list(error.path), list(error.schema_path))
+            for error in reference.iter_errors(instance)
+        ]
+
+
+def test_annotations_not_dispatched():
+    validator = OAS31Validator(SCHEMA)
+    list(validator.iter_errors(INSTANCES[1]))
+
+    plans = _dispatch._PLANS[id(validator._resolver._registry)]
+    assert {keyword for _, keyword, _ in validator._validators} == {
+        "type",
+        "properties",
+        "required",
+    }
+    # the root, name, tags, its items, owner and Owner
+    assert len(plans) == 6
+    for _, _, plan in plans.values():
+        assert all(
+            implementation is not not_implemented
+            for implementation, _, _ in plan
+        )
+
+
+def test_plans_computed_once(monkeypatch):
+    calls = []
+    applicable_validators = OAS31Validator._APPLICABLE_VALIDATORS
+
+    def counted(schema):
+        calls.append(id(schema))
+        return applicable_validators(schema)
+
+    monkeypatch.setattr(
+        OAS31Validator, "_APPLICABLE_VALIDATORS", staticmethod(counted)
+    )
+    validator = OAS31Validator(SCHEMA)
+    instance = {"name": "abc", "tags": ["a"] * 10, "owner": {"id": 1}}
+
+    for _ in range(3):
+        assert validator.is_valid(instance)
+    assert sorted(set(calls)) == sorted(calls)
+
+
+@pytest.mark.parametrize(
+    "validator_class,instance",
+    [
+        (OAS30ReadValidator, {"secret": "x"}),
+        (OAS30WriteValidator, {"id": 1}),
+    ],
+)
+def test_read_write_keywords_dispatched(validator_class, instance):
+    schema = {
+        "type": "object",
+        "properties": {
+            "id": {"type": "integer", "readOnly": True},
+            "secret": {"type": "string", "writeOnly": True},
+        },
+    }
+
+    assert not validator_class(schema).is_valid(instance)
+
+
+def test_plans_released_with_registry():
+    validator = OAS31Validator(SCHEMA)
+    validator.is_valid(INSTANCES[0])
+    registry_id = id(validator._resolver._registry)
+    assert registry_id in _dispatch._PLANS
+
+    del validator
+    gc.collect()
+
+    assert registry_id not in _dispatch._PLANS
+
+
+def test_is_valid_evaluates_cheap_keywords_first():
+    calls = []
+    format_checker = FormatChecker()
+    format_checker.checks("counted")(lambda instance: calls.append(1) or True)
+    schema = {
+        "type": "array",
+        "items": {
+            "pattern": "^a",
+            "format": "counted",
+            "$ref": "#/$defs/Counted",
+            "type": "string",
+        },
+        "$defs": {"Counted": {"format": "counted"}},
+    }
+    validator = OAS31Validator(schema, format_checker=format_checker)
+
+    assert not validator.is_valid(["a", 1])
+    assert len(calls) == 2
+    assert validator.is_valid(["a"])
+    assert len(calls) == 4
+
+
+def test_iter_errors_keeps_schema_order():
+    schema = {
+        "properties": {
+            "name": {"pattern": "^a", "format": "uuid", "maxLength": 1},
+        },
+        "type": "object",
+    }
+    validator = OAS31Validator(schema, format_checker=oas31_format_checker)
+
+    assert not validator.is_valid({"name": "bb"})
+    assert [
+        error.validator for error in validator.iter_errors({"name": "bb"})
+    ] == ["pattern", "format", "maxLength"]
+    assert [error.validator for error in validator.iter_errors([])] == ["type"]
+
+
+def test_plan_ordered_by_cost():
+    schema = {
+        "unevaluatedProperties": False,
+        "$ref": "#/$defs/Named",
+        "properties": {"name": {"type": "string"}},
+        "pattern": "^a",
+        "required": ["name"],
+        "type": "object",
+        "$defs": {"Named": {"required": ["name"]}},
+    }
+    validator = OAS31Validator(schema)
+
+    plan = _dispatch.keyword_plan(validator)
+
+    assert [keyword for _, keyword, _ in plan] == [
+        "unevaluatedProperties",
+        "$ref",
+        "properties",
+        "pattern",
+        "required",
+        "type",
+    ]
+    assert [keyword for _, keyword, _ in plan.ordered] == [
+        "type",
+        "required",
+        "properties",
+        "pattern",
+        "$ref",
+        "unevaluatedProperties",
+    ]
+
+
+@pytest.mark.parametrize(
+    "validator_class",
+    [OAS30Validator, OAS30StrictValidator],
+)
+@pytest.mark.parametrize(
+    "schema",
+    [
+        {"type": "string"},
+        {"type": "string", "nullable": True},
+        {"type": "string", "nullable": "yes"},
+        {"type": "string", "format": "binary"},
+        {"type": "string", "format": "binary", "nullable": True},
+        {"type": "integer"},
+        {"type": "number", "nullable": True},
+        {"type": "boolean"},
+        {"type": "array"},
+        {"type": "object", "nullable": True},
+    ],
+)
+def test_compiled_type_matches_type(validator_class, schema):
+    validator = validator_class(schema)
+    reference = extend(validator_class, {})(schema)
+
+    implementations = {
+        keyword: implementation
+        for implementation, keyword, _ in validator._validators
+    }
+    assert implementations["type"] is not validator_class.VALIDATORS["type"]
+    for instance in [None, "", b"", 1, 1.0, 1.5, True, [], (), {}]:
+        assert [
+            error.message for error in validator.iter_errors(instance)
+        ] == [error.message for error in reference.iter_errors(instance)]
+        assert validator.is_valid(instance) is reference.is_valid(instance)
+
+
+class ReprCounted(list):
+    calls = 0
+
+    def __repr__(self):
+        ReprCounted.calls += 1
+        return super().__repr__()
+
+
+@pytest.mark.parametrize(
+    "schema",
+    [
+        {"anyOf": [{"type": "object"}, {"minItems": 5}]},
+        {"oneOf": [{"type": "array"}, {"items": {"type": "integer"}}]},
+        {"not": {"type": "array"}},
+        {"items": {"enum": [1, 2]}, "uniqueItems": True},
+        {"contains": {"const": 3}, "maxItems": 1},
+    ],
+)
+def test_is_valid_builds_no_errors(schema):
+    validator = OAS31Validator(schema)
+    instance = ReprCounted([1, 1])
+    ReprCounted.calls = 0
+
+    assert not validator.is_valid(instance)
+    assert ReprCounted.calls == 0
+    assert list(validator.iter_errors(instance))
+    assert ReprCounted.calls > 0
+
+
+IS_VALID_SCHEMAS = [
+    {"type": ["string", "null"], "minLength": 2, "maxLength": 3},
+    {"enum": [1, "a", None]},
+    {"const": {"a": [1]}},
+    {"minimum": 1, "exclusiveMaximum": 3, "multipleOf": 0.5},
+    {"maximum": 3, "exclusiveMinimum": 1, "multipleOf": 2},
+    {"minItems": 1, "maxItems": 2, "uniqueItems": True},
+    {"minProperties": 1, "maxProperties": 2, "required": ["a"]},
+    {"dependentRequired": {"a": ["b"]}},
+    {"properties": {"a": {"type": "integer"}}, "additionalProperties": False},
+    {
+        "patternProperties": {"^b": {}},
+        "additionalProperties": {"type": "null"},
+    },
+    {"prefixItems": [{"type": "integer"}], "items": False},
+    {"prefixItems": [{}], "items": {"type": "string"}},
+    {"allOf": [{"minLength": 1}, {"maxLength": 1}]},
+    {"anyOf": [{"type": "integer"}, {"type": "string"}]},
+    {"oneOf": [{"minimum": 1}, {"maximum": 3}]},
+    {"not": {"type": "array"}},
+    {"contains": {"type": "integer"}, "minContains": 2, "maxContains": 3},
+    {"$ref": "#/$defs/a", "$defs": {"a": {"type": "object"}}},
+    {"items": False},
+    {"properties": {"a": False, "b": True}},
+    {"patternProperties": {"^a": {"type": "integer"}, "^b": False}},
+]
+IS_VALID_INSTANCES = [
+    None,
+    "",
+    "ab",
+    "abcd",
+    0,
+    1,
+    2,
+    2.5,
+    4,
+    True,
+    [],
+    [1],
+    [1, 1],
+    [1, "a"],
+    [1, 2, 3, 4],
+    {},
+    {"a": 1},
+    {"a": "x", "b": None},
+    {"b": 1},
+    {"a": [1]},
+]
+
+
+@pytest.mark.parametrize("validator_class", [OAS31Validator, OAS32Validator])
+@pytest.mark.parametrize("schema", IS_VALID_SCHEMAS)
+def test_is_valid_matches_unplanned(validator_class, schema):
+    validator = validator_class(schema)
+    reference = extend(validator_class, {})(schema)
+
+    for instance in IS_VALID_INSTANCES:
+        assert validator.is_valid(instance) is reference.is_valid(
+            instance
+        ), instance
+
+
+@pytest.mark.parametrize("validator_class", [OAS31Validator, OAS32Validator])
+@pytest.mark.parametrize("schema", IS_VALID_SCHEMAS)
+def test_is_valid_matches_iter_errors(validator_class, schema):
+    validator = validator_class(schema)
+
+    for instance in IS_VALID_INSTANCES:
+        assert validator.is_valid(instance) is not any(
+            True for _ in validator.iter_errors(instance)
+        ), instance
+
+
+def test_dynamic_ref_is_valid_matches_iter_errors():
+    validator = OAS31Validator(
+        {
+            "$id": "https://example.com/tree",
+            "$dynamicAnchor": "node",
+            "type": ["object", "integer"],
+            "properties": {"a": {"$dynamicRef": "#node"}},
+        }
+    )
+
+    for instance in IS_VALID_INSTANCES + [{"a": {"a": 1}}, {"a": {"a": "x"}}]:
+        assert validator.is_valid(instance) is not any(
+            True for _ in validator.iter_errors(instance)
+        ), instance
+
+
+def test_is_valid_failures_are_not_shared():
+    seen = []
+
+    def collect(validator, value, instance, schema):
+        for error in validator.descend(instance, value):
+            seen.append((error, error.parent))
+            yield ValidationError("collected", context=[error])
+
+    validator_class = extend(OAS31Validator, {"x-collect": collect})
+    _dispatch.plan_keywords(validator_class)
+    validator = validator_class({"x-collect": False})
+
+    assert not validator.is_valid(1)
+    assert not validator.is_valid(2)
+    [(first, first_parent), (second, second_parent)] = seen
+    assert first is not second
+    assert first_parent is second_parent is None
+
+
+OAS30_IS_VALID_SCHEMAS = [
+    {"type": "number", "minimum": 1, "exclusiveMinimum": True},
+    {"type": "integer", "maximum": 2, "exclusiveMaximum": True},
+    {"type": "string", "nullable": True, "format": "binary"},
+    {
+        "type": "object",
+        "properties": {
+            "a": {"type": "integer", "readOnly": True},
+            "b": {"type": "string", "writeOnly": True},
+        },
+        "required": ["a", "b"],
+        "additionalProperties": False,
+    },
+    {"additionalProperties": {"type": "integer"}},
+    {"anyOf": [{"type": "integer"}, {"type": "string"}]},
+    {"oneOf": [{"minimum": 1}, {"maximum": 3}]},
+    {"allOf": [{"type": "string"}, {"maxLength": 1}]},
+    {
+        "oneOf": [{"$ref": "#/components/schemas/A"}],
+        "discriminator": {"propertyName": "kind"},
+        "components": {"schemas": {"A": {"required": ["a"]}}},
+    },
+]
+OAS30_IS_VALID_INSTANCES = IS_VALID_INSTANCES + [
+    b"",
+    {"kind": "A", "a": 1},
+    {"kind": "A"},
+    {"a": 1, "b": "x"},
+]
+OAS30_VALIDATOR_CLASSES = [
+    OAS30Validator,
+    OAS30StrictValidator,
+    OAS30ReadValidator,
+    OAS30WriteValidator,
+]
+
+
+@pytest.mark.parametrize("validator_class", OAS30_VALIDATOR_CLASSES)
+@pytest.mark.parametrize("schema", OAS30_IS_VALID_SCHEMAS)
+def test_oas30_is_valid_matches_unplanned(validator_class, schema):
+    validator = validator_class(schema)
+    reference = extend(validator_class, {})(schema)
+
+    for instance in OAS30_IS_VALID_INSTANCES:
+        assert validator.is_valid(instance) is reference.is_valid(
+            instance
+        ), instance
+
+
+@pytest.mark.parametrize("validator_class", OAS30_VALIDATOR_CLASSES)
+@pytest.mark.parametrize("schema", OAS30_IS_VALID_SCHEMAS)
+def test_oas30_is_valid_matches_iter_errors(validator_class, schema):
+    validator = validator_class(schema)
+
+    for instance in OAS30_IS_VALID_INSTANCES:
+        assert validator.is_valid(instance) is not any(
+            True for _ in validator.iter_errors(instance)
+        ), instance
+
+
+@pytest.mark.parametrize(
+    "schema",
+    [
+        {"type": "string"},
+        {"type": ["string", "null"]},
+        {"type": ["integer", "boolean"]},
+        {"type": "number"},
+        {"type": ["array", "object"]},
+    ],
+)
+def test_compiled_json_type_matches_type(schema):
+    validator = OAS31Validator(schema)
+    reference = extend(OAS31Validator, {})(schema)
+
+    for instance in [None, "", 1, 1.0, 1.5, True, [], (), {}]:
+        assert [
+            error.message for error in validator.iter_errors(instance)
+        ] == [error.message for error in reference.iter_errors(instance)]
+        assert validator.is_valid(instance) is reference.is_valid(instance)
@@ -0,0 +1,274 @@
+import random
+import tracemalloc
+from base64 import b64decode
+from base64 import b64encode
+
+import pytest
+from jsonschema import FormatChecker
+
+from openapi_schema_validator import OAS31Validator
+from openapi_schema_validator._format import OpenAPIFormatChecker
+from openapi_schema_validator._format import is_binary_strict
+from openapi_schema_validator._format import is_byte
+from openapi_schema_validator._format import oas31_format_checker
+from openapi_schema_validator._format import oas32_format_checker
+from openapi_schema_validator.settings import reset_settings_cache
+
+GENERIC_FORMAT_CHECKER = FormatChecker()
+
+SAMPLES = {
+    "date-time": [
+        "2024-02-29T12:30:45Z",
+        "2023-02-29T12:30:45Z",
+        "1900-02-29T00:00:00Z",
+        "2000-02-29T00:00:00Z",
+        "0000-01-01T00:00:00Z",
+        "0001-01-01T00:00:00Z",
+        "2024-04-31T00:00:00Z",
+        "2024-12-31T23:59:59.123456+05:30",
+        "2024-12-31t23:59:59z",
+        "2024-12-31T23:59:60Z",
+        "2024-12-31T24:00:00Z",
+        "2024-12-00T00:00:00Z",
+        "2024-13-01T00:00:00Z",
+        "2024-01-01T00:00:00Z\n",
+        "2024-01-01T00:00:00Z\n\n",
+        "2024-01-01T00:00:00",
+        "2024-01-01 00:00:00Z",
+        "2024-01-01T00:00:00.Z",
+        "2024-01-01T00:00:00+24:00",
+        "٢024-01-01T00:00:00Z",
+        "",
+    ],
+    "date": [
+        "2024-02-29",
+        "2023-02-29",
+        "0000-01-01",
+        "0001-01-01",
+        "2024-06-31",
+        "2024-06-30",
+        "2024-00-10",
+        "2024-1-10",
+        "2024-01-10\n",
+        "2024-01-10T00:00:00Z",
+        "٢024-01-01",
+        "",
+    ],
+    "uuid": [
+        "123e4567-e89b-12d3-a456-426614174000",
+        "123E4567-E89B-12D3-A456-426614174000",
+        "123e4567-e89b-12d3-a456-42661417400g",
+        "123e4567e89b12d3a456426614174000",
+        "{123e4567-e89b-12d3-a456-426614174000}",
+        "urn:uuid:123e4567-e89b-12d3-a456-426614174000",
+        "123e4567-e89b-12d3-a456_426614174000",
+        "123e-4567-e89b-12d3-a456-426614174000",
+        "123e4567-e89b-12d3-a456-4266141740000",
+        "",
+    ],
+    "ipv4": [
+        "0.0.0.0",
+        "127.0.0.1",
+        "255.255.255.255",
+        "256.0.0.1",
+        "01.2.3.4",
+        "1.2.3",
+        "1.2.3.4.5",
+        "1.2.3.4\n",
+        " 1.2.3.4",
+        "1..3.4",
+        "1.2.3.٤",
+        "1.2.3.4/32",
+        "",
+    ],
+}
+
+
+def _mutations(value, seed):
+    rng = random.Random(seed)
+    alphabet = "0123456789-:.TZtz+abcfABCF_\n"
+    for _ in range(300):
+        chars = list(value)
+        for _ in range(rng.randint(1, 3)):
+            position = rng.randrange(len(chars) + 1)
+            operation = rng.randrange(3)
+            if operation == 0 or not chars[position:]:
+                chars.insert(position, rng.choice(alphabet))
+            elif operation == 1:
+                chars[position] = rng.choice(alphabet)
+            else:
+                del chars[position]
+        yield "".join(chars)
+
+
+@pytest.mark.parametrize(
+    "format_checker",
+    [oas31_format_checker, oas32_format_checker],
+)
+@pytest.mark.parametrize("format", sorted(SAMPLES))
+def test_string_format_conformance(format_checker, format):
+    if format not in GENERIC_FORMAT_CHECKER.checkers:
+        pytest.skip(f"{format} requires an optional dependency")
+    values = list(SAMPLES[format])
+    for value in SAMPLES[format][:2]:
+        values.extend(_mutations(value, format))
+
+    for value in values:
+        assert format_checker.conforms(value, format) is (
+            GENERIC_FORMAT_CHECKER.conforms(value, format)
+        ), value
+
+
+@pytest.fixture
+def format_checker():
+    format_checker = OpenAPIFormatChecker()
+    format_checker.enable_cache(max_size=2)
+    return format_checker
+
+
+def test_format_cache(format_checker):
+    validator = OAS31Validator(
+        {"type": "string", "format": "uuid"},
+        format_checker=format_checker,
+    )
+
+    for _ in range(3):
+        assert validator.is_valid("123e4567-e89b-12d3-a456-426614174000")
+        errors = list(validator.iter_errors("123e4567"))
+        assert [error.message for error in errors] == [
+            "'123e4567' is not a 'uuid'"
+        ]
+        assert isinstance(errors[0].cause, ValueError)
+
+    stats = format_checker.cache_stats()
+    assert (stats.hits, stats.misses, stats.size) == (4, 2, 2)
+    assert stats.hit_rate == pytest.approx(4 / 6)
+
+
+def test_format_cache_eviction(format_checker):
+    for value in ["1.2.3.4", "1.2.3.5", "1.2.3.6", "1.2.3.4"]:
+        assert format_checker.conforms(value, "ipv4")
+
+    stats = format_checker.cache_stats()
+    assert (stats.hits, stats.misses, stats.size) == (0, 4, 2)
+
+
+def test_format_cache_formats_and_types(format_checker):
+    format_checker.enable_cache(formats=["ipv4"])
+
+    assert not format_checker.conforms("x", "uuid")
+    assert format_checker.conforms(1, "ipv4")
+    assert format_checker.conforms("1.2.3.4", "ipv4")
+    assert format_checker.cache_stats().misses == 1
+
+    format_checker.disable_cache()
+    assert format_checker.cache_stats() is None
+
+
+def test_format_cache_skips_long_values():
+    format_checker = OpenAPIFormatChecker()
+    format_checker.checks("byte")(is_byte)
+    format_checker.enable_cache(max_value_length=8)
+    short = "QUJD"
+    long = b64encode(b"x" * 1024).decode()
+
+    for _ in range(2):
+        assert format_checker.conforms(short, "byte")
+        assert format_checker.conforms(long, "byte")
+        assert not format_checker.conforms(long + "!", "byte")
+
+    stats = format_checker.cache_stats()
+    assert (stats.hits, stats.misses, stats.size) == (1, 1, 1)
+
+
+@pytest.fixture
+def short_format_cache_values(monkeypatch):
+    monkeypatch.setenv(
+        "OPENAPI_SCHEMA_VALIDATOR_FORMAT_CHECK_CACHE_MAX_VALUE_LENGTH", "2"
+    )
+    reset_settings_cache()
+    yield
+    monkeypatch.undo()
+    reset_settings_cache()
+
+
+def test_format_cache_max_value_length_from_env(short_format_cache_values):
+    format_checker = OpenAPIFormatChecker()
+    format_checker.checks("byte")(is_byte)
+    format_checker.enable_cache()
+
+    format_checker.conforms("QUJD", "byte")
+    format_checker.conforms("QQ", "byte")
+
+    assert format_checker.cache_stats().size == 1
+
+
+def test_format_cache_negative_max_value_length():
+    with pytest.raises(ValueError):
+        OpenAPIFormatChecker().enable_cache(max_value_length=-1)
+
+
+def test_format_cache_cleared_by_checks(format_checker):
+    assert format_checker.conforms("abc", "password")
+
+    format_checker.checks("password")(lambda instance: False)
+
+    assert not format_checker.conforms("abc", "password")
+
+
+BASE64_SAMPLES = [
+    "",
+    "QQ==",
+    "QUI=",
+    "QUJD",
+    "QUJD=",
+    "QUJD===",
+    "QQ=",
+    "QUI==",
+    "Q",
+    "=",
+    "==QQ",
+    "QQ==QQ==",
+    "QU JD",
+    "QUJD\n",
+    "QU!JD",
+    "QUJ+/w==",
+    "QUJ-_w==",
+    "QUJDé",
+]
+
+
+def _b64decodes(value, **kwargs):
+    try:
+        b64decode(value, **kwargs)
+    except ValueError:
+        return False
+    return True
+
+
+@pytest.mark.parametrize("value", BASE64_SAMPLES)
+def test_byte_conformance(value):
+    valid = _b64decodes(value.encode(), validate=True)
+
+    assert is_byte(value) is valid
+    for value_type in (bytes, bytearray, memoryview):
+        assert is_byte(value_type(value.encode())) is valid
+    assert is_binary_strict(value) is _b64decodes(value)
+
+
+def test_byte_non_contiguous_memoryview():
+    assert is_byte(memoryview(b"Q!Q!Q!=!")[::2])
+    assert not is_byte(memoryview(b"Q!Q!")[::2])
+
+
+def test_byte_large_value_memory():
+    value = b64encode(bytes(1_000_000)).decode()
+
+    tracemalloc.start()
+    try:
+        assert is_byte(value)
+        assert is_binary_strict(value)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert peak < len(value) // 4
@@ -0,0 +1,222 @@
+import copy
+import json
+
+import pytest
+from referencing import Registry
+from referencing.jsonschema import DRAFT202012
+
+from openapi_schema_validator import OAS30Validator
+from openapi_schema_validator import OAS31Validator
+from openapi_schema_validator import OAS32Validator
+from openapi_schema_validator.graph import build_schema_graph
+
+
+def _errors(validator, instance):
+    return sorted(
+        (error.validator, list(error.path))
+        for error in validator.iter_errors(instance)
+    )
+
+
+def test_local_references_linked():
+    schema = {
+        "type": "object",
+        "properties": {
+            "owner": {"$ref": "#/$defs/Person"},
+            "tenant": {"$ref": "#/$defs/Person", "description": "tenant"},
+        },
+        "$defs": {
+            "Person": {
+                "type": "object",
+                "properties": {"name": {"$ref": "#/$defs/Name"}},
+            },
+            "Name": {"type": "string"},
+        },
+    }
+    original = copy.deepcopy(schema)
+
+    graph = build_schema_graph(schema, OAS31Validator)
+
+    assert schema == original
+    person = graph["$defs"]["Person"]
+    assert graph["properties"]["owner"] is person
+    assert graph["properties"]["tenant"] is person
+    assert person["properties"]["name"] is graph["$defs"]["Name"]
+    validator = OAS31Validator(graph)
+    assert validator.is_valid({"owner": {"name": "Ann"}})
+    assert _errors(validator, {"owner": {"name": 1}, "tenant": {}}) == [
+        ("type", ["owner", "name"])
+    ]
+
+
+def test_recursive_references_kept():
+    schema = {
+        "$defs": {
+            "Node": {
+                "type": "object",
+                "properties": {
+                    "children": {
+                        "type": "array",
+                        "items": {"$ref": "#/$defs/Node"},
+                    },
+                },
+            },
+        },
+        "$ref": "#/$defs/Node",
+    }
+
+    graph = build_schema_graph(schema, OAS31Validator)
+
+    node = graph["$defs"]["Node"]
+    assert node["properties"]["children"]["items"] == {"$ref": "#/$defs/Node"}
+    json.dumps(graph)
+    validator = OAS31Validator(graph)
+    assert validator.is_valid({"children": [{"children": []}]})
+    assert not validator.is_valid({"children": [{"children": [1]}]})
+
+
+def test_reference_with_validation_siblings_kept():
+    schema = {
+        "properties": {"a": {"$ref": "#/$defs/A", "minLength": 2}},
+        "$defs": {"A": {"type": "string"}},
+    }
+
+    graph = build_schema_graph(schema, OAS31Validator)
+
+    assert graph["properties"]["a"] == {"$ref": "#/$defs/A", "minLength": 2}
+    assert not OAS31Validator(graph).is_valid({"a": "x"})
+
+
+def test_registry_references_linked():
+    registry = Registry().with_resources(
+        [
+            (
+                "urn:name",
+                DRAFT202012.create_resource(
+                    {
+                        "$defs": {"text": {"type": "string"}},
+                        "allOf": [{"$ref": "#/$defs/text"}],
+                    }
+                ),
+            ),
+            (
+                "urn:code",
+                DRAFT202012.create_resource(
+                    {
+                        "$defs": {"text": {"type": "string"}},
+                        "$ref": "#/$defs/text",
+                        "minLength": 3,
+                    }
+                ),
+            ),
+        ]
+    )
+    schema = {
+        "properties": {
+            "name": {"$ref": "urn:name"},
+            "code": {"$ref": "urn:code"},
+        },
+    }
+
+    graph = build_schema_graph(schema, OAS32Validator, registry=registry)
+
+    name = graph["properties"]["name"]
+    assert name["allOf"] == [name["$defs"]["text"]]
+    # a reference kept inside another resource would lose its base URI
+    assert graph["properties"]["code"] == {"$ref": "urn:code"}
+    validator = OAS32Validator(graph, registry=registry)
+    assert validator.is_valid({"name": "Ann", "code": "abc"})
+    assert _errors(validator, {"name": 1, "code": "ab"}) == [
+        ("minLength", ["code"]),
+        ("type", ["name"]),
+    ]
+
+
+def test_embedded_resources_kept():
+    embedded = {
+        "$id": "https://example.com/embedded",
+        "$defs": {"text": {"type": "string"}},
+        "items": {"$ref": "#/$defs/text"},
+    }
+    schema = {
+        "$id": "https://example.com/root",
+        "properties": {"a": {"$ref": "embedded"}},
+        "$defs": {"embedded": embedded},
+    }
+
+    graph = build_schema_graph(schema, OAS31Validator)
+
+    assert graph["$defs"]["embedded"] is embedded
+    assert graph["properties"]["a"] is embedded
+    validator = OAS31Validator(graph)
+    assert validator.is_valid({"a": ["x"]})
+    assert not validator.is_valid({"a": [1]})
+
+
+def test_dynamic_references_unchanged():
+    schema = {
+        "$dynamicAnchor": "node",
+        "properties": {"children": {"items": {"$dynamicRef": "#node"}}},
+    }
+
+    assert build_schema_graph(schema, OAS31Validator) is schema
+
+
+@pytest.mark.parametrize(
+    "instance",
+    [
+        {"discipline": "mountain_hiking", "length": 10},
+        {"discipline": "mountain_hiking", "length": "10"},
+        {"discipline": "alpine_climbing", "height": 1},
+        {"discipline": "unknown"},
+        {},
+    ],
+)
+def test_discriminator(instance):
+    schema = {
+        "$ref": "#/components/schemas/Route",
+        "components": {
+            "schemas": {
+                "MountainHiking": {
+                    "type": "object",
+                    "properties": {"length": {"type": "integer"}},
+                    "required": ["length"],
+                },
+                "AlpineClimbing": {
+                    "type": "object",
+                    "properties": {"height": {"type": "integer"}},
+                    "required": ["height"],
+                },
+                "Route": {
+                    "oneOf": [
+                        {"$ref": "#/components/schemas/MountainHiking"},
+                        {"$ref": "#/components/schemas/AlpineClimbing"},
+                    ],
+                    "discriminator": {
+                        "propertyName": "discipline",
+                        "mapping": {
+                            "mountain_hiking": (
+                                "#/components/schemas/MountainHiking"
+                            ),
+                            "alpine_climbing": (
+                                "#/components/schemas/AlpineClimbing"
+                            ),
+                        },
+                    },
+                },
+            }
+        },
+    }
+
+    graph = build_schema_graph(schema, OAS30Validator)
+
+    schemas = graph["components"]["schemas"]
+    assert schemas["Route"]["oneOf"] == [
+        schemas["MountainHiking"],
+        schemas["AlpineClimbing"],
+    ]
+    assert [
+        error.message for error in OAS30Validator(graph).iter_errors(instance)
+    ] == [
+        error.message for error in OAS30Validator(schema).iter_errors(instance)
+    ]
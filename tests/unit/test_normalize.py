@@ -0,0 +1,222 @@
+import copy
+
+import pytest
+from referencing.exceptions import PointerToNowhere
+from referencing.exceptions import Unresolvable
+
+from openapi_schema_validator import OAS30NormalizedValidator
+from openapi_schema_validator import OAS30Validator
+from openapi_schema_validator.normalize import normalize_oas30_schema
+
+
+def _paths(validator, instance):
+    return sorted(
+        list(error.path) for error in validator.iter_errors(instance)
+    )
+
+
+def test_keywords_rewritten():
+    schema = {
+        "type": "object",
+        "nullable": True,
+        "properties": {
+            "count": {
+                "type": "integer",
+                "minimum": 0,
+                "exclusiveMinimum": True,
+                "maximum": 10,
+                "exclusiveMaximum": False,
+                "example": 1,
+            },
+            "tags": {"type": "array", "items": {"type": "string"}},
+        },
+        "example": {"count": 1},
+    }
+    original = copy.deepcopy(schema)
+
+    normalized = normalize_oas30_schema(schema)
+
+    assert schema == original
+    assert normalized == {
+        "type": ["object", "null"],
+        "properties": {
+            "count": {
+                "type": "integer",
+                "exclusiveMinimum": 0,
+                "maximum": 10,
+                "examples": [1],
+            },
+            "tags": {"type": "array", "items": {"type": "string"}},
+        },
+        "examples": [{"count": 1}],
+    }
+    OAS30NormalizedValidator.check_schema(normalized)
+
+
+def test_ignored_keywords_dropped():
+    schema = {
+        "id": "https://example.com/pet",
+        "$id": "https://example.com/other",
+        "$anchor": "other",
+        "const": 1,
+        "prefixItems": [{"type": "string"}],
+        "patternProperties": {"^x-": {"type": "string"}},
+        "additionalProperties": False,
+    }
+
+    normalized = normalize_oas30_schema(schema)
+
+    assert normalized == {
+        "$id": "https://example.com/pet",
+        "patternProperties": {"^x-": True},
+        "additionalProperties": False,
+    }
+
+
+def test_references_rewritten():
+    schema = {
+        "$ref": "#/components/schemas/Pet",
+        "components": {
+            "schemas": {
+                "Pet": {
+                    "properties": {"name": {"$ref": "#/definitions/Name"}},
+                },
+            },
+        },
+        "definitions": {"Name": {"type": "string", "nullable": True}},
+    }
+
+    normalized = normalize_oas30_schema(schema)
+
+    assert normalized["definitions"]["Name"]["type"] == ["string", "null"]
+    validator = OAS30NormalizedValidator(normalized)
+    assert validator.is_valid({"name": None})
+    assert not validator.is_valid({"name": 1})
+
+
+IDENTIFIED_SCHEMA = {
+    "properties": {
+        "pet": {"$ref": "#/definitions/Pet"},
+        "name": {"$ref": "#name"},
+        "owner": {"$ref": "https://example.com/owner"},
+        "alias": {"$ref": "#/definitions/Alias"},
+    },
+    "definitions": {
+        "Pet": {
+            "id": "pet",
+            "properties": {"kind": {"$ref": "#/definitions/Kind"}},
+            "definitions": {"Kind": {"type": "string"}},
+        },
+        "Name": {"id": "#name", "type": "string"},
+        "Alias": {"id": "alias", "$ref": "#/definitions/Id"},
+        "Owner": {
+            "id": "https://example.com/owner",
+            "properties": {"id": {"$ref": "#/definitions/Id"}},
+            "definitions": {"Id": {"type": "integer"}},
+        },
+        "Id": {"type": "string"},
+    },
+}
+
+
+@pytest.mark.parametrize(
+    "instance",
+    [
+        {"pet": {"kind": "cat"}},
+        {"pet": {"kind": 1}},
+        {"name": "Ann"},
+        {"name": 1},
+        {"owner": {"id": 1}},
+        {"owner": {"id": "1"}},
+        {"alias": "1"},
+        {"alias": 1},
+    ],
+)
+def test_references_under_id_match_oas30(instance):
+    validator = OAS30Validator(IDENTIFIED_SCHEMA)
+    normalized = OAS30NormalizedValidator(
+        normalize_oas30_schema(IDENTIFIED_SCHEMA)
+    )
+
+    assert normalized.is_valid(instance) is validator.is_valid(instance)
+    assert _paths(normalized, instance) == _paths(validator, instance)
+
+
+def test_relative_reference_under_id_unresolvable():
+    # the reference is relative to the id, where there are no definitions
+    schema = {
+        "properties": {"pet": {"$ref": "#/definitions/Pet"}},
+        "definitions": {
+            "Pet": {
+                "id": "foo",
+                "properties": {"kind": {"$ref": "#/definitions/Kind"}},
+            },
+            "Kind": {"type": "string"},
+        },
+    }
+    validator = OAS30Validator(schema)
+    normalized = OAS30NormalizedValidator(normalize_oas30_schema(schema))
+
+    for each in (validator, normalized):
+        with pytest.raises(Unresolvable) as exc_info:
+            each.is_valid({"pet": {"kind": 1}})
+        assert isinstance(exc_info.value.__cause__, PointerToNowhere)
+
+
+SCHEMA = {
+    "type": "object",
+    "required": ["id", "name", "secret"],
+    "properties": {
+        "id": {"type": "integer", "readOnly": True},
+        "name": {"type": "string", "nullable": True, "maxLength": 3},
+        "secret": {"type": "string", "writeOnly": True},
+        "score": {
+            "type": "number",
+            "minimum": 0,
+            "maximum": 1,
+            "exclusiveMaximum": True,
+        },
+        "tags": {"type": "array", "items": {"type": "string"}},
+        "extra": {"const": 1, "patternProperties": {"^a": False}},
+        "pet": {
+            "oneOf": [
+                {"$ref": "#/components/schemas/Cat"},
+                {"$ref": "#/components/schemas/Dog"},
+            ],
+            "discriminator": {"propertyName": "kind"},
+        },
+    },
+    "additionalProperties": False,
+    "components": {
+        "schemas": {
+            "Cat": {"type": "object", "required": ["lives"]},
+            "Dog": {"type": "object", "required": ["bark"]},
+        },
+    },
+}
+
+
+@pytest.mark.parametrize(
+    "instance",
+    [
+        {"name": "Ann"},
+        {"name": None},
+        {"name": "Annabel", "score": 1},
+        {"id": 1.0, "score": 0.5},
+        {"score": True, "tags": ["a", None]},
+        {"extra": 2},
+        {"extra": {"a": 1}, "other": 1},
+        {"pet": {"kind": "Cat", "lives": 9}},
+        {"pet": {"kind": "Dog", "lives": 9}},
+        {"pet": {"kind": "Cow"}},
+        {"pet": {}},
+        None,
+        [],
+    ],
+)
+def test_validation_matches_oas30(instance):
+    validator = OAS30Validator(SCHEMA)
+    normalized = OAS30NormalizedValidator(normalize_oas30_schema(SCHEMA))
+
+    assert normalized.is_valid(instance) is validator.is_valid(instance)
+    assert _paths(normalized, instance) == _paths(validator, instance)
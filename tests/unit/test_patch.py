@@ -0,0 +1,195 @@
+from copy import deepcopy
+
+import pytest
+from jsonschema.exceptions import ValidationError
+
+from openapi_schema_validator import OAS30Validator
+from openapi_schema_validator import OAS31Validator
+from openapi_schema_validator.patch import PatchError
+from openapi_schema_validator.patch import apply_patch
+from openapi_schema_validator.patch import iter_patch_errors
+from openapi_schema_validator.patch import validate_patch
+
+SCHEMA = {
+    "type": "object",
+    "required": ["name", "tags"],
+    "additionalProperties": False,
+    "properties": {
+        "name": {"type": "string", "minLength": 1},
+        "tags": {
+            "type": "array",
+            "maxItems": 3,
+            "items": {"$ref": "#/$defs/tag"},
+        },
+        "owner": {"allOf": [{"$ref": "#/$defs/owner"}]},
+        "kind": {"oneOf": [{"type": "integer"}, {"type": "string"}]},
+        "point": {
+            "type": "array",
+            "prefixItems": [{"type": "integer"}, {"type": "string"}],
+        },
+    },
+    "$defs": {
+        "tag": {"type": "string", "pattern": "^[a-z]+$"},
+        "owner": {
+            "type": "object",
+            "required": ["id"],
+            "properties": {"id": {"type": "integer"}},
+        },
+    },
+}
+
+DOCUMENT = {
+    "name": "pet",
+    "tags": ["a", "b"],
+    "owner": {"id": 1},
+    "kind": 1,
+    "point": [1, "x"],
+}
+
+
+def _errors(errors):
+    return sorted(
+        (error.validator, list(error.path), list(error.schema_path))
+        for error in errors
+    )
+
+
+@pytest.mark.parametrize(
+    "patch",
+    [
+        [{"op": "replace", "path": "/name", "value": ""}],
+        [{"op": "remove", "path": "/name"}],
+        [{"op": "add", "path": "/extra", "value": 1}],
+        [{"op": "add", "path": "/tags/-", "value": "c"}],
+        [{"op": "add", "path": "/tags/0", "value": "C"}],
+        [
+            {"op": "add", "path": "/tags/-", "value": "c"},
+            {"op": "add", "path": "/tags/0", "value": "d"},
+        ],
+        [{"op": "replace", "path": "/tags/1", "value": 2}],
+        [{"op": "remove", "path": "/owner/id"}],
+        [{"op": "replace", "path": "/owner/id", "value": "1"}],
+        [{"op": "replace", "path": "/kind", "value": None}],
+        [{"op": "remove", "path": "/point/0"}],
+        [{"op": "move", "from": "/name", "path": "/tags/0"}],
+        [{"op": "copy", "from": "/owner", "path": "/name"}],
+        [{"op": "replace", "path": "", "value": []}],
+    ],
+)
+def test_patch_errors_match_full_validation(patch):
+    validator = OAS31Validator(SCHEMA)
+    assert validator.is_valid(DOCUMENT)
+
+    patched, changes = apply_patch(DOCUMENT, patch)
+
+    assert _errors(iter_patch_errors(validator, patched, changes)) == (
+        _errors(validator.iter_errors(patched))
+    )
+
+
+def test_patch_errors_oas30_nullable():
+    validator = OAS30Validator(
+        {
+            "type": "object",
+            "required": ["a"],
+            "properties": {
+                "a": {"type": "integer", "nullable": True},
+                "b": {"type": "array", "items": {"type": "integer"}},
+            },
+        }
+    )
+    document = {"a": 1, "b": [1, 2]}
+    patch = [
+        {"op": "replace", "path": "/a", "value": None},
+        {"op": "replace", "path": "/b/1", "value": None},
+    ]
+
+    patched, changes = apply_patch(document, patch)
+
+    assert _errors(iter_patch_errors(validator, patched, changes)) == (
+        _errors(validator.iter_errors(patched))
+    )
+
+
+def test_patch_untouched_members_are_not_revalidated():
+    validator = OAS31Validator(
+        {"type": "object", "additionalProperties": {"minimum": 0}}
+    )
+    # invalid before the patch, but outside of the patched locations
+    document = {"a": -1, "b": 1}
+
+    patched, changes = apply_patch(
+        document, [{"op": "replace", "path": "/b", "value": 2}]
+    )
+
+    assert list(iter_patch_errors(validator, patched, changes)) == []
+
+
+def test_apply_patch_copies_only_patched_path():
+    document = {"a": {"b": [1, 2]}, "c": {"d": 1}}
+    original = deepcopy(document)
+
+    patched, changes = apply_patch(
+        document, [{"op": "add", "path": "/a/b/1", "value": 3}]
+    )
+
+    assert document == original
+    assert patched == {"a": {"b": [1, 3, 2]}, "c": {"d": 1}}
+    assert patched["c"] is document["c"]
+    assert changes.values == {("a", "b", 1)}
+    assert changes.containers == {("a", "b")}
+    assert changes.shifted == {("a", "b")}
+
+
+def test_validate_patch():
+    validator = OAS31Validator(SCHEMA)
+
+    patched = validate_patch(
+        validator, DOCUMENT, [{"op": "replace", "path": "/name", "value": "x"}]
+    )
+
+    assert patched["name"] == "x"
+    with pytest.raises(ValidationError, match="should be non-empty"):
+        validate_patch(
+            validator,
+            DOCUMENT,
+            [{"op": "replace", "path": "/name", "value": ""}],
+        )
+
+
+@pytest.mark.parametrize(
+    "patch",
+    [
+        [{"op": "remove", "path": "/missing"}],
+        [{"op": "add", "path": "/tags/5", "value": "x"}],
+        [{"op": "add", "path": "name", "value": "x"}],
+        [{"op": "replace", "path": "/name"}],
+        [{"op": "test", "path": "/name", "value": "cat"}],
+        [{"op": "test", "path": "/kind", "value": True}],
+        [{"op": "test", "path": "/owner", "value": {"id": True}}],
+        [{"op": "test", "path": "/point", "value": [True, "x"]}],
+        [{"op": "move", "from": "/owner", "path": "/owner/x"}],
+        [{"op": "frobnicate", "path": "/name"}],
+    ],
+)
+def test_apply_patch_invalid(patch):
+    with pytest.raises(PatchError):
+        apply_patch(DOCUMENT, patch)
+
+
+@pytest.mark.parametrize(
+    "path, value",
+    [
+        ("/kind", 1),
+        # numbers are equal if their values are
+        ("/kind", 1.0),
+        ("/owner", {"id": 1.0}),
+        ("/point", [1, "x"]),
+    ],
+)
+def test_apply_patch_test_operation(path, value):
+    patch = [{"op": "test", "path": path, "value": value}]
+
+    patched, _ = apply_patch(DOCUMENT, patch)
+
+    assert patched == DOCUMENT
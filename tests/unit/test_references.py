@@ -0,0 +1,141 @@
+import gc
+
+import pytest
+from referencing import Registry
+from referencing import Resource
+from referencing.exceptions import Unresolvable
+
+from openapi_schema_validator import OAS30Validator
+from openapi_schema_validator import OAS31Validator
+from openapi_schema_validator import OAS32Validator
+from openapi_schema_validator import _references
+from openapi_schema_validator._references import resolve
+
+TREE_SCHEMA = {
+    "$defs": {
+        "Node": {
+            "type": "object",
+            "properties": {
+                "name": {"type": "string"},
+                "children": {
+                    "type": "array",
+                    "items": {"$ref": "#/$defs/Node"},
+                },
+            },
+        },
+    },
+    "$ref": "#/$defs/Node",
+}
+
+
+@pytest.fixture
+def lookups(monkeypatch):
+    calls = []
+    resolver_class = type(OAS31Validator({})._resolver)
+    lookup = resolver_class.lookup
+
+    def counted_lookup(self, ref):
+        calls.append(ref)
+        return lookup(self, ref)
+
+    monkeypatch.setattr(resolver_class, "lookup", counted_lookup)
+    return calls
+
+
+def test_resolve_matches_lookup():
+    resolver = OAS31Validator(TREE_SCHEMA)._resolver
+    resolved = resolver.lookup("#/$defs/Node")
+
+    for _ in range(2):
+        contents, target = resolve(resolver, "#/$defs/Node")
+        assert contents is resolved.contents
+        assert target == resolved.resolver
+
+
+def test_resolve_unresolvable_not_cached(lookups):
+    resolver = OAS31Validator(TREE_SCHEMA)._resolver
+
+    for _ in range(2):
+        with pytest.raises(Unresolvable):
+            resolve(resolver, "#/$defs/Missing")
+    assert lookups == ["#/$defs/Missing"] * 2
+
+
+@pytest.mark.parametrize(
+    "validator_class",
+    [OAS30Validator, OAS31Validator, OAS32Validator],
+)
+def test_validator_reuses_lookups(validator_class, lookups):
+    validator = validator_class(TREE_SCHEMA)
+    tree = {"name": "root", "children": [{"children": [{"name": "leaf"}]}]}
+
+    assert validator.is_valid(tree)
+    assert validator.evolve(schema=TREE_SCHEMA).is_valid(tree)
+    assert not validator.is_valid({"children": [{"name": 1}]})
+    assert sorted(set(lookups)) == lookups
+
+
+def test_registry_references():
+    registry = Registry().with_resource(
+        "urn:name",
+        Resource.from_contents(
+            {
+                "$schema": "https://json-schema.org/draft/2020-12/schema",
+                "type": "string",
+            }
+        ),
+    )
+    validator = OAS32Validator(
+        {"items": {"$ref": "urn:name"}},
+        registry=registry,
+    )
+
+    assert validator.is_valid(["a", "b"])
+    assert not validator.is_valid(["a", 1])
+
+
+def test_dynamic_references():
+    tree = {
+        "$id": "https://example.com/tree",
+        "$dynamicAnchor": "node",
+        "type": "object",
+        "properties": {
+            "data": True,
+            "children": {"type": "array", "items": {"$dynamicRef": "#node"}},
+        },
+    }
+    strict_tree = {
+        "$id": "https://example.com/strict-tree",
+        "$dynamicAnchor": "node",
+        "$ref": "tree",
+        "unevaluatedProperties": False,
+    }
+    validator = OAS31Validator(
+        {
+            "$id": "https://example.com/forest",
+            "$defs": {"tree": tree, "strict-tree": strict_tree},
+            "properties": {
+                "loose": {"$ref": "tree"},
+                "strict": {"$ref": "strict-tree"},
+            },
+        }
+    )
+    valid = {"children": [{"children": [{"data": 1}]}]}
+    invalid = {"children": [{"children": [{"daat": 1}]}]}
+
+    for _ in range(2):
+        assert validator.is_valid({"loose": valid, "strict": valid})
+        assert validator.is_valid({"loose": invalid, "strict": valid})
+        assert not validator.is_valid({"loose": invalid, "strict": invalid})
+
+
+def test_cache_released_with_registry():
+    validator = OAS31Validator(TREE_SCHEMA)
+    validator.is_valid({"children": [{}]})
+    registry_id = id(validator._resolver._registry)
+    assert registry_id in _references._CACHES
+
+    del validator
+    gc.collect()
+
+    assert registry_id not in _references._CACHES
@@ -0,0 +1,262 @@
+import random
+import re
+
+import pytest
+from jsonschema.exceptions import SchemaError
+
+from openapi_schema_validator import OAS30Validator
+from openapi_schema_validator import OAS31Validator
+from openapi_schema_validator._linear_regex import UnsupportedPatternError
+from openapi_schema_validator._linear_regex import linear_search
+from openapi_schema_validator._regex import has_ecma_regex
+from openapi_schema_validator._simple_regex import compile_simple
+from openapi_schema_validator.settings import reset_settings_cache
+
+requires_stdlib_re = pytest.mark.skipif(
+    has_ecma_regex(), reason="safe regex mode guards the stdlib re fallback"
+)
+requires_ecma_regex = pytest.mark.skipif(
+    not has_ecma_regex(), reason="requires optional ecma-regex extra"
+)
+
+SIMPLE_PATTERNS = [
+    r"^[A-Z]{3}$",
+    r"^[a-z0-9-]+$",
+    r"^x-",
+    r"abc",
+    r"ab$",
+    r"^$",
+    r"^\d{4}-\d{2}$",
+    r"^v[0-9]+$",
+    r"^[a-c]{1,3}x$",
+    r"^a*$",
+    r"[0-9]+$",
+    r"^ab[c-d]*",
+    r"^a{2,}b",
+    r"b+a$",
+    r"^[ab]?c$",
+    r"^-?[0-9]+$",
+    r"^[a-z]+[0-9]+$",
+    r"\d{2}x$",
+]
+
+
+def _random_strings(seed, alphabet="abcdxvAZ-0129\n\u0663"):
+    rng = random.Random(seed)
+    for _ in range(500):
+        length = rng.randint(0, 6)
+        yield "".join(rng.choice(alphabet) for _ in range(length))
+
+
+@pytest.fixture
+def safe_regex(monkeypatch):
+    monkeypatch.setenv("OPENAPI_SCHEMA_VALIDATOR_SAFE_REGEX", "true")
+    reset_settings_cache()
+    yield
+    monkeypatch.undo()
+    reset_settings_cache()
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    [
+        r"^(a+)+$",
+        r"(a|ab)*c",
+        r"^[a-z]+$",
+        r"\d{2,4}-\w+",
+        r"^$",
+        r"^a$",
+        r"a.b",
+        r"(?s)a.b",
+        r"(?m)^b$",
+        r"\bab\b",
+        r"\Bb",
+        r"[^a-c]+d",
+        r"(ab|a)(c|bcd)",
+        r"a{2,}b?",
+        r"\Aab\Z",
+        r"[\s\d]+",
+        r"(?:a|b)*?c",
+        r"^(\w+\s?)*$",
+        r"[^\d]",
+        r"^(a|aa)+$",
+        r"^(\d|\d\d)+$",
+        r"^(a|a)*b",
+        r"^(.*a){3}$",
+        r"^(a?){3}a{3}$",
+        r"^[a-z]+(-[a-z]+)*$",
+    ],
+)
+def test_linear_search_matches_re(pattern):
+    rng = random.Random(pattern)
+    for _ in range(200):
+        length = rng.randint(0, 8)
+        instance = "".join(rng.choice("abcd-1 _\n") for _ in range(length))
+
+        assert linear_search(pattern, instance) is (
+            re.search(pattern, instance) is not None
+        )
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    [r"(a)\1", r"(?=a)", r"(?i)a", r"(a+)+(?<=b)"],
+)
+def test_linear_search_unsupported(pattern):
+    with pytest.raises(UnsupportedPatternError):
+        linear_search(pattern, "a")
+
+
+@requires_stdlib_re
+def test_safe_regex_pattern(safe_regex):
+    validator = OAS31Validator({"type": "string", "pattern": "^(a+)+$"})
+
+    assert validator.is_valid("aaa")
+    # would take hours with re
+    assert not validator.is_valid("a" * 100 + "b")
+
+
+@requires_stdlib_re
+@pytest.mark.parametrize(
+    "pattern, instance",
+    [
+        (r"^(a|aa)+$", "a" * 40 + "b"),
+        (r"^(\d|\d\d)+$", "1" * 40 + "x"),
+        (r"^(a|a)*b", "a" * 40),
+        (r"^(.*a){9}$", "a" * 40 + "b"),
+        (r"^(a?){30}a{30}$", "a" * 29),
+    ],
+)
+def test_safe_regex_backtracking_patterns(safe_regex, pattern, instance):
+    schema = {"type": "string", "pattern": pattern}
+    OAS31Validator.check_schema(schema)
+
+    # would take hours with re
+    assert not OAS31Validator(schema).is_valid(instance)
+
+
+@requires_stdlib_re
+@pytest.mark.parametrize(
+    "validator_class,schema",
+    [
+        (
+            OAS30Validator,
+            {
+                "patternProperties": {"^(a+)+$": {}},
+                "additionalProperties": False,
+            },
+        ),
+        (
+            OAS31Validator,
+            {
+                "patternProperties": {"^(a+)+$": {}},
+                "additionalProperties": False,
+            },
+        ),
+        (
+            OAS31Validator,
+            {
+                "patternProperties": {"^(a+)+$": {}},
+                "unevaluatedProperties": False,
+            },
+        ),
+        (OAS31Validator, {"propertyNames": {"pattern": "^(a+)+$"}}),
+    ],
+)
+def test_safe_regex_property_names(safe_regex, validator_class, schema):
+    validator_class.check_schema(schema)
+    validator = validator_class(schema)
+
+    # would take hours with re
+    assert not validator.is_valid({"a" * 40 + "b": 1})
+    assert len(list(validator.iter_errors({"a" * 40 + "b": 1}))) == 1
+
+
+@requires_stdlib_re
+def test_safe_regex_unsupported_property_pattern(safe_regex):
+    schema = {"patternProperties": {r"^(a+)+\1$": {}}}
+
+    with pytest.raises(SchemaError, match="may backtrack catastrophically"):
+        OAS31Validator.check_schema(schema)
+
+    errors = list(OAS31Validator(schema).iter_errors({"a" * 100 + "b": 1}))
+    assert [error.validator for error in errors] == ["patternProperties"]
+    assert "may backtrack catastrophically" in errors[0].message
+
+
+@requires_stdlib_re
+def test_safe_regex_unsupported_pattern(safe_regex):
+    schema = {"type": "string", "pattern": r"^(a+)+\1$"}
+
+    with pytest.raises(SchemaError, match="may backtrack catastrophically"):
+        OAS30Validator.check_schema({"properties": {"name": schema}})
+
+    errors = list(OAS30Validator(schema).iter_errors("a" * 100 + "b"))
+    assert [error.validator for error in errors] == ["pattern"]
+    assert "may backtrack catastrophically" in errors[0].message
+
+
+@requires_stdlib_re
+def test_safe_regex_check_schema_allows_safe_patterns(safe_regex):
+    OAS31Validator.check_schema(
+        {
+            "patternProperties": {"^x-": {"pattern": "^(a+)+$"}},
+            "enum": [{"pattern": r"^(a+)+\1$"}],
+        }
+    )
+
+
+@pytest.mark.parametrize("pattern", SIMPLE_PATTERNS)
+def test_simple_pattern_matches_re(pattern):
+    matcher = compile_simple(pattern, False)
+
+    assert matcher is not None
+    for instance in _random_strings(pattern):
+        assert matcher(instance) is (re.search(pattern, instance) is not None)
+
+
+@requires_ecma_regex
+@pytest.mark.parametrize("pattern", SIMPLE_PATTERNS)
+def test_simple_pattern_matches_regress(pattern):
+    from regress import Regex
+
+    matcher = compile_simple(pattern, True)
+
+    assert matcher is not None
+    for instance in _random_strings(pattern):
+        assert matcher(instance) is (Regex(pattern).find(instance) is not None)
+
+
+def test_simple_pattern_engine_semantics():
+    assert compile_simple(r"^\d+$", False)("\u0663\n")
+    assert not compile_simple(r"^\d+$", True)("\u0663")
+    assert not compile_simple(r"^\d+$", True)("1\n")
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    [
+        r"^[a-z]+[a-c]$",
+        r"^a?b?c$",
+        r"^.*$",
+        r"a|b",
+        r"^(a)$",
+        r"\d+",
+        r"(?i)^a$",
+        r"^[^a]$",
+        r"^a{,2}$",
+    ],
+)
+def test_simple_pattern_general(pattern):
+    assert compile_simple(pattern, False) is None
+
+
+def test_pattern_keyword_simple_pattern():
+    validator = OAS31Validator({"pattern": "^[A-Z]{3}$"})
+
+    assert validator.is_valid("ABC")
+    assert validator.is_valid(1)
+    errors = list(validator.iter_errors("ABCD"))
+    assert [error.message for error in errors] == [
+        "'ABCD' does not match '^[A-Z]{3}$'"
+    ]
@@ -1,5 +1,11 @@
+import asyncio
+import gc
 import inspect
+import json
 import re
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
 from unittest.mock import patch
 
 import pytest
@@ -9,10 +15,22 @@ from referencing import Registry
 from referencing import Resource
 
 from openapi_schema_validator import OAS32Validator
+from openapi_schema_validator import __version__
 from openapi_schema_validator import validate
+from openapi_schema_validator._artefacts import ARTEFACT_FORMAT_VERSION
+from openapi_schema_validator._artefacts import ArtefactError
+from openapi_schema_validator._caches import instance_digest
 from openapi_schema_validator._regex import has_ecma_regex
 from openapi_schema_validator.settings import reset_settings_cache
+from openapi_schema_validator.shortcuts import _VALIDATOR_CACHE
 from openapi_schema_validator.shortcuts import clear_validate_cache
+from openapi_schema_validator.shortcuts import export_validators
+from openapi_schema_validator.shortcuts import import_validators
+from openapi_schema_validator.shortcuts import is_valid
+from openapi_schema_validator.shortcuts import validate_async
+from openapi_schema_validator.shortcuts import validate_cache_stats
+from openapi_schema_validator.shortcuts import validate_json
+from openapi_schema_validator.shortcuts import warm_validate_cache
 from openapi_schema_validator.validators import OAS30ReadValidator
 from openapi_schema_validator.validators import OAS30Validator
 from openapi_schema_validator.validators import OAS30WriteValidator
@@ -383,3 +401,430 @@ def test_enforce_properties_required(
         validate(
             instance, schema, cls=cls, enforce_properties_required=enforce
         )
+
+
+def test_warm_validate_cache_checks_schemas_once(schema):
+    with patch(
+        "openapi_schema_validator.shortcuts.check_openapi_schema"
+    ) as check_schema_mock:
+        warm_validate_cache([schema], cls=OAS32Validator, freeze=False)
+        validate({"email": "foo@bar.com"}, schema, cls=OAS32Validator)
+
+    check_schema_mock.assert_called_once()
+
+
+def test_warm_validate_cache_rejects_invalid_schema():
+    with pytest.raises(SchemaError):
+        warm_validate_cache([{"type": "string", "pattern": "["}], freeze=False)
+
+
+def test_warm_validate_cache_freeze_keeps_cache_order(schema):
+    other_schema = {"type": "string"}
+    try:
+        warm_validate_cache([schema, other_schema], cls=OAS32Validator)
+        keys_before = list(_VALIDATOR_CACHE._cache)
+
+        validate({"email": "foo@bar.com"}, schema, cls=OAS32Validator)
+
+        assert _VALIDATOR_CACHE.frozen
+        assert list(_VALIDATOR_CACHE._cache) == keys_before
+    finally:
+        gc.unfreeze()
+
+
+def test_import_validators_skips_schema_check(schema, tmp_path):
+    path = tmp_path / "validators.bin"
+    export_validators(path, [schema], cls=OAS31Validator)
+    clear_validate_cache()
+
+    with patch(
+        "openapi_schema_validator.shortcuts.check_openapi_schema"
+    ) as check_schema_mock:
+        schemas = import_validators(path)
+        validate({"email": "foo@bar.com"}, schema, cls=OAS31Validator)
+
+    assert schemas == [schema]
+    check_schema_mock.assert_not_called()
+
+
+def test_export_validators_rejects_invalid_schema(tmp_path):
+    with pytest.raises(SchemaError):
+        export_validators(
+            tmp_path / "validators.bin",
+            [{"type": "string", "pattern": "["}],
+        )
+
+
+def test_import_validators_rejects_other_package_version(schema, tmp_path):
+    path = tmp_path / "validators.bin"
+    export_validators(path, [schema])
+
+    with patch("openapi_schema_validator.__version__", "0.0.0"):
+        with pytest.raises(ValueError, match="was built with"):
+            import_validators(path)
+
+
+def test_export_validators_writes_json(schema, tmp_path):
+    path = tmp_path / "validators.json"
+    export_validators(path, [schema], cls=OAS31Validator)
+
+    payload = json.loads(path.read_text())
+    assert payload["entries"] == [["OAS31Validator", schema]]
+
+
+def test_export_validators_rejects_non_json_schema(tmp_path):
+    path = tmp_path / "validators.json"
+
+    with pytest.raises(ValueError, match="not JSON documents"):
+        export_validators(path, [{"enum": [b"bytes"]}])
+    assert not path.exists()
+
+
+@pytest.mark.parametrize(
+    "entries",
+    [
+        None,
+        {"OAS31Validator": {}},
+        [["OAS31Validator"]],
+        [("OAS31Validator", {}, {})],
+        ["OAS31Validator"],
+        [[["OAS31Validator"], {}]],
+        [["OtherValidator", {}]],
+        [["OAS31Validator", []]],
+    ],
+)
+def test_import_validators_rejects_malformed_entries(entries, tmp_path):
+    path = tmp_path / "validators.json"
+    path.write_text(
+        json.dumps(
+            {
+                "format": ARTEFACT_FORMAT_VERSION,
+                "package_version": __version__,
+                "entries": entries,
+            }
+        )
+    )
+
+    with pytest.raises(ArtefactError):
+        import_validators(path)
+
+
+@pytest.mark.parametrize("data", [b"", b"\x80\x04K\x01.", b"[1]", b"{}"])
+def test_import_validators_rejects_other_files(data, tmp_path):
+    path = tmp_path / "validators.json"
+    path.write_bytes(data)
+
+    with pytest.raises(ArtefactError, match="is not a validator artefact"):
+        import_validators(path)
+
+
+@pytest.fixture
+def result_cache_enabled(monkeypatch):
+    monkeypatch.setenv(
+        "OPENAPI_SCHEMA_VALIDATOR_VALIDATION_RESULT_CACHE_MAX_SIZE",
+        "2",
+    )
+    reset_settings_cache()
+
+
+def test_validate_result_cache_disabled_by_default(schema):
+    validate({"email": "foo@bar.com"}, schema)
+    validate({"email": "foo@bar.com"}, schema)
+
+    stats = validate_cache_stats()["results"]
+    assert stats.hits == 0
+    assert stats.size == 0
+
+
+def test_validate_result_cache_reuses_verdicts(schema, result_cache_enabled):
+    instance = {"email": 1}
+
+    for _ in range(2):
+        validate({"email": "foo@bar.com"}, schema)
+        with pytest.raises(ValidationError, match="is not of type"):
+            validate(instance, schema)
+
+    stats = validate_cache_stats()
+    assert stats["results"].hits == 2
+    assert stats["results"].misses == 2
+    assert stats["validators"].misses == 1
+
+
+def test_validate_result_cache_raises_fresh_errors(result_cache_enabled):
+    schema = {"anyOf": [{"type": "integer"}, {"type": "string"}]}
+    raised = []
+
+    for _ in range(3):
+        with pytest.raises(ValidationError) as exc_info:
+            validate([1], schema)
+        error = exc_info.value
+        raised.append(error)
+        assert list(error.path) == []
+        assert len(error.context) == 2
+        assert all(child.parent is error for child in error.context)
+        assert len(traceback.extract_tb(error.__traceback__)) < 10
+        # callers changing an error do not change the cached verdict
+        error.path.appendleft("changed")
+        error.context.clear()
+
+    assert len({id(error) for error in raised}) == 3
+    assert validate_cache_stats()["results"].hits == 2
+
+
+def test_validate_result_cache_binds_errors_to_instance(
+    result_cache_enabled,
+):
+    schema = {
+        "properties": {
+            "a": {"anyOf": [{"type": "integer"}, {"type": "string"}]},
+        },
+    }
+
+    for _ in range(2):
+        instance = {"a": [1]}
+        with pytest.raises(ValidationError) as exc_info:
+            validate(instance, schema)
+        error = exc_info.value
+        assert error.instance is instance["a"]
+        assert all(child.instance is instance["a"] for child in error.context)
+
+    assert validate_cache_stats()["results"].hits == 1
+
+
+@pytest.mark.parametrize(
+    "instance",
+    [
+        "x" * 100_000,
+        {"a": list(range(10_000))},
+        [[[{"b": None, "c": b"d"}]]],
+    ],
+)
+def test_instance_digest_size_is_bounded(instance):
+    assert len(instance_digest(instance)) == 32
+
+
+@pytest.mark.parametrize(
+    "first, second",
+    [
+        (1, 1.0),
+        (1, True),
+        ([1], (1,)),
+        ("ab", b"ab"),
+        (["a", "b"], ["a:b"]),
+        (None, "N"),
+        ([], ("l", ())),
+        ({"a": 1, "b": 2}, {"b": 2, "a": 1}),
+    ],
+)
+def test_instance_digest_of_distinct_instances(first, second):
+    assert (instance_digest(first) == instance_digest(second)) is (
+        first == second and type(first) is type(second)
+    )
+
+
+@pytest.mark.parametrize("instance", [{1: "a"}, [object()], {"a": {1.5}}])
+def test_instance_digest_not_keyed(instance):
+    assert instance_digest(instance) is None
+
+
+def test_validate_result_cache_distinguishes_scalar_types(
+    result_cache_enabled,
+):
+    schema = {"type": "integer"}
+
+    validate(1, schema)
+    with pytest.raises(ValidationError):
+        validate(True, schema)
+    with pytest.raises(ValidationError):
+        validate(1.0, schema, cls=OAS30Validator)
+
+
+def test_validate_result_cache_ttl(schema, result_cache_enabled, monkeypatch):
+    monkeypatch.setenv(
+        "OPENAPI_SCHEMA_VALIDATOR_VALIDATION_RESULT_CACHE_TTL",
+        "60",
+    )
+    reset_settings_cache()
+
+    with patch("openapi_schema_validator._caches.monotonic") as monotonic:
+        monotonic.return_value = 0.0
+        validate({"email": "foo@bar.com"}, schema)
+        monotonic.return_value = 61.0
+        validate({"email": "foo@bar.com"}, schema)
+
+    stats = validate_cache_stats()["results"]
+    assert stats.hits == 0
+    assert stats.misses == 2
+
+
+@pytest.mark.parametrize(
+    "instance, cls, valid",
+    [
+        ({"email": "foo@bar.com"}, OAS32Validator, True),
+        ({"email": 1}, OAS32Validator, False),
+        ({"email": None}, OAS30Validator, False),
+        ({"enabled": False}, OAS31Validator, True),
+    ],
+)
+def test_is_valid_matches_validate(schema, instance, cls, valid):
+    assert is_valid(instance, schema, cls=cls) is valid
+    assert validate_cache_stats()["validators"].misses == 1
+
+    if valid:
+        validate(instance, schema, cls=cls)
+    else:
+        with pytest.raises(ValidationError):
+            validate(instance, schema, cls=cls)
+    assert validate_cache_stats()["validators"].hits == 1
+
+
+def test_is_valid_checks_schema():
+    with pytest.raises(SchemaError):
+        is_valid({}, {"type": 1})
+
+
+def test_is_valid_reuses_validate_verdicts(schema, result_cache_enabled):
+    with pytest.raises(ValidationError):
+        validate({"email": 1}, schema)
+
+    with patch.object(OAS32Validator, "is_valid") as validator_is_valid:
+        assert not is_valid({"email": 1}, schema)
+
+    validator_is_valid.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        b'{"email": "foo@bar.com"}',
+        bytearray(b'{"email": "foo@bar.com"}'),
+        memoryview(b' {"email": "foo@bar.com"}'),
+        '{"email": "foo@bar.com"}',
+    ],
+)
+def test_validate_json_returns_decoded_instance(schema, data):
+    result = validate_json(data, schema)
+
+    assert result == {"email": "foo@bar.com"}
+
+
+@pytest.mark.parametrize(
+    "data, schema",
+    [
+        (b'\n [{"email": "foo@bar.com"}]', {"type": "object"}),
+        (b'"abc"', {"type": "integer"}),
+        (b"null", {"enum": [1], "type": "integer"}),
+        (b"[1]", {"allOf": [{"type": "object"}], "minProperties": 1}),
+    ],
+)
+def test_validate_json_root_type_error_matches_validate(
+    data, schema, result_cache_enabled
+):
+    with pytest.raises(ValidationError) as expected:
+        validate(json.loads(data), schema)
+
+    with patch(
+        "openapi_schema_validator.shortcuts.instance_digest"
+    ) as instance_digest:
+        with pytest.raises(ValidationError) as exc_info:
+            validate_json(data, schema)
+
+    error = exc_info.value
+    assert error.message == expected.value.message
+    assert error.instance == expected.value.instance
+    assert error.validator == expected.value.validator
+    assert error.schema_path == expected.value.schema_path
+    if "type" in schema:
+        instance_digest.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "data, schema",
+    [
+        (b'{"email": "foo@bar.com"}', {"type": "object"}),
+        (b"[]", {"type": "object"}),
+    ],
+)
+def test_validate_json_validates_once(data, schema):
+    iter_errors = OAS32Validator.iter_errors
+    with patch.object(
+        OAS32Validator, "iter_errors", autospec=True, side_effect=iter_errors
+    ) as mocked:
+        try:
+            validate_json(data, schema)
+        except ValidationError:
+            pass
+
+    assert mocked.call_count == 1
+
+
+@pytest.mark.parametrize(
+    "data, schema, cls, valid",
+    [
+        (b"null", {"type": "string", "nullable": True}, OAS30Validator, True),
+        (b"null", {"type": "string"}, OAS30Validator, False),
+        (b"null", {"type": ["string", "null"]}, OAS31Validator, True),
+        (b"1.5", {"type": "integer"}, OAS32Validator, False),
+    ],
+)
+def test_validate_json_matches_validate(data, schema, cls, valid):
+    if valid:
+        validate_json(data, schema, cls=cls)
+    else:
+        with pytest.raises(ValidationError):
+            validate_json(data, schema, cls=cls)
+
+
+@pytest.mark.parametrize(
+    "data, schema",
+    [
+        (b'{"email": ', {"type": "object"}),
+        (b'"abc', {"type": "integer"}),
+        (b"[1, 2", {"type": "object"}),
+        (b"nul", {"type": "string"}),
+    ],
+)
+def test_validate_json_invalid_document(data, schema):
+    with pytest.raises(json.JSONDecodeError):
+        validate_json(data, schema)
+
+
+def test_validate_async_small_instance_inline(schema):
+    executor = Mock()
+
+    asyncio.run(
+        validate_async({"email": "foo@bar.com"}, schema, executor=executor)
+    )
+
+    executor.submit.assert_not_called()
+
+
+def test_validate_async_offloads_large_instance(schema):
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        with patch.object(executor, "submit", wraps=executor.submit) as submit:
+            with pytest.raises(ValidationError, match="is not of type"):
+                asyncio.run(
+                    validate_async(
+                        {"email": 1},
+                        schema,
+                        executor=executor,
+                        offload_threshold=1,
+                    )
+                )
+
+    submit.assert_called_once()
+
+
+def test_validate_async_offload_threshold_from_env(schema, monkeypatch):
+    monkeypatch.setenv(
+        "OPENAPI_SCHEMA_VALIDATOR_ASYNC_OFFLOAD_NODE_THRESHOLD",
+        "0",
+    )
+    reset_settings_cache()
+    executor = ThreadPoolExecutor(max_workers=1)
+
+    with patch.object(executor, "submit", wraps=executor.submit) as submit:
+        asyncio.run(validate_async("foo@bar.com", {}, executor=executor))
+    executor.shutdown()
+
+    submit.assert_called_once()
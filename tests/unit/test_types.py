@@ -0,0 +1,74 @@
+from array import array
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Mapping
+
+import pytest
+from jsonschema.exceptions import UnknownType
+from jsonschema.validators import extend
+
+from openapi_schema_validator import OAS30StrictValidator
+from openapi_schema_validator import OAS30Validator
+from openapi_schema_validator import OAS31Validator
+from openapi_schema_validator import OAS32Validator
+from openapi_schema_validator._types import dispatch_types
+from openapi_schema_validator._types import oas31_type_checker
+
+INSTANCES = [
+    {},
+    OrderedDict(),
+    [],
+    (),
+    "",
+    0,
+    1,
+    1.0,
+    1.5,
+    True,
+    None,
+    array("d", [1.0]),
+    memoryview(b"ab"),
+]
+
+
+@pytest.mark.parametrize(
+    "validator_class",
+    [OAS30Validator, OAS30StrictValidator, OAS31Validator, OAS32Validator],
+)
+def test_is_type_matches_type_checker(validator_class):
+    validator = validator_class({})
+    type_checker = validator_class.TYPE_CHECKER
+
+    for name in ["array", "boolean", "integer", "number", "object", "string"]:
+        for instance in INSTANCES:
+            assert validator.is_type(instance, name) is type_checker.is_type(
+                instance, name
+            ), (name, instance)
+
+
+def test_is_type_unknown_type():
+    validator = OAS30Validator({})
+
+    with pytest.raises(UnknownType):
+        validator.is_type(None, "null")
+    with pytest.raises(UnknownType):
+        validator.is_type({}, "mapping")
+
+
+def test_is_type_custom_type_checker():
+    validator_class = extend(
+        OAS31Validator,
+        type_checker=oas31_type_checker.redefine(
+            "object",
+            lambda checker, instance: isinstance(instance, Mapping),
+        ),
+    )
+    dispatch_types(validator_class)
+    validator = validator_class({"type": "object", "minProperties": 1})
+
+    assert validator.is_type(MappingProxyType({}), "object")
+    assert validator.is_type({}, "object")
+    assert not validator.is_type([], "object")
+    assert validator.is_type("", "string")
+    assert validator.is_valid(MappingProxyType({"a": 1}))
+    assert not validator.is_valid(MappingProxyType({}))
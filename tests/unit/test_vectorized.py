@@ -0,0 +1,152 @@
+from array import array
+from unittest.mock import patch
+
+import pytest
+
+from openapi_schema_validator import OAS30StrictValidator
+from openapi_schema_validator import OAS30Validator
+from openapi_schema_validator import OAS31Validator
+from openapi_schema_validator import _vectorized
+from openapi_schema_validator import oas30_format_checker
+from openapi_schema_validator import oas31_format_checker
+
+
+def _errors(validator, instance):
+    return [
+        (error.message, list(error.absolute_path), list(error.schema_path))
+        for error in validator.iter_errors(instance)
+    ]
+
+
+def _itemwise_errors(validator, instance):
+    with patch.object(_vectorized, "MIN_VECTORIZED_LENGTH", float("inf")):
+        return _errors(validator, instance)
+
+
+@pytest.fixture(params=["numpy", "builtins"])
+def numpy_mode(request):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+        yield
+    else:
+        with patch.object(_vectorized, "_np", None):
+            yield
+
+
+ITEMS_SCHEMAS = [
+    {"type": "number", "minimum": 0, "maximum": 100},
+    {"type": "number", "minimum": 0, "exclusiveMinimum": True},
+    {"type": "number", "maximum": 10.5, "exclusiveMaximum": True},
+    {"type": "number", "multipleOf": 0.5},
+    {"type": "integer", "multipleOf": 3},
+    {"type": "integer", "format": "int32", "description": "counter"},
+    {"type": "number", "format": "double", "minimum": -1},
+]
+
+INSTANCES = [
+    list(range(40)),
+    [float(i) / 2 for i in range(-5, 40)],
+    [i * 3 for i in range(20)] + [1 << 40, -(1 << 31), 7],
+    [0.5] * 20 + [1, 2.25, 150, -3],
+    [1] * 20 + [True, None, "x"],
+]
+
+
+@pytest.mark.parametrize("items", ITEMS_SCHEMAS)
+@pytest.mark.parametrize("instance", INSTANCES)
+@pytest.mark.parametrize("cls", [OAS30Validator, OAS30StrictValidator])
+def test_numeric_items_match_itemwise_errors(numpy_mode, cls, items, instance):
+    validator = cls(
+        {"type": "array", "items": items},
+        format_checker=oas30_format_checker,
+    )
+
+    assert _errors(validator, instance) == _itemwise_errors(
+        validator, instance
+    )
+
+
+@pytest.mark.parametrize(
+    "items",
+    [
+        {"type": "number", "minimum": 0, "maximum": 100},
+        {"type": "number", "exclusiveMinimum": 0, "minimum": 1},
+        {"type": "number", "maximum": 10.5, "exclusiveMaximum": 10},
+        {"type": "integer", "multipleOf": 3, "format": "int32"},
+    ],
+)
+@pytest.mark.parametrize("instance", INSTANCES)
+def test_oas31_numeric_items_match_itemwise_errors(
+    numpy_mode, items, instance
+):
+    validator = OAS31Validator(
+        {"type": "array", "items": items},
+        format_checker=oas31_format_checker,
+    )
+
+    assert _errors(validator, instance) == _itemwise_errors(
+        validator, instance
+    )
+
+
+def test_oas31_prefix_items_not_vectorized():
+    items = {"type": "number", "maximum": 10}
+    validator = OAS31Validator(
+        {"prefixItems": [{"type": "string"}], "items": items}
+    )
+    instance = ["a"] + [1.0] * 50 + [11.0]
+
+    assert [list(error.path) for error in validator.iter_errors(instance)] == [
+        [51]
+    ]
+
+
+def test_numeric_items_skip_valid_items(numpy_mode):
+    items = {"type": "number", "maximum": 10}
+    validator = OAS30Validator({"type": "array", "items": items})
+    instance = [1.0] * 50 + [11.0]
+
+    failures = _vectorized.numeric_items_failures(validator, items, instance)
+
+    assert failures == [50]
+
+
+def test_numeric_items_ignore_nan(numpy_mode):
+    validator = OAS30Validator(
+        {"type": "array", "items": {"type": "number", "minimum": 0}}
+    )
+    instance = [float("nan")] + [1.0] * 20 + [-1.0]
+
+    assert _errors(validator, instance) == _itemwise_errors(
+        validator, instance
+    )
+
+
+@pytest.mark.parametrize(
+    "instance",
+    [
+        array("d", [1.0]),
+        memoryview(array("q", range(40))),
+        array("u", "abc"),
+        memoryview(b"ab").cast("c"),
+    ],
+)
+def test_buffer_is_not_array(instance):
+    validator = OAS30Validator({"type": "array"})
+
+    assert not validator.is_valid(instance)
+    assert not validator.is_type(instance, "array")
+
+
+@pytest.mark.parametrize(
+    "instance",
+    [
+        array("d", [-1.0] * 40),
+        memoryview(array("q", [-1] * 40)),
+    ],
+)
+def test_buffer_items_not_checked(instance):
+    validator = OAS30Validator({"items": {"type": "number", "minimum": 0}})
+
+    assert validator.is_valid(instance)
+    assert not validator.is_valid(instance.tolist())